@@ -0,0 +1,85 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Callable
+
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.LabeledData import LabeledData
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import MONGO_THREADS
+from domain.ParagraphExtractionData import ParagraphExtractionData
+from ports.AsyncPersistenceRepository import AsyncPersistenceRepository
+
+
+class AsyncMongoPersistenceRepository(AsyncPersistenceRepository):
+
+    def __init__(self):
+        self.persistence_repository = MongoPersistenceRepository()
+        self.executor = ThreadPoolExecutor(max_workers=MONGO_THREADS, thread_name_prefix="mongo")
+
+    async def run(self, method: Callable, *args):
+        return await asyncio.get_running_loop().run_in_executor(self.executor, method, *args)
+
+    async def close(self):
+        await asyncio.get_running_loop().run_in_executor(None, self.executor.shutdown)
+        self.persistence_repository.close()
+
+    async def save_prediction_data(self, extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData):
+        await self.run(self.persistence_repository.save_prediction_data, extraction_identifier, prediction_data)
+
+    async def save_prediction_data_list(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+    ):
+        await self.run(self.persistence_repository.save_prediction_data_list, extraction_identifier, prediction_data_list)
+
+    async def save_labeled_data(self, extraction_identifier: ExtractionIdentifier, labeled_data: LabeledData):
+        await self.run(self.persistence_repository.save_labeled_data, extraction_identifier, labeled_data)
+
+    async def save_labeled_data_list(
+        self, extraction_identifier: ExtractionIdentifier, labeled_data_list: list[LabeledData]
+    ):
+        await self.run(self.persistence_repository.save_labeled_data_list, extraction_identifier, labeled_data_list)
+
+    async def load_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
+        return await self.run(self.persistence_repository.load_suggestions, extraction_identifier)
+
+    async def load_suggestions_page(
+        self, extraction_identifier: ExtractionIdentifier, after_suggestion_id: Optional[str], page_size: int
+    ) -> list[tuple[str, Suggestion]]:
+        return await self.run(
+            self.persistence_repository.load_suggestions_page, extraction_identifier, after_suggestion_id, page_size
+        )
+
+    async def delete_suggestions_until(self, extraction_identifier: ExtractionIdentifier, suggestion_id: str):
+        await self.run(self.persistence_repository.delete_suggestions_until, extraction_identifier, suggestion_id)
+
+    async def save_paragraph_extraction_data(
+        self, extraction_identifier: ExtractionIdentifier, paragraph_extraction_data: ParagraphExtractionData
+    ):
+        await self.run(
+            self.persistence_repository.save_paragraph_extraction_data, extraction_identifier, paragraph_extraction_data
+        )
+
+    async def save_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: list[ParagraphsFromLanguage]
+    ):
+        await self.run(
+            self.persistence_repository.save_paragraphs_from_languages, extraction_identifier, paragraphs_from_languages
+        )
+
+    async def load_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier
+    ) -> list[ParagraphsFromLanguage]:
+        return await self.run(self.persistence_repository.load_paragraphs_from_languages, extraction_identifier)
+
+    async def delete_paragraphs_from_languages(self, extraction_identifier: ExtractionIdentifier):
+        await self.run(self.persistence_repository.delete_paragraphs_from_languages, extraction_identifier)
+
+    async def save_extractor_usage(self, extraction_identifier: ExtractionIdentifier):
+        await self.run(self.persistence_repository.save_extractor_usage, extraction_identifier)
+
+    async def save_extractor_deletion(self, extraction_identifier: ExtractionIdentifier):
+        await self.run(self.persistence_repository.save_extractor_deletion, extraction_identifier)
@@ -1,19 +1,49 @@
-from typing import Optional
+from time import time
+from typing import Optional, TypeVar, Iterable
 
 import pymongo
+from bson import ObjectId
+from pymongo import DeleteMany
+from pymongo.cursor import Cursor
+from pymongo.errors import BulkWriteError
 from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
 from pydantic import BaseModel
+from trainable_entity_extractor.config import config_logger
 from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.data.LabeledData import LabeledData
 from trainable_entity_extractor.data.PredictionData import PredictionData
 from trainable_entity_extractor.data.Suggestion import Suggestion
 
-from config import MONGO_HOST, MONGO_PORT
+from adapters.paused_garbage_collection import paused_garbage_collection
+from config import MONGO_HOST, MONGO_PORT, MONGO_WRITE_BATCH_SIZE, MONGO_READ_BATCH_SIZE
+from domain.ExtractorUsage import ExtractorUsage
 from domain.ParagraphExtractionData import ParagraphExtractionData
 from ports.PersistenceRepository import PersistenceRepository
 
 
+Model = TypeVar("Model", bound=BaseModel)
+
+EXTRACTOR_INDEX = [("run_name", pymongo.ASCENDING), ("extraction_name", pymongo.ASCENDING)]
+EXTRACTOR_ID_INDEX = EXTRACTOR_INDEX + [("_id", pymongo.ASCENDING)]
+EXTRACTOR_FILE_INDEX = EXTRACTOR_INDEX + [("xml_file_name", pymongo.ASCENDING), ("entity_name", pymongo.ASCENDING)]
+
+
 class MongoPersistenceRepository(PersistenceRepository):
+    INDEXES = {
+        "prediction_data": [EXTRACTOR_ID_INDEX, EXTRACTOR_FILE_INDEX],
+        "labeled_data": [EXTRACTOR_INDEX],
+        "suggestions": [EXTRACTOR_ID_INDEX],
+        "paragraph_extraction_data": [EXTRACTOR_INDEX],
+        "paragraphs_from_languages": [EXTRACTOR_INDEX],
+        "extractors_usage": [EXTRACTOR_INDEX, [("last_used", pymongo.ASCENDING)], [("deleted_before", pymongo.ASCENDING)]],
+    }
+    EXTRACTOR_DATA_COLLECTIONS = [
+        "prediction_data",
+        "labeled_data",
+        "suggestions",
+        "paragraph_extraction_data",
+        "paragraphs_from_languages",
+    ]
 
     def __init__(self):
         self.mongodb_client = pymongo.MongoClient(f"{MONGO_HOST}:{MONGO_PORT}")
@@ -22,6 +52,32 @@ class MongoPersistenceRepository(PersistenceRepository):
     def close(self):
         self.mongodb_client.close()
 
+    @staticmethod
+    def get_index_name(index: list[tuple[str, int]]) -> str:
+        return "_".join(f"{field}_{direction}" for field, direction in index)
+
+    def create_indexes(self) -> list[str]:
+        for collection_name, indexes in self.INDEXES.items():
+            for index in indexes:
+                self.mongo_db[collection_name].create_index(index, name=self.get_index_name(index))
+
+        missing_indexes = self.get_missing_indexes()
+        if missing_indexes:
+            config_logger.error(f"Missing mongo indexes: {', '.join(missing_indexes)}")
+
+        return missing_indexes
+
+    def get_missing_indexes(self) -> list[str]:
+        missing_indexes = list()
+        for collection_name, indexes in self.INDEXES.items():
+            index_information = self.mongo_db[collection_name].index_information()
+            existing_indexes = [[tuple(key) for key in information["key"]] for information in index_information.values()]
+            for index in indexes:
+                if index not in existing_indexes:
+                    missing_indexes.append(f"{collection_name}.{self.get_index_name(index)}")
+
+        return missing_indexes
+
     @staticmethod
     def get_filter(extraction_identifier: ExtractionIdentifier):
         return {
@@ -35,42 +91,146 @@ class MongoPersistenceRepository(PersistenceRepository):
         data["extraction_name"] = extraction_identifier.extraction_name
         return data
 
+    @staticmethod
+    def get_projection(model_class: type[BaseModel], with_id: bool = False) -> dict[str, bool]:
+        return {"_id": with_id, **{field_name: True for field_name in model_class.model_fields}}
+
+    def find_models(
+        self, collection_name: str, query_filter: dict, model_class: type[BaseModel], with_id: bool = False
+    ) -> Cursor:
+        projection = self.get_projection(model_class, with_id)
+        return self.mongo_db[collection_name].find(query_filter, projection).batch_size(MONGO_READ_BATCH_SIZE)
+
+    @staticmethod
+    def build_models(model_class: type[Model], documents: Iterable[dict]) -> list[Model]:
+        documents = list(documents)
+        with paused_garbage_collection():
+            return [model_class(**document) for document in documents]
+
+    @staticmethod
+    def build_models_with_ids(model_class: type[Model], documents: Iterable[dict]) -> list[tuple[str, Model]]:
+        documents = list(documents)
+        with paused_garbage_collection():
+            return [(str(document["_id"]), model_class(**document)) for document in documents]
+
     def save_data(self, extraction_identifier: ExtractionIdentifier, data: BaseModel, collection_name: str):
         data_dict = data.model_dump()
         data_dict = self.inject_extractor_identifier(extraction_identifier, data_dict)
         self.mongo_db[collection_name].insert_one(data_dict)
 
+    def save_data_list(self, extraction_identifier: ExtractionIdentifier, data_list: list[BaseModel], collection_name: str):
+        if not data_list:
+            return
+        inserted_count = 0
+        write_errors = list()
+        for batch_start in range(0, len(data_list), MONGO_WRITE_BATCH_SIZE):
+            data_dicts = [
+                self.inject_extractor_identifier(extraction_identifier, data.model_dump())
+                for data in data_list[batch_start : batch_start + MONGO_WRITE_BATCH_SIZE]
+            ]
+            try:
+                inserted_count += len(self.mongo_db[collection_name].insert_many(data_dicts, ordered=False).inserted_ids)
+            except BulkWriteError as bulk_write_error:
+                inserted_count += bulk_write_error.details.get("nInserted", 0)
+                batch_write_errors = bulk_write_error.details.get("writeErrors", list())
+                write_errors += [{**error, "index": batch_start + error["index"]} for error in batch_write_errors]
+
+        if write_errors:
+            raise BulkWriteError({"writeErrors": write_errors, "nInserted": inserted_count})
+
     def save_prediction_data(self, extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData):
         self.save_data(extraction_identifier, prediction_data, "prediction_data")
 
-    def load_prediction_data(self, extraction_identifier: ExtractionIdentifier) -> list[PredictionData]:
-        data = self.mongo_db.prediction_data.find(self.get_filter(extraction_identifier))
-        return [PredictionData(**document) for document in data]
+    def save_prediction_data_list(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+    ):
+        self.save_data_list(extraction_identifier, prediction_data_list, "prediction_data")
+
+    def load_prediction_data(
+        self, extraction_identifier: ExtractionIdentifier, until_prediction_data_id: Optional[str] = None
+    ) -> list[PredictionData]:
+        prediction_data_filter = self.get_filter(extraction_identifier)
+        if until_prediction_data_id:
+            prediction_data_filter["_id"] = {"$lte": ObjectId(until_prediction_data_id)}
+
+        data = self.find_models("prediction_data", prediction_data_filter, PredictionData).sort("_id", pymongo.ASCENDING)
+        return self.build_models(PredictionData, data)
+
+    def load_prediction_data_page(
+        self,
+        extraction_identifier: ExtractionIdentifier,
+        after_prediction_data_id: Optional[str],
+        until_prediction_data_id: str,
+        page_size: int,
+    ) -> list[tuple[str, PredictionData]]:
+        id_filter = {"$lte": ObjectId(until_prediction_data_id)}
+        if after_prediction_data_id:
+            id_filter["$gt"] = ObjectId(after_prediction_data_id)
+
+        page_filter = {**self.get_filter(extraction_identifier), "_id": id_filter}
+        documents = self.find_models("prediction_data", page_filter, PredictionData, with_id=True)
+        documents = documents.sort("_id", pymongo.ASCENDING).limit(page_size)
+        return self.build_models_with_ids(PredictionData, documents)
+
+    def count_prediction_data(self, extraction_identifier: ExtractionIdentifier, until_prediction_data_id: str) -> int:
+        count_filter = {**self.get_filter(extraction_identifier), "_id": {"$lte": ObjectId(until_prediction_data_id)}}
+        return self.mongo_db.prediction_data.count_documents(count_filter)
+
+    def load_prediction_data_watermark(self, extraction_identifier: ExtractionIdentifier) -> Optional[str]:
+        prediction_data_filter = self.get_filter(extraction_identifier)
+        document = self.mongo_db.prediction_data.find_one(
+            prediction_data_filter, {"_id": 1}, sort=[("_id", pymongo.DESCENDING)]
+        )
+        return str(document["_id"]) if document else None
+
+    def delete_prediction_data_ids(self, extraction_identifier: ExtractionIdentifier, prediction_data_ids: list[str]):
+        delete_operations = list()
+        for batch_start in range(0, len(prediction_data_ids), MONGO_WRITE_BATCH_SIZE):
+            batch = [ObjectId(x) for x in prediction_data_ids[batch_start : batch_start + MONGO_WRITE_BATCH_SIZE]]
+            delete_operations.append(DeleteMany({**self.get_filter(extraction_identifier), "_id": {"$in": batch}}))
+
+        if delete_operations:
+            self.mongo_db.prediction_data.bulk_write(delete_operations, ordered=False)
 
     def save_labeled_data(self, extraction_identifier: ExtractionIdentifier, labeled_data: LabeledData):
         self.save_data(extraction_identifier, labeled_data, "labeled_data")
 
+    def save_labeled_data_list(self, extraction_identifier: ExtractionIdentifier, labeled_data_list: list[LabeledData]):
+        self.save_data_list(extraction_identifier, labeled_data_list, "labeled_data")
+
     def delete_labeled_data(self, extraction_identifier: ExtractionIdentifier):
         self.mongo_db.labeled_data.delete_many(self.get_filter(extraction_identifier))
 
     def load_labeled_data(self, extraction_identifier: ExtractionIdentifier) -> list[LabeledData]:
-        data = self.mongo_db.labeled_data.find(self.get_filter(extraction_identifier))
-        return [LabeledData(**document) for document in data]
+        data = self.find_models("labeled_data", self.get_filter(extraction_identifier), LabeledData)
+        return self.build_models(LabeledData, data)
 
     def save_suggestions(self, extraction_identifier: ExtractionIdentifier, suggestions: list[Suggestion]):
-        for suggestion in suggestions:
-            self.save_data(extraction_identifier, suggestion, "suggestions")
+        self.save_data_list(extraction_identifier, suggestions, "suggestions")
 
     def load_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
-        suggestions: list[Suggestion] = list()
-
-        for document in self.mongo_db.suggestions.find(self.get_filter(extraction_identifier)):
-            suggestions.append(Suggestion(**document))
+        data = self.find_models("suggestions", self.get_filter(extraction_identifier), Suggestion)
+        suggestions = self.build_models(Suggestion, data)
 
         self.mongo_db.suggestions.delete_many(self.get_filter(extraction_identifier))
 
         return suggestions
 
+    def load_suggestions_page(
+        self, extraction_identifier: ExtractionIdentifier, after_suggestion_id: Optional[str], page_size: int
+    ) -> list[tuple[str, Suggestion]]:
+        page_filter = self.get_filter(extraction_identifier)
+        if after_suggestion_id:
+            page_filter["_id"] = {"$gt": ObjectId(after_suggestion_id)}
+
+        documents = self.find_models("suggestions", page_filter, Suggestion, with_id=True)
+        documents = documents.sort("_id", pymongo.ASCENDING).limit(page_size)
+        return self.build_models_with_ids(Suggestion, documents)
+
+    def delete_suggestions_until(self, extraction_identifier: ExtractionIdentifier, suggestion_id: str):
+        suggestions_filter = {**self.get_filter(extraction_identifier), "_id": {"$lte": ObjectId(suggestion_id)}}
+        self.mongo_db.suggestions.delete_many(suggestions_filter)
+
     def save_paragraph_extraction_data(
         self, extraction_identifier: ExtractionIdentifier, paragraph_extraction_data: ParagraphExtractionData
     ):
@@ -79,23 +239,63 @@ class MongoPersistenceRepository(PersistenceRepository):
     def load_paragraph_extraction_data(
         self, extraction_identifier: ExtractionIdentifier
     ) -> Optional[ParagraphExtractionData]:
-        data = self.mongo_db.paragraph_extraction_data.find_one(self.get_filter(extraction_identifier))
+        data = self.mongo_db.paragraph_extraction_data.find_one(
+            self.get_filter(extraction_identifier), self.get_projection(ParagraphExtractionData)
+        )
         if data is None:
             return None
         return ParagraphExtractionData(**data)
 
-    def save_paragraphs_from_language(
-        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: ParagraphsFromLanguage
+    def save_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: list[ParagraphsFromLanguage]
     ):
-        self.save_data(extraction_identifier, paragraphs_from_languages, "paragraphs_from_languages")
+        self.save_data_list(extraction_identifier, paragraphs_from_languages, "paragraphs_from_languages")
 
     def load_paragraphs_from_languages(self, extraction_identifier: ExtractionIdentifier) -> list[ParagraphsFromLanguage]:
-        data = self.mongo_db.paragraphs_from_languages.find(self.get_filter(extraction_identifier))
-        return [ParagraphsFromLanguage(**document) for document in data]
+        data = self.find_models("paragraphs_from_languages", self.get_filter(extraction_identifier), ParagraphsFromLanguage)
+        return self.build_models(ParagraphsFromLanguage, data)
 
     def delete_paragraphs_from_languages(self, extraction_identifier: ExtractionIdentifier):
         self.mongo_db.paragraphs_from_languages.delete_many(self.get_filter(extraction_identifier))
 
-    def delete_prediction_data(self, extraction_identifier: ExtractionIdentifier, filters: list[dict[str, str]]):
-        for one_filter in filters:
-            self.mongo_db.suggestions.delete_many({**self.get_filter(extraction_identifier), **one_filter})
+    def save_extractor_usage(self, extraction_identifier: ExtractionIdentifier, last_used: Optional[float] = None):
+        self.mongo_db.extractors_usage.update_one(
+            self.get_filter(extraction_identifier), {"$max": {"last_used": last_used or time()}}, upsert=True
+        )
+
+    def save_extractor_deletion(self, extraction_identifier: ExtractionIdentifier):
+        self.mongo_db.extractors_usage.update_one(
+            self.get_filter(extraction_identifier), {"$set": {"deleted_before": ObjectId()}}, upsert=True
+        )
+
+    def has_extractors_usage(self) -> bool:
+        return 0 < self.mongo_db.extractors_usage.estimated_document_count()
+
+    def load_extractors_usage_to_remove(self, expiration_time: float, limit: int) -> list[ExtractorUsage]:
+        query_filter = {"$or": [{"deleted_before": {"$exists": True}}, {"last_used": {"$lt": expiration_time}}]}
+        extractors_usage = list()
+        for document in self.mongo_db.extractors_usage.find(query_filter, {"_id": False}).limit(limit):
+            deleted_before = str(document["deleted_before"]) if document.get("deleted_before") else None
+            extractors_usage.append(ExtractorUsage(**{**document, "deleted_before": deleted_before}))
+        return extractors_usage
+
+    def delete_extractor_data(self, extraction_identifier: ExtractionIdentifier, until_id: Optional[str] = None):
+        query_filter = self.get_filter(extraction_identifier)
+        if until_id:
+            query_filter["_id"] = {"$lte": ObjectId(until_id)}
+
+        for collection_name in self.EXTRACTOR_DATA_COLLECTIONS:
+            self.mongo_db[collection_name].delete_many(query_filter)
+
+    def delete_extractor_usage(
+        self, extraction_identifier: ExtractionIdentifier, deleted_before: Optional[str], expiration_time: float
+    ):
+        usage_filter = self.get_filter(extraction_identifier)
+        if deleted_before:
+            self.mongo_db.extractors_usage.update_one(
+                {**usage_filter, "deleted_before": ObjectId(deleted_before)}, {"$unset": {"deleted_before": ""}}
+            )
+
+        self.mongo_db.extractors_usage.delete_one(
+            {**usage_filter, "deleted_before": {"$exists": False}, "last_used": {"$not": {"$gte": expiration_time}}}
+        )
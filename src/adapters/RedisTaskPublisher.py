@@ -0,0 +1,39 @@
+import json
+
+import redis
+from rsmq import RedisSMQ
+
+from adapters.send_queue_messages import send_queue_messages
+from config import REDIS_HOST, REDIS_PORT, REDIS_MAX_CONNECTIONS
+from ports.TaskPublisher import TaskPublisher
+
+
+class RedisTaskPublisher(TaskPublisher):
+
+    def __init__(self):
+        self.connection_pool = redis.ConnectionPool(
+            host=REDIS_HOST, port=REDIS_PORT, max_connections=REDIS_MAX_CONNECTIONS, decode_responses=True
+        )
+        self.redis_client = redis.Redis(connection_pool=self.connection_pool)
+        self.queues: dict[str, RedisSMQ] = dict()
+
+    def close(self):
+        self.connection_pool.disconnect()
+
+    def get_queue(self, queue_name: str, suffix: str = "tasks") -> RedisSMQ:
+        qname = f"{queue_name}_{suffix}"
+        if qname not in self.queues:
+            queue = RedisSMQ(client=self.redis_client, qname=qname, quiet=True)
+            queue.createQueue().exceptions(False).execute()
+            self.queues[qname] = queue
+
+        return self.queues[qname]
+
+    def send_message(self, queue_name: str, message: dict):
+        self.get_queue(queue_name).sendMessage(delay=0).message(json.dumps(message)).execute()
+
+    def send_messages(self, queue_name: str, messages: list[dict]):
+        send_queue_messages(self.get_queue(queue_name), [json.dumps(message) for message in messages])
+
+    def send_result(self, queue_name: str, result: dict):
+        self.get_queue(queue_name, "results").sendMessage(delay=0).message(json.dumps(result)).execute()
@@ -0,0 +1,24 @@
+import gc
+from contextlib import contextmanager
+from threading import Lock
+
+lock = Lock()
+paused_count = 0
+enabled_before_pause = True
+
+
+@contextmanager
+def paused_garbage_collection():
+    global paused_count, enabled_before_pause
+    with lock:
+        if paused_count == 0:
+            enabled_before_pause = gc.isenabled()
+            gc.disable()
+        paused_count += 1
+    try:
+        yield
+    finally:
+        with lock:
+            paused_count -= 1
+            if paused_count == 0 and enabled_before_pause:
+                gc.enable()
@@ -0,0 +1,71 @@
+from rsmq import RedisSMQ
+
+PEEK_MESSAGES_SCRIPT = """
+local time = redis.call("TIME")
+local ts = time[1] * 1000 + math.floor(time[2] / 1000)
+local messages_ids = redis.call("ZRANGEBYSCORE", KEYS[1], "-inf", ts, "LIMIT", "0", ARGV[1])
+if #messages_ids == 0 then return {} end
+local messages = redis.call("HMGET", KEYS[1] .. ":Q", unpack(messages_ids))
+local result = {}
+for index, message_id in ipairs(messages_ids) do
+    table.insert(result, {message_id, messages[index]})
+end
+return result
+"""
+
+RECEIVE_MESSAGES_SCRIPT = """
+local time = redis.call("TIME")
+local ts = time[1] * 1000 + math.floor(time[2] / 1000)
+local result = {}
+for index = 2, #ARGV do
+    local message_id = ARGV[index]
+    local score = redis.call("ZSCORE", KEYS[1], message_id)
+    if score and tonumber(score) <= ts then
+        redis.call("ZADD", KEYS[1], ts + tonumber(ARGV[1]), message_id)
+        redis.call("HINCRBY", KEYS[1] .. ":Q", "totalrecv", 1)
+        local receive_count = redis.call("HINCRBY", KEYS[1] .. ":Q", message_id .. ":rc", 1)
+        if receive_count == 1 then
+            redis.call("HSET", KEYS[1] .. ":Q", message_id .. ":fr", ts)
+        end
+        table.insert(result, message_id)
+    end
+end
+return result
+"""
+
+CHANGE_MESSAGES_VISIBILITY_SCRIPT = """
+local time = redis.call("TIME")
+local ts = time[1] * 1000 + math.floor(time[2] / 1000)
+local result = {}
+for index = 2, #ARGV do
+    if redis.call("ZSCORE", KEYS[1], ARGV[index]) then
+        redis.call("ZADD", KEYS[1], ts + tonumber(ARGV[1]), ARGV[index])
+        table.insert(result, ARGV[index])
+    end
+end
+return result
+"""
+
+
+def peek_queue_messages(queue: RedisSMQ, count: int) -> list[tuple[str, str]]:
+    queue_base = queue.receiveMessage().queue_base
+    peek_messages = queue.client.register_script(PEEK_MESSAGES_SCRIPT)
+    return [(message_id, message) for message_id, message in peek_messages(keys=[queue_base], args=[count]) if message]
+
+
+def receive_queue_messages(queue: RedisSMQ, messages_ids: list[str], visibility_timeout: int) -> list[str]:
+    if not messages_ids:
+        return list()
+
+    queue_base = queue.receiveMessage().queue_base
+    receive_messages = queue.client.register_script(RECEIVE_MESSAGES_SCRIPT)
+    return receive_messages(keys=[queue_base], args=[int(visibility_timeout * 1000), *messages_ids])
+
+
+def change_queue_messages_visibility(queue: RedisSMQ, messages_ids: list[str], visibility_timeout: int) -> list[str]:
+    if not messages_ids:
+        return list()
+
+    queue_base = queue.receiveMessage().queue_base
+    change_messages_visibility = queue.client.register_script(CHANGE_MESSAGES_VISIBILITY_SCRIPT)
+    return change_messages_visibility(keys=[queue_base], args=[int(visibility_timeout * 1000), *messages_ids])
@@ -0,0 +1,39 @@
+from rsmq import RedisSMQ
+from rsmq.cmd.utils import make_message_id
+
+TRIM_MESSAGES_SCRIPT = """
+local count = redis.call("ZCARD", KEYS[1])
+local max_messages = tonumber(ARGV[1])
+if count <= max_messages then return 0 end
+local messages_ids = redis.call("ZRANGE", KEYS[1], 0, count - max_messages - 1)
+for _, message_id in ipairs(messages_ids) do
+    redis.call("ZREM", KEYS[1], message_id)
+    redis.call("HDEL", KEYS[1] .. ":Q", message_id, message_id .. ":rc", message_id .. ":fr")
+end
+return #messages_ids
+"""
+
+
+def send_queue_messages(queue: RedisSMQ, messages: list[str]) -> list[str]:
+    if not messages:
+        return list()
+
+    send_message_command = queue.sendMessage(delay=0)
+    queue_definition = send_message_command.queue_def()
+    pipeline = queue.client.pipeline(transaction=True)
+    messages_ids = list()
+    for index, message in enumerate(messages):
+        message_id = make_message_id(queue_definition["ts_usec"] + index)
+        pipeline.zadd(send_message_command.queue_base, {message_id: queue_definition["ts"]})
+        pipeline.hset(send_message_command.queue_key, message_id, message)
+        pipeline.hincrby(send_message_command.queue_key, "totalsent", 1)
+        messages_ids.append(message_id)
+
+    pipeline.execute()
+    return messages_ids
+
+
+def trim_queue_messages(queue: RedisSMQ, max_messages: int) -> int:
+    queue_base = queue.receiveMessage().queue_base
+    trim_messages = queue.client.register_script(TRIM_MESSAGES_SCRIPT)
+    return trim_messages(keys=[queue_base], args=[max_messages])
@@ -11,11 +11,50 @@ SERVICE_HOST = os.environ.get("SERVICE_HOST", "http://127.0.0.1")
 SERVICE_PORT = os.environ.get("SERVICE_PORT", "5056")
 REDIS_HOST = os.environ.get("REDIS_HOST", "127.0.0.1")
 REDIS_PORT = os.environ.get("REDIS_PORT", "6379")
+REDIS_MAX_CONNECTIONS = int(os.environ.get("REDIS_MAX_CONNECTIONS", 50))
 MONGO_HOST = os.environ.get("MONGO_HOST", "mongodb://127.0.0.1")
 MONGO_PORT = os.environ.get("MONGO_PORT", "29017")
+MONGO_THREADS = int(os.environ.get("MONGO_THREADS", 32))
+MONGO_WRITE_BATCH_SIZE = int(os.environ.get("MONGO_WRITE_BATCH_SIZE", 1000))
+MONGO_READ_BATCH_SIZE = int(os.environ.get("MONGO_READ_BATCH_SIZE", 1000))
 SENTRY_DSN = os.environ.get("SENTRY_DSN")
 ENVIRONMENT = os.environ.get("ENVIRONMENT", "development")
+UPLOAD_CHUNK_SIZE = int(os.environ.get("UPLOAD_CHUNK_SIZE", 1024 * 1024))
+MAX_DECOMPRESSED_REQUEST_BYTES = int(os.environ.get("MAX_DECOMPRESSED_REQUEST_BYTES", 2 * 1024**3))
+XML_COMPRESSION_LEVEL = int(os.environ.get("XML_COMPRESSION_LEVEL", 6))
+BULK_BATCH_SIZE = int(os.environ.get("BULK_BATCH_SIZE", 1000))
+SUGGESTIONS_PAGE_SIZE = int(os.environ.get("SUGGESTIONS_PAGE_SIZE", 1000))
+PREDICTION_BATCH_SIZE = int(os.environ.get("PREDICTION_BATCH_SIZE", 200))
+SUGGESTIONS_PARTIAL_RESULTS = os.environ.get("SUGGESTIONS_PARTIAL_RESULTS", "false").lower() == "true"
+PROGRESS_QUEUE_MAX_MESSAGES = int(os.environ.get("PROGRESS_QUEUE_MAX_MESSAGES", 1000))
+PRE_PARSE_WORKERS = int(os.environ.get("PRE_PARSE_WORKERS", 2))
+PRE_PARSE_MAX_PENDING = int(os.environ.get("PRE_PARSE_MAX_PENDING", 100))
+TASK_WORKERS = int(os.environ.get("TASK_WORKERS", 1))
+PARSE_WORKERS = int(os.environ.get("PARSE_WORKERS", max(1, (os.cpu_count() or 1) // TASK_WORKERS)))
+PARSE_CHUNK_SIZE = int(os.environ.get("PARSE_CHUNK_SIZE", 4))
+PARSE_SERIAL_THRESHOLD = int(os.environ.get("PARSE_SERIAL_THRESHOLD", 8))
+MODEL_CACHE_SIZE = int(os.environ.get("MODEL_CACHE_SIZE", 8))
+MODEL_CACHE_MAX_BYTES = int(os.environ.get("MODEL_CACHE_MAX_BYTES", 4 * 1024**3))
+TASK_VISIBILITY_TIMEOUT = int(os.environ.get("TASK_VISIBILITY_TIMEOUT", 5 * 60))
+TASK_STOP_SECONDS = float(os.environ.get("TASK_STOP_SECONDS", 10))
+TASK_POLLING_SECONDS = float(os.environ.get("TASK_POLLING_SECONDS", 0.5))
+TASK_PREFETCH = int(os.environ.get("TASK_PREFETCH", 100))
+TASK_INTERACTIVE_RESERVED_WORKERS = int(os.environ.get("TASK_INTERACTIVE_RESERVED_WORKERS", 1))
+TASK_METRICS_WINDOW = int(os.environ.get("TASK_METRICS_WINDOW", 1000))
+MODEL_EXPIRATION_DAYS = int(os.environ.get("MODEL_EXPIRATION_DAYS", 30))
+JANITOR_INTERVAL_SECONDS = int(os.environ.get("JANITOR_INTERVAL_SECONDS", 10 * 60))
+JANITOR_BATCH_SIZE = int(os.environ.get("JANITOR_BATCH_SIZE", 20))
+EXTRACTOR_USAGE_INTERVAL_SECONDS = int(os.environ.get("EXTRACTOR_USAGE_INTERVAL_SECONDS", 60))
 
 APP_PATH = Path(__file__).parent.absolute()
 ROOT_PATH = Path(__file__).parent.parent.absolute()
 DATA_PATH = join(ROOT_PATH, "models_data")
+XML_STORE_PATH = join(DATA_PATH, "xml_store")
+TRASH_PATH = join(DATA_PATH, "trash")
+XML_STORE_GRACE_SECONDS = int(os.environ.get("XML_STORE_GRACE_SECONDS", 3600))
+XML_CONTENT_HASHES_CACHE_SIZE = int(os.environ.get("XML_CONTENT_HASHES_CACHE_SIZE", 100000))
+PDF_DATA_CACHE_PATH = join(DATA_PATH, "cache", "pdf_data")
+PDF_DATA_CACHE_MAX_BYTES = int(os.environ.get("PDF_DATA_CACHE_MAX_BYTES", 10 * 1024**3))
+PDF_DATA_MEMORY_CACHE_BYTES = int(os.environ.get("PDF_DATA_MEMORY_CACHE_BYTES", 512 * 1024**2))
+PARAGRAPHS_CACHE_PATH = join(DATA_PATH, "cache", "paragraphs")
+PARAGRAPHS_CACHE_MAX_BYTES = int(os.environ.get("PARAGRAPHS_CACHE_MAX_BYTES", 1024**3))
@@ -0,0 +1,10 @@
+from typing import Optional
+
+from pydantic import BaseModel
+
+
+class ExtractorUsage(BaseModel):
+    run_name: str
+    extraction_name: str
+    last_used: float = 0
+    deleted_before: Optional[str] = None
@@ -12,6 +12,7 @@ class ResultsMessage(BaseModel):
     success: bool
     error_message: str
     data_url: Optional[str] = None
+    progress: Optional[float] = None
 
     def to_string(self):
         return f"tenant: {self.tenant}, id: {self.params.id}, task: {self.task}, success: {self.success}, error_message: {self.error_message}"
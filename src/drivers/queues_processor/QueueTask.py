@@ -0,0 +1,18 @@
+from typing import Any
+
+from pydantic import BaseModel
+
+
+class QueueTask(BaseModel):
+    queue_name: str
+    message_id: str
+    message: dict[str, Any]
+    sent_time: float
+    received_time: float
+    visibility_time: float
+    coalescing_key: tuple[str, ...] | None = None
+    task_class: str = ""
+
+    @staticmethod
+    def get_sent_time(message_id: str) -> float:
+        return int(message_id[:-22], 36) / 1000000
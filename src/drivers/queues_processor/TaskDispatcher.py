@@ -0,0 +1,314 @@
+import json
+from collections import deque, defaultdict
+from multiprocessing.connection import wait
+from time import time, sleep
+from typing import Any, Callable
+
+import redis
+from rsmq import RedisSMQ
+from trainable_entity_extractor.config import config_logger
+
+from adapters.receive_queue_messages import (
+    peek_queue_messages,
+    receive_queue_messages,
+    change_queue_messages_visibility,
+)
+from adapters.send_queue_messages import send_queue_messages, trim_queue_messages
+from config import (
+    TASK_VISIBILITY_TIMEOUT,
+    TASK_POLLING_SECONDS,
+    TASK_PREFETCH,
+    TASK_METRICS_WINDOW,
+    PROGRESS_QUEUE_MAX_MESSAGES,
+)
+from drivers.queues_processor.QueueTask import QueueTask
+from drivers.queues_processor.TaskWorker import TaskWorker, PARTIAL_RESULT
+
+
+class TaskDispatcher:
+    DEFAULT_TASK_CLASS = "default"
+    METRICS_KEY = "task_dispatcher_metrics"
+
+    def __init__(self, redis_host: str, redis_port: int, queues_names: list[str], workers: int):
+        self.redis_client = redis.Redis(host=redis_host, port=redis_port, decode_responses=True)
+        self.queues_names = queues_names
+        self.workers_count = workers
+        self.workers: list[TaskWorker] = list()
+        self.tasks_queues = {name: self.get_queue(f"{name}_tasks") for name in queues_names}
+        self.results_queues = {name: self.get_queue(f"{name}_results") for name in queues_names}
+        self.progress_queues = {name: self.get_queue(f"{name}_progress") for name in queues_names}
+        self.next_queue_index = 0
+        self.get_coalescing_key: Callable[[dict[str, Any]], tuple[str, ...] | None] = lambda message: None
+        self.get_coalesced_result: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]] = lambda result, _: result
+        self.get_task_class: Callable[[dict[str, Any]], str] = lambda message: self.DEFAULT_TASK_CLASS
+        self.reserved_workers: dict[str, int] = {self.DEFAULT_TASK_CLASS: 0}
+        self.pending_tasks: dict[str, list[list[QueueTask]]] = {self.DEFAULT_TASK_CLASS: list()}
+        self.queue_wait_seconds: dict[str, deque[float]] = {self.DEFAULT_TASK_CLASS: deque(maxlen=TASK_METRICS_WINDOW)}
+        self.metrics = {"tasks": 0, "executions": 0, "coalesced_tasks": 0, "saved_seconds": 0}
+        self.running = False
+
+    def get_queue(self, queue_name: str) -> RedisSMQ:
+        queue = RedisSMQ(client=self.redis_client, qname=queue_name, quiet=True)
+        queue.createQueue().exceptions(False).execute()
+        return queue
+
+    def set_coalescing(
+        self,
+        get_coalescing_key: Callable[[dict[str, Any]], tuple[str, ...] | None],
+        get_coalesced_result: Callable[[dict[str, Any], dict[str, Any]], dict[str, Any]],
+    ):
+        self.get_coalescing_key = get_coalescing_key
+        self.get_coalesced_result = get_coalesced_result
+
+    def set_task_classes(self, get_task_class: Callable[[dict[str, Any]], str], reserved_workers: dict[str, int]):
+        self.get_task_class = get_task_class
+        self.reserved_workers = reserved_workers
+        self.pending_tasks = {task_class: list() for task_class in reserved_workers}
+        self.queue_wait_seconds = {task_class: deque(maxlen=TASK_METRICS_WINDOW) for task_class in reserved_workers}
+
+    def start(
+        self,
+        process: Callable[[dict[str, Any]], dict[str, Any] | None],
+        restart_condition: Callable[[dict[str, Any]], bool],
+        get_error_result: Callable[[dict[str, Any], str], dict[str, Any] | None],
+    ):
+        self.workers = [TaskWorker(process) for _ in range(self.workers_count)]
+        self.running = True
+        config_logger.info(f"Dispatching tasks from {self.queues_names} to {self.workers_count} processes")
+
+        try:
+            while self.running:
+                for worker in self.get_workers_with_results():
+                    message_type, result, error_message = worker.receive()
+                    if message_type == PARTIAL_RESULT:
+                        self.send_progress(worker.tasks, result)
+                    else:
+                        self.finish_tasks(worker, result, error_message, restart_condition, get_error_result)
+
+                self.receive_tasks()
+                self.extend_visibility()
+
+                idle_workers = [worker for worker in self.workers if worker.is_idle()]
+                tasks = self.get_next_tasks() if idle_workers else None
+                if tasks:
+                    self.renew_visibility(tasks)
+                    idle_workers[0].run(tasks)
+                    continue
+
+                if self.running:
+                    self.wait_workers()
+        finally:
+            for worker in self.workers:
+                worker.stop()
+
+    def stop(self):
+        self.running = False
+
+    def get_workers_with_results(self) -> list[TaskWorker]:
+        return [worker for worker in self.workers if not worker.is_idle() and worker.connection.poll()]
+
+    def wait_workers(self):
+        busy_connections = [worker.connection for worker in self.workers if not worker.is_idle()]
+        if busy_connections:
+            wait(busy_connections, timeout=TASK_POLLING_SECONDS)
+        else:
+            sleep(TASK_POLLING_SECONDS)
+
+    def get_pending_count(self, task_class: str) -> int:
+        return sum([len(tasks) for tasks in self.pending_tasks[task_class]])
+
+    def is_class_full(self, task_class: str) -> bool:
+        return self.get_pending_count(task_class) >= TASK_PREFETCH
+
+    def get_held_tasks(self) -> list[QueueTask]:
+        held_tasks = [task for class_tasks in self.pending_tasks.values() for tasks in class_tasks for task in tasks]
+        return held_tasks + [task for worker in self.workers for task in worker.tasks]
+
+    def get_held_task(self, queue_name: str, message_id: str) -> QueueTask | None:
+        for task in self.get_held_tasks():
+            if task.queue_name == queue_name and task.message_id == message_id:
+                return task
+
+        return None
+
+    def receive_tasks(self):
+        for _ in range(len(self.queues_names)):
+            if all(map(self.is_class_full, self.pending_tasks)):
+                return
+
+            queue_name = self.queues_names[self.next_queue_index]
+            self.next_queue_index = (self.next_queue_index + 1) % len(self.queues_names)
+            self.receive_queue_tasks(queue_name)
+
+    def receive_queue_tasks(self, queue_name: str):
+        tasks_queue = self.tasks_queues[queue_name]
+        free_slots = {task_class: TASK_PREFETCH - self.get_pending_count(task_class) for task_class in self.pending_tasks}
+        held_tasks, new_tasks = list(), list()
+        for message_id, message in peek_queue_messages(tasks_queue, sum(free_slots.values()) + TASK_PREFETCH):
+            if held_task := self.get_held_task(queue_name, message_id):
+                held_tasks.append(held_task)
+                continue
+
+            task = self.get_task(queue_name, message_id, message)
+            if task and free_slots[task.task_class] > 0:
+                free_slots[task.task_class] -= 1
+                new_tasks.append(task)
+
+        tasks_ids = [task.message_id for task in held_tasks + new_tasks]
+        received_ids = set(receive_queue_messages(tasks_queue, tasks_ids, TASK_VISIBILITY_TIMEOUT))
+        for task in held_tasks + new_tasks:
+            if task.message_id in received_ids:
+                task.visibility_time = time()
+
+        for task in new_tasks:
+            if task.message_id in received_ids:
+                self.add_pending_task(task)
+
+    def add_pending_task(self, task: QueueTask):
+        self.metrics["tasks"] += 1
+        class_pending_tasks = self.pending_tasks[task.task_class]
+        if task.coalescing_key:
+            for tasks in class_pending_tasks:
+                if tasks[0].coalescing_key == task.coalescing_key:
+                    tasks.append(task)
+                    return
+
+        class_pending_tasks.append([task])
+
+    def can_start(self, task_class: str) -> bool:
+        running_classes = [worker.get_main_task().task_class for worker in self.workers if not worker.is_idle()]
+        idle_workers_count = len(self.workers) - len(running_classes)
+        workers_reserved_for_others = 0
+        for other_task_class, reserved_workers in self.reserved_workers.items():
+            if other_task_class != task_class:
+                workers_reserved_for_others += max(0, reserved_workers - running_classes.count(other_task_class))
+
+        return idle_workers_count > workers_reserved_for_others or not running_classes
+
+    def get_next_tasks(self) -> list[QueueTask] | None:
+        running_keys = {worker.get_main_task().coalescing_key for worker in self.workers if not worker.is_idle()}
+        for task_class, class_pending_tasks in self.pending_tasks.items():
+            if not class_pending_tasks or not self.can_start(task_class):
+                continue
+
+            for tasks in class_pending_tasks:
+                if not tasks[0].coalescing_key or tasks[0].coalescing_key not in running_keys:
+                    class_pending_tasks.remove(tasks)
+                    return tasks
+
+        return None
+
+    def get_task(self, queue_name: str, message_id: str, message: str) -> QueueTask | None:
+        try:
+            message_content = json.loads(message)
+        except json.JSONDecodeError:
+            message_content = None
+
+        if not isinstance(message_content, dict):
+            config_logger.error(f"Not a valid Redis message: {message}")
+            self.tasks_queues[queue_name].deleteMessage(id=message_id).execute()
+            return None
+
+        return QueueTask(
+            queue_name=queue_name,
+            message_id=message_id,
+            message=message_content,
+            sent_time=QueueTask.get_sent_time(message_id),
+            received_time=time(),
+            visibility_time=time(),
+            coalescing_key=self.get_coalescing_key(message_content),
+            task_class=self.get_task_class(message_content),
+        )
+
+    def extend_visibility(self):
+        self.renew_visibility(
+            [task for task in self.get_held_tasks() if time() - task.visibility_time >= TASK_VISIBILITY_TIMEOUT / 2]
+        )
+
+    def renew_visibility(self, tasks: list[QueueTask]):
+        tasks_ids: dict[str, list[str]] = defaultdict(list)
+        for task in tasks:
+            tasks_ids[task.queue_name].append(task.message_id)
+
+        for queue_name, queue_tasks_ids in tasks_ids.items():
+            change_queue_messages_visibility(self.tasks_queues[queue_name], queue_tasks_ids, TASK_VISIBILITY_TIMEOUT)
+
+        for task in tasks:
+            task.visibility_time = time()
+
+    def finish_tasks(
+        self,
+        worker: TaskWorker,
+        result: dict[str, Any] | None,
+        error_message: str,
+        restart_condition: Callable[[dict[str, Any]], bool],
+        get_error_result: Callable[[dict[str, Any], str], dict[str, Any] | None],
+    ):
+        tasks = worker.tasks
+        main_task = worker.get_main_task()
+        execution_seconds = time() - worker.start_time
+        worker.tasks = list()
+
+        if error_message:
+            config_logger.error(f"Task {main_task.message} failed: {error_message}")
+
+        tasks_results: dict[str, list[str]] = defaultdict(list)
+        for task in tasks:
+            if error_message:
+                task_result = get_error_result(task.message, error_message)
+            else:
+                task_result = self.get_coalesced_result(result, task.message) if result else None
+
+            if task_result:
+                tasks_results[task.queue_name].append(json.dumps(task_result))
+
+        for queue_name, queue_results in tasks_results.items():
+            send_queue_messages(self.results_queues[queue_name], queue_results)
+
+        for task in tasks:
+            self.tasks_queues[task.queue_name].deleteMessage(id=task.message_id).execute()
+
+        self.log_metrics(tasks, worker.start_time, execution_seconds)
+
+        if not error_message and restart_condition(main_task.message):
+            worker.restart()
+
+    def send_progress(self, tasks: list[QueueTask], result: dict[str, Any]):
+        tasks_progress: dict[str, list[str]] = defaultdict(list)
+        for task in tasks:
+            tasks_progress[task.queue_name].append(json.dumps(self.get_coalesced_result(result, task.message)))
+
+        for queue_name, queue_progress in tasks_progress.items():
+            send_queue_messages(self.progress_queues[queue_name], queue_progress)
+            trim_queue_messages(self.progress_queues[queue_name], PROGRESS_QUEUE_MAX_MESSAGES)
+
+    def log_metrics(self, tasks: list[QueueTask], start_time: float, execution_seconds: float):
+        self.metrics["executions"] += 1
+        self.metrics["coalesced_tasks"] += len(tasks) - 1
+        self.metrics["saved_seconds"] += (len(tasks) - 1) * execution_seconds
+        queue_wait_seconds = [round(start_time - task.sent_time, 2) for task in tasks]
+        self.queue_wait_seconds[tasks[-1].task_class].extend(queue_wait_seconds)
+        config_logger.info(
+            f"Task {tasks[-1].message.get('task')} answered {len(tasks)} messages in {round(execution_seconds, 2)} "
+            f"seconds, queue wait {queue_wait_seconds} seconds. Totals: {self.metrics['tasks']} tasks received, "
+            f"{self.metrics['executions']} executions, {self.metrics['coalesced_tasks']} coalesced tasks, "
+            f"{round(self.metrics['saved_seconds'])} seconds saved"
+        )
+
+        metrics = {**self.metrics, "queue_wait_seconds": self.get_queue_wait_percentiles()}
+        config_logger.info(f"Queue wait percentiles: {metrics['queue_wait_seconds']}")
+        self.redis_client.set(self.METRICS_KEY, json.dumps(metrics))
+
+    def get_queue_wait_percentiles(self) -> dict[str, dict[str, float]]:
+        percentiles = dict()
+        for task_class, queue_wait_seconds in self.queue_wait_seconds.items():
+            if not queue_wait_seconds:
+                continue
+            sorted_seconds = sorted(queue_wait_seconds)
+            percentiles[task_class] = {
+                f"p{percentile}": round(
+                    sorted_seconds[min(len(sorted_seconds) - 1, len(sorted_seconds) * percentile // 100)], 2
+                )
+                for percentile in [50, 90, 99]
+            }
+        return percentiles
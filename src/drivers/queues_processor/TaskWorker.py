@@ -0,0 +1,88 @@
+from multiprocessing import get_context
+from multiprocessing.connection import Connection
+from time import time
+from typing import Any, Callable
+
+from trainable_entity_extractor.config import config_logger
+
+from config import TASK_STOP_SECONDS
+from drivers.queues_processor.QueueTask import QueueTask
+from use_cases.DocumentsParser import DocumentsParser
+
+
+RESULT = "result"
+PARTIAL_RESULT = "partial_result"
+
+worker_connection: Connection | None = None
+
+
+def send_partial_result(result: dict[str, Any]):
+    if worker_connection:
+        worker_connection.send((PARTIAL_RESULT, result, ""))
+
+
+def run_tasks(connection: Connection, process: Callable[[dict[str, Any]], dict[str, Any] | None]):
+    global worker_connection
+    worker_connection = connection
+    try:
+        while message := connection.recv():
+            try:
+                connection.send((RESULT, process(message), ""))
+            except Exception as exception:
+                config_logger.error("Error processing task", exc_info=1)
+                connection.send((RESULT, None, str(exception)))
+    finally:
+        DocumentsParser.close()
+
+
+class TaskWorker:
+    def __init__(self, process: Callable[[dict[str, Any]], dict[str, Any] | None]):
+        self.process_function = process
+        self.tasks: list[QueueTask] = list()
+        self.start_time = 0
+        self.connection: Connection | None = None
+        self.process = None
+        self.start()
+
+    def start(self):
+        context = get_context("spawn")
+        self.connection, worker_connection = context.Pipe()
+        self.process = context.Process(target=run_tasks, args=(worker_connection, self.process_function))
+        self.process.start()
+        worker_connection.close()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+
+        self.process.join(TASK_STOP_SECONDS)
+        if self.process.is_alive():
+            self.process.terminate()
+            self.process.join()
+        self.connection.close()
+
+    def restart(self):
+        self.stop()
+        self.start()
+
+    def is_idle(self) -> bool:
+        return not self.tasks
+
+    def get_main_task(self) -> QueueTask | None:
+        return self.tasks[-1] if self.tasks else None
+
+    def run(self, tasks: list[QueueTask]):
+        self.tasks = tasks
+        self.start_time = time()
+        self.connection.send(self.get_main_task().message)
+
+    def receive(self) -> tuple[str, dict[str, Any] | None, str]:
+        try:
+            return self.connection.recv()
+        except (EOFError, ConnectionError):
+            self.process.join()
+            error_message = f"Task process stopped unexpectedly with exit code {self.process.exitcode}"
+            self.restart()
+            return RESULT, None, error_message
@@ -1,7 +1,8 @@
 import os
+from functools import partial
+
 import torch
 from pydantic import ValidationError
-from queue_processor.QueueProcessor import QueueProcessor
 from sentry_sdk.integrations.redis import RedisIntegration
 import sentry_sdk
 from trainable_entity_extractor.config import config_logger
@@ -9,17 +10,82 @@ from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdent
 from trainable_entity_extractor.send_logs import send_logs
 
 from adapters.MongoPersistenceRepository import MongoPersistenceRepository
-from config import SERVICE_HOST, SERVICE_PORT, REDIS_HOST, REDIS_PORT, QUEUES_NAMES, DATA_PATH, PARAGRAPH_EXTRACTION_NAME
+from config import (
+    SERVICE_HOST,
+    SERVICE_PORT,
+    REDIS_HOST,
+    REDIS_PORT,
+    QUEUES_NAMES,
+    DATA_PATH,
+    PARAGRAPH_EXTRACTION_NAME,
+    TASK_WORKERS,
+    TASK_INTERACTIVE_RESERVED_WORKERS,
+    SUGGESTIONS_PARTIAL_RESULTS,
+)
 from domain.ParagraphExtractionResultsMessage import ParagraphExtractionResultsMessage
 from domain.ParagraphExtractorTask import ParagraphExtractorTask
 from domain.TrainableEntityExtractionTask import TrainableEntityExtractionTask
 from domain.ResultsMessage import ResultsMessage
 from use_cases.Extractor import Extractor
+from use_cases.ExtractorsJanitor import ExtractorsJanitor
 from domain.TaskType import TaskType
+from drivers.queues_processor.TaskDispatcher import TaskDispatcher
+from drivers.queues_processor.TaskWorker import send_partial_result
 
 
 def restart_condition(message: dict[str, any]) -> bool:
-    return TrainableEntityExtractionTask(**message).task == Extractor.CREATE_MODEL_TASK_NAME
+    try:
+        return TaskType(**message).task == Extractor.CREATE_MODEL_TASK_NAME
+    except ValidationError:
+        return False
+
+
+INTERACTIVE_TASK_CLASS = "interactive"
+BATCH_TASK_CLASS = "batch"
+
+
+def get_task_class(message: dict[str, any]) -> str:
+    try:
+        task_type = TaskType(**message)
+    except ValidationError:
+        return INTERACTIVE_TASK_CLASS
+
+    return BATCH_TASK_CLASS if task_type.task == Extractor.CREATE_MODEL_TASK_NAME else INTERACTIVE_TASK_CLASS
+
+
+def get_coalescing_key(message: dict[str, any]) -> tuple[str, str, str] | None:
+    try:
+        task = TrainableEntityExtractionTask(**message)
+    except ValidationError:
+        return None
+
+    if task.task not in [Extractor.CREATE_MODEL_TASK_NAME, Extractor.SUGGESTIONS_TASK_NAME]:
+        return None
+
+    return task.tenant, task.params.id, task.task
+
+
+def get_coalesced_result(result: dict[str, any], message: dict[str, any]) -> dict[str, any]:
+    task = TrainableEntityExtractionTask(**message)
+    return {**result, "params": task.params.model_dump()}
+
+
+def get_error_result(message: dict[str, any], error_message: str) -> dict[str, any] | None:
+    try:
+        if TaskType(**message).task == PARAGRAPH_EXTRACTION_NAME:
+            task = ParagraphExtractorTask(**message)
+            results_message = ParagraphExtractionResultsMessage(
+                key=task.key, xmls=task.xmls, success=False, error_message=error_message
+            )
+        else:
+            task = TrainableEntityExtractionTask(**message)
+            results_message = ResultsMessage(
+                tenant=task.tenant, task=task.task, params=task.params, success=False, error_message=error_message
+            )
+    except ValidationError:
+        return None
+
+    return results_message.model_dump()
 
 
 def get_paragraphs(task: ParagraphExtractorTask):
@@ -62,20 +128,37 @@ def process(message: dict[str, any]) -> dict[str, any] | None:
     return result_message.model_dump()
 
 
+def report_progress(task: TrainableEntityExtractionTask, processed: int, total: int):
+    results_message = ResultsMessage(
+        tenant=task.tenant,
+        task=task.task,
+        params=task.params,
+        success=True,
+        error_message="",
+        data_url=f"{SERVICE_HOST}:{SERVICE_PORT}/get_suggestions/{task.tenant}/{task.params.id}/page",
+        progress=round(processed / total, 4),
+    )
+    send_partial_result(results_message.model_dump())
+
+
 def get_extraction(task: TrainableEntityExtractionTask | ParagraphExtractorTask) -> ResultsMessage:
     persistence_repository = MongoPersistenceRepository()
-    task_calculated, error_message = Extractor.calculate_task(task, persistence_repository)
+    task_report_progress = None
+    if SUGGESTIONS_PARTIAL_RESULTS and task.task == Extractor.SUGGESTIONS_TASK_NAME:
+        task_report_progress = partial(report_progress, task)
+
+    task_calculated, error_message = Extractor.calculate_task(task, persistence_repository, task_report_progress)
 
     if task_calculated:
         data_url = None
 
         if task.task == Extractor.SUGGESTIONS_TASK_NAME:
-            data_url = f"{SERVICE_HOST}:{SERVICE_PORT}/get_suggestions/{task.tenant}/{task.xmls.id}"
+            data_url = f"{SERVICE_HOST}:{SERVICE_PORT}/get_suggestions/{task.tenant}/{task.params.id}"
 
         model_results_message = ResultsMessage(
             tenant=task.tenant,
             task=task.task,
-            params=task.xmls,
+            params=task.params,
             success=True,
             error_message="",
             data_url=data_url,
@@ -85,12 +168,12 @@ def get_extraction(task: TrainableEntityExtractionTask | ParagraphExtractorTask)
         model_results_message = ResultsMessage(
             tenant=task.tenant,
             task=task.task,
-            params=task.xmls,
+            params=task.params,
             success=False,
             error_message=error_message,
         )
     extraction_identifier = ExtractionIdentifier(
-        run_name=task.tenant, extraction_name=task.xmls.id, metadata=task.xmls.metadata, output_path=DATA_PATH
+        run_name=task.tenant, extraction_name=task.params.id, metadata=task.params.metadata, output_path=DATA_PATH
     )
     send_logs(extraction_identifier, f"Result message: {model_results_message.to_string()}")
     return model_results_message
@@ -119,7 +202,15 @@ if __name__ == "__main__":
     except Exception:
         pass
 
+    mongo_persistence_repository = MongoPersistenceRepository()
+    mongo_persistence_repository.create_indexes()
+    ExtractorsJanitor(mongo_persistence_repository).start()
+
     config_logger.info(f"Waiting for messages. Is GPU used? {torch.cuda.is_available()}")
     queues_names = QUEUES_NAMES.split(" ")
-    queue_processor = QueueProcessor(REDIS_HOST, REDIS_PORT, queues_names, config_logger)
-    queue_processor.start(process, restart_condition)
+    task_dispatcher = TaskDispatcher(REDIS_HOST, REDIS_PORT, queues_names, TASK_WORKERS)
+    task_dispatcher.set_coalescing(get_coalescing_key, get_coalesced_result)
+    task_dispatcher.set_task_classes(
+        get_task_class, {INTERACTIVE_TASK_CLASS: TASK_INTERACTIVE_RESERVED_WORKERS, BATCH_TASK_CLASS: 0}
+    )
+    task_dispatcher.start(process, restart_condition, get_error_result)
@@ -0,0 +1,93 @@
+import json
+from typing import AsyncIterator, Callable, Awaitable
+
+from pydantic import BaseModel
+from pymongo.errors import BulkWriteError
+from starlette.requests import Request
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+
+from config import DATA_PATH, BULK_BATCH_SIZE
+from drivers.rest.BulkIngestionResult import BulkIngestionResult, LineError
+
+
+class BulkIngestion:
+    def __init__(
+        self,
+        data_type: type[BaseModel],
+        save_data_list: Callable[[ExtractionIdentifier, list[BaseModel]], Awaitable[None]],
+        prepare: Callable[[BaseModel], None] = None,
+        batch_size: int = BULK_BATCH_SIZE,
+    ):
+        self.data_type = data_type
+        self.save_data_list = save_data_list
+        self.prepare = prepare
+        self.batch_size = batch_size
+        self.batch: list[tuple[int, BaseModel]] = list()
+        self.result = BulkIngestionResult()
+
+    async def ingest(self, request: Request) -> BulkIngestionResult:
+        async for line_number, record in self.get_records(request):
+            self.add(line_number, record)
+            if len(self.batch) >= self.batch_size:
+                await self.flush()
+
+        await self.flush()
+        return self.result
+
+    def add(self, line_number: int, record: bytes | dict):
+        try:
+            data = self.data_type(**(record if isinstance(record, dict) else json.loads(record)))
+            if self.prepare:
+                self.prepare(data)
+            self.batch.append((line_number, data))
+        except Exception as exception:
+            self.result.errors.append(LineError(line=line_number, error_message=str(exception)))
+
+    async def flush(self):
+        batch_by_extractor: dict[tuple[str, str], list[tuple[int, BaseModel]]] = dict()
+        for line_number, data in self.batch:
+            batch_by_extractor.setdefault((data.tenant, data.id), list()).append((line_number, data))
+
+        for (tenant, extraction_id), lines_data in batch_by_extractor.items():
+            extraction_identifier = ExtractionIdentifier(
+                run_name=tenant, extraction_name=extraction_id, output_path=DATA_PATH
+            )
+            try:
+                await self.save_data_list(extraction_identifier, [data for _, data in lines_data])
+                self.result.saved += len(lines_data)
+            except BulkWriteError as bulk_write_error:
+                self.add_write_errors(lines_data, bulk_write_error)
+            except Exception as exception:
+                config_logger.error("Error saving bulk data", exc_info=1)
+                self.result.errors.extend([LineError(line=line, error_message=str(exception)) for line, _ in lines_data])
+
+        self.batch = list()
+
+    def add_write_errors(self, lines_data: list[tuple[int, BaseModel]], bulk_write_error: BulkWriteError):
+        write_errors = bulk_write_error.details.get("writeErrors", list())
+        self.result.saved += len(lines_data) - len(write_errors)
+        for write_error in write_errors:
+            line_number, _ = lines_data[write_error["index"]]
+            self.result.errors.append(LineError(line=line_number, error_message=write_error.get("errmsg", "")))
+
+    @staticmethod
+    async def get_records(request: Request) -> AsyncIterator[tuple[int, bytes | dict]]:
+        if request.headers.get("content-type", "").startswith("application/json"):
+            records = json.loads(await request.body())
+            for index, record in enumerate(records if isinstance(records, list) else [records]):
+                yield index + 1, record
+            return
+
+        line_number = 0
+        pending_line = b""
+        async for chunk in request.stream():
+            lines = (pending_line + chunk).split(b"\n")
+            pending_line = lines.pop()
+            for line in lines:
+                line_number += 1
+                if line.strip():
+                    yield line_number, line
+
+        if pending_line.strip():
+            yield line_number + 1, pending_line
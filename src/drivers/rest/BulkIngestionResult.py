@@ -0,0 +1,11 @@
+from pydantic import BaseModel
+
+
+class LineError(BaseModel):
+    line: int
+    error_message: str
+
+
+class BulkIngestionResult(BaseModel):
+    saved: int = 0
+    errors: list[LineError] = list()
@@ -0,0 +1,112 @@
+import zlib
+
+import zstandard
+from starlette.datastructures import Headers
+from starlette.responses import PlainTextResponse
+from starlette.types import ASGIApp, Scope, Receive, Send, Message
+
+from config import MAX_DECOMPRESSED_REQUEST_BYTES
+
+DECOMPRESS_OUTPUT_BYTES = 1024 * 1024
+
+
+class RequestTooLarge(Exception):
+    pass
+
+
+class DecompressedBody:
+    def __init__(self):
+        self.decompressed_bytes = 0
+        self.chunks: list[bytes] = list()
+
+    def write(self, chunk: bytes) -> int:
+        self.decompressed_bytes += len(chunk)
+        if self.decompressed_bytes > MAX_DECOMPRESSED_REQUEST_BYTES:
+            raise RequestTooLarge(f"Decompressed request body larger than {MAX_DECOMPRESSED_REQUEST_BYTES} bytes")
+        self.chunks.append(chunk)
+        return len(chunk)
+
+    def pop(self) -> bytes:
+        body = b"".join(self.chunks)
+        self.chunks = list()
+        return body
+
+
+class GzipWriter:
+    def __init__(self, decompressed_body: DecompressedBody):
+        self.decompressed_body = decompressed_body
+        self.decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+
+    def write(self, body: bytes):
+        while body:
+            self.decompressed_body.write(self.decompressor.decompress(body, DECOMPRESS_OUTPUT_BYTES))
+            body = self.decompressor.unconsumed_tail
+
+    def flush(self):
+        self.decompressed_body.write(self.decompressor.flush())
+
+
+class DecompressRequestMiddleware:
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    @staticmethod
+    def get_writer(content_encoding: str, decompressed_body: DecompressedBody):
+        if content_encoding == "gzip":
+            return GzipWriter(decompressed_body)
+
+        if content_encoding == "zstd":
+            decompressor = zstandard.ZstdDecompressor()
+            return decompressor.stream_writer(decompressed_body, write_size=DECOMPRESS_OUTPUT_BYTES, closefd=False)
+
+        return None
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        content_encoding = Headers(scope=scope).get("content-encoding", "").strip().lower()
+        decompressed_body = DecompressedBody()
+        writer = self.get_writer(content_encoding, decompressed_body)
+        if not writer:
+            await self.app(scope, receive, send)
+            return
+
+        too_large = False
+        response_started = False
+
+        async def receive_decompressed() -> Message:
+            nonlocal too_large
+            message = await receive()
+            if message["type"] != "http.request":
+                return message
+
+            try:
+                writer.write(message.get("body", b""))
+                if not message.get("more_body", False):
+                    writer.flush()
+            except RequestTooLarge:
+                too_large = True
+                raise
+
+            return {**message, "body": decompressed_body.pop()}
+
+        async def send_unless_too_large(message: Message):
+            nonlocal response_started
+            if too_large and not response_started:
+                return
+
+            response_started = True
+            await send(message)
+
+        headers = [(key, value) for key, value in scope["headers"] if key not in (b"content-encoding", b"content-length")]
+        try:
+            await self.app({**scope, "headers": headers}, receive_decompressed, send_unless_too_large)
+        except Exception:
+            if not too_large:
+                raise
+
+        if too_large and not response_started:
+            response = PlainTextResponse("Decompressed request body too large", status_code=413)
+            await response(scope, receive, send)
@@ -0,0 +1,41 @@
+import asyncio
+from time import time
+
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+
+from config import EXTRACTOR_USAGE_INTERVAL_SECONDS
+from ports.AsyncPersistenceRepository import AsyncPersistenceRepository
+
+
+class ExtractorsUsageRecorder:
+    def __init__(self, persistence_repository: AsyncPersistenceRepository):
+        self.persistence_repository = persistence_repository
+        self.saved_times: dict[tuple[str, str], float] = dict()
+        self.saving_tasks: set[asyncio.Task] = set()
+
+    def record(self, extraction_identifier: ExtractionIdentifier):
+        key = (extraction_identifier.run_name, extraction_identifier.extraction_name)
+        now = time()
+        if now - self.saved_times.get(key, 0) < EXTRACTOR_USAGE_INTERVAL_SECONDS:
+            return
+
+        self.saved_times = {
+            x: saved_time
+            for x, saved_time in self.saved_times.items()
+            if now - saved_time < EXTRACTOR_USAGE_INTERVAL_SECONDS
+        }
+        self.saved_times[key] = now
+        saving_task = asyncio.create_task(self.save(key, extraction_identifier))
+        self.saving_tasks.add(saving_task)
+        saving_task.add_done_callback(self.saving_tasks.discard)
+
+    async def save(self, key: tuple[str, str], extraction_identifier: ExtractionIdentifier):
+        try:
+            await self.persistence_repository.save_extractor_usage(extraction_identifier)
+        except Exception:
+            self.saved_times.pop(key, None)
+            config_logger.error("Error saving the extractor usage", exc_info=1)
+
+    async def close(self):
+        await asyncio.gather(*self.saving_tasks)
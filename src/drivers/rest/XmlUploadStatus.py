@@ -0,0 +1,7 @@
+from pydantic import BaseModel
+
+
+class XmlUploadStatus(BaseModel):
+    xml_file_name: str
+    success: bool
+    error_message: str = ""
@@ -1,14 +1,20 @@
 import os
-import shutil
 from contextlib import asynccontextmanager
 import json
-from os.path import join
+from os.path import basename
+from pathlib import Path
+from uuid import uuid4
 
-from queue_processor.QueueProcessor import QueueProcessor
+import orjson
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from pymongo.errors import BulkWriteError
+from starlette.concurrency import run_in_threadpool
 
-from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from adapters.AsyncMongoPersistenceRepository import AsyncMongoPersistenceRepository
+from adapters.RedisTaskPublisher import RedisTaskPublisher
 from catch_exceptions import catch_exceptions
-from fastapi import FastAPI, HTTPException, UploadFile, File, Form
+from fastapi import FastAPI, HTTPException, UploadFile, File, Form, Request, Query
+from fastapi.responses import Response, StreamingResponse
 import sys
 
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
@@ -20,21 +26,42 @@ from trainable_entity_extractor.data.LabeledData import LabeledData
 from trainable_entity_extractor.data.PredictionData import PredictionData
 from trainable_entity_extractor.send_logs import send_logs
 
-from config import DATA_PATH, REDIS_HOST, REDIS_PORT, PARAGRAPH_EXTRACTION_NAME
-from domain.ParagraphExtractionData import ParagraphExtractionData
+from config import DATA_PATH, PARAGRAPH_EXTRACTION_NAME, SUGGESTIONS_PAGE_SIZE, SERVICE_HOST, SERVICE_PORT
+from domain.ParagraphExtractionData import ParagraphExtractionData, XmlSegments
+from domain.ParagraphExtractionResultsMessage import ParagraphExtractionResultsMessage
 from domain.ParagraphExtractorTask import ParagraphExtractorTask
 from domain.XML import XML
+from drivers.rest.BulkIngestion import BulkIngestion
+from drivers.rest.BulkIngestionResult import BulkIngestionResult
+from drivers.rest.DecompressRequestMiddleware import DecompressRequestMiddleware
+from drivers.rest.ExtractorsUsageRecorder import ExtractorsUsageRecorder
 from drivers.rest.ParagraphsTranslations import ParagraphsTranslations
+from drivers.rest.XmlUploadStatus import XmlUploadStatus
+from drivers.rest.save_upload_file import save_upload_file, save_upload_files
+from drivers.rest.stream_suggestions import stream_suggestions
+from use_cases.DocumentPreParser import DocumentPreParser
+from use_cases.ExtractorsJanitor import ExtractorsJanitor
+from use_cases.InferenceProcess import InferenceProcess
+from use_cases.ParagraphsCache import ParagraphsCache
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    app.persistence_repository = MongoPersistenceRepository()
+    app.persistence_repository = AsyncMongoPersistenceRepository()
+    app.extractors_usage_recorder = ExtractorsUsageRecorder(app.persistence_repository)
+    app.task_publisher = RedisTaskPublisher()
+    app.document_pre_parser = DocumentPreParser()
+    app.inference_process = InferenceProcess()
     yield
-    app.persistence_repository.close()
+    await app.extractors_usage_recorder.close()
+    await app.persistence_repository.close()
+    app.task_publisher.close()
+    app.document_pre_parser.close()
+    app.inference_process.close()
 
 
 app = FastAPI(lifespan=lifespan)
+app.add_middleware(DecompressRequestMiddleware)
 
 config_logger.info("PDF information extraction service has started")
 
@@ -71,7 +98,7 @@ async def to_train_xml_file(tenant, extraction_id, file: UploadFile = File(...))
         to_train=True,
         xml_file_name=filename,
     )
-    xml_file.save(file_content=file.file.read())
+    await save_upload_file(file, xml_file.xml_file_path)
     return "xml_to_train saved"
 
 
@@ -84,10 +111,30 @@ async def to_predict_xml_file(tenant, extraction_id, file: UploadFile = File(...
         to_train=False,
         xml_file_name=filename,
     )
-    xml_file.save(file_content=file.file.read())
+    await save_upload_file(file, xml_file.xml_file_path)
     return "xml_to_train saved"
 
 
+@app.post("/xmls_to_train/{tenant}/{extraction_id}")
+@catch_exceptions
+async def to_train_xml_files(
+    tenant, extraction_id, files: list[UploadFile] = File(None), archive: UploadFile = File(None)
+) -> list[XmlUploadStatus]:
+    extraction_identifier = ExtractionIdentifier(run_name=tenant, extraction_name=extraction_id, output_path=DATA_PATH)
+    xml_folder_path = XmlFile(extraction_identifier=extraction_identifier, to_train=True).xml_folder_path
+    return await save_upload_files(xml_folder_path, files, archive)
+
+
+@app.post("/xmls_to_predict/{tenant}/{extraction_id}")
+@catch_exceptions
+async def to_predict_xml_files(
+    tenant, extraction_id, files: list[UploadFile] = File(None), archive: UploadFile = File(None)
+) -> list[XmlUploadStatus]:
+    extraction_identifier = ExtractionIdentifier(run_name=tenant, extraction_name=extraction_id, output_path=DATA_PATH)
+    xml_folder_path = XmlFile(extraction_identifier=extraction_identifier, to_train=False).xml_folder_path
+    return await save_upload_files(xml_folder_path, files, archive)
+
+
 @app.post("/labeled_data")
 @catch_exceptions
 async def labeled_data_post(labeled_data: LabeledData):
@@ -95,37 +142,141 @@ async def labeled_data_post(labeled_data: LabeledData):
     extraction_identifier = ExtractionIdentifier(
         run_name=labeled_data.tenant, extraction_name=labeled_data.id, output_path=DATA_PATH
     )
-    app.persistence_repository.save_labeled_data(extraction_identifier, labeled_data)
+    app.extractors_usage_recorder.record(extraction_identifier)
+    await app.persistence_repository.save_labeled_data(extraction_identifier, labeled_data)
     return "labeled data saved"
 
 
+@app.post("/labeled_data/bulk")
+@catch_exceptions
+async def labeled_data_bulk_post(request: Request) -> BulkIngestionResult:
+    bulk_ingestion = BulkIngestion(LabeledData, save_labeled_data_list, LabeledData.scale_down_labels)
+    return await bulk_ingestion.ingest(request)
+
+
+async def save_labeled_data_list(extraction_identifier: ExtractionIdentifier, labeled_data_list: list[LabeledData]):
+    app.extractors_usage_recorder.record(extraction_identifier)
+    await app.persistence_repository.save_labeled_data_list(extraction_identifier, labeled_data_list)
+
+
 @app.post("/prediction_data")
 @catch_exceptions
 async def prediction_data_post(prediction_data: PredictionData):
     extraction_identifier = ExtractionIdentifier(
         run_name=prediction_data.tenant, extraction_name=prediction_data.id, output_path=DATA_PATH
     )
-    app.persistence_repository.save_prediction_data(extraction_identifier, prediction_data)
+    app.extractors_usage_recorder.record(extraction_identifier)
+    await app.persistence_repository.save_prediction_data(extraction_identifier, prediction_data)
+    app.document_pre_parser.pre_parse(extraction_identifier, [prediction_data])
     return "prediction data saved"
 
 
+@app.post("/prediction_data/bulk")
+@catch_exceptions
+async def prediction_data_bulk_post(request: Request) -> BulkIngestionResult:
+    bulk_ingestion = BulkIngestion(PredictionData, save_and_pre_parse_prediction_data_list)
+    return await bulk_ingestion.ingest(request)
+
+
+async def save_and_pre_parse_prediction_data_list(
+    extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+):
+    app.extractors_usage_recorder.record(extraction_identifier)
+    try:
+        await app.persistence_repository.save_prediction_data_list(extraction_identifier, prediction_data_list)
+    except BulkWriteError as bulk_write_error:
+        failed_indexes = {write_error["index"] for write_error in bulk_write_error.details.get("writeErrors", list())}
+        saved_prediction_data_list = [x for index, x in enumerate(prediction_data_list) if index not in failed_indexes]
+        app.document_pre_parser.pre_parse(extraction_identifier, saved_prediction_data_list)
+        raise
+
+    app.document_pre_parser.pre_parse(extraction_identifier, prediction_data_list)
+
+
 @app.get("/get_suggestions/{run_name}/{extraction_name}")
 @catch_exceptions
 async def get_suggestions(run_name: str, extraction_name: str):
     extraction_identifier = ExtractionIdentifier(run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH)
-    suggestions = app.persistence_repository.load_suggestions(extraction_identifier)
+    suggestions = await app.persistence_repository.load_suggestions(extraction_identifier)
     suggestions_list = [x.scale_up().to_output() for x in suggestions]
     send_logs(extraction_identifier, f"{len(suggestions_list)} suggestions queried")
 
     return json.dumps(suggestions_list)
 
 
+@app.get("/get_suggestions/{run_name}/{extraction_name}/page")
+@catch_exceptions
+async def get_suggestions_page(
+    run_name: str,
+    extraction_name: str,
+    after: str = Query(None, pattern="^[0-9a-f]{24}$"),
+    page_size: int = SUGGESTIONS_PAGE_SIZE,
+):
+    extraction_identifier = ExtractionIdentifier(run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH)
+    if after:
+        await app.persistence_repository.delete_suggestions_until(extraction_identifier, after)
+
+    page = await app.persistence_repository.load_suggestions_page(extraction_identifier, after, page_size)
+    send_logs(extraction_identifier, f"{len(page)} suggestions queried in page")
+
+    suggestions_list = [suggestion.scale_up().to_output() for _, suggestion in page]
+    next_page = page[-1][0] if page else None
+    return Response(orjson.dumps({"suggestions": suggestions_list, "next_page": next_page}), media_type="application/json")
+
+
+@app.get("/get_suggestions/{run_name}/{extraction_name}/stream")
+@catch_exceptions
+async def get_suggestions_stream(run_name: str, extraction_name: str):
+    extraction_identifier = ExtractionIdentifier(run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH)
+    suggestions_lines = stream_suggestions(app.persistence_repository, extraction_identifier)
+    return StreamingResponse(suggestions_lines, media_type="application/x-ndjson")
+
+
+@app.post("/predict/{tenant}/{extraction_id}")
+@catch_exceptions
+async def predict(tenant: str, extraction_id: str, json_data: str = Form(...), file: UploadFile = File(...)):
+    extraction_identifier = ExtractionIdentifier(run_name=tenant, extraction_name=extraction_id, output_path=DATA_PATH)
+    xml_file_name = basename(file.filename)
+    temporary_xml_file = XmlFile(
+        extraction_identifier=extraction_identifier, to_train=False, xml_file_name=f".predict_{uuid4().hex}.xml"
+    )
+    prediction_data = PredictionData(**json.loads(json_data))
+    prediction_data = prediction_data.model_copy(
+        update={"tenant": tenant, "id": extraction_id, "xml_file_name": temporary_xml_file.xml_file_name}
+    )
+
+    try:
+        await save_upload_file(file, temporary_xml_file.xml_file_path)
+        suggestions = await app.inference_process.predict(extraction_identifier, prediction_data)
+    finally:
+        Path(temporary_xml_file.xml_file_path).unlink(missing_ok=True)
+
+    app.extractors_usage_recorder.record(extraction_identifier)
+    for suggestion in suggestions:
+        suggestion.xml_file_name = xml_file_name
+        suggestion.entity_name = prediction_data.entity_name if prediction_data.entity_name else xml_file_name
+
+    send_logs(extraction_identifier, f"{len(suggestions)} suggestions predicted")
+    return Response(orjson.dumps([x.scale_up().to_output() for x in suggestions]), media_type="application/json")
+
+
 @app.delete("/{run_name}/{extraction_name}")
 async def remove_extractor(run_name: str, extraction_name: str):
-    shutil.rmtree(join(DATA_PATH, run_name, extraction_name), ignore_errors=True)
+    extraction_identifier = ExtractionIdentifier(run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH)
+    await app.persistence_repository.save_extractor_deletion(extraction_identifier)
+    await run_in_threadpool(ExtractorsJanitor.move_to_trash, extraction_identifier)
     return True
 
 
+def get_cached_paragraphs_from_languages(
+    extractor_identifier: ExtractionIdentifier, xmls_segments: list[XmlSegments]
+) -> list[ParagraphsFromLanguage] | None:
+    try:
+        return ParagraphsCache.get(ParagraphsCache.get_key(extractor_identifier, xmls_segments))
+    except FileNotFoundError:
+        return None
+
+
 @app.post("/extract_paragraphs")
 @catch_exceptions
 async def extract_paragraphs(json_data: str = Form(...), xml_files: list[UploadFile] = File(...)):
@@ -137,25 +288,41 @@ async def extract_paragraphs(json_data: str = Form(...), xml_files: list[UploadF
 
     config_logger.info(f"extract_paragraphs endpoint called for {extractor_identifier.extraction_name}")
 
-    app.persistence_repository.save_paragraph_extraction_data(extractor_identifier, paragraph_extraction_data)
-
     for file in xml_files:
         xml_file = XmlFile(
             extraction_identifier=extractor_identifier,
             to_train=True,
             xml_file_name=file.filename,
         )
-        xml_file.save(file_content=file.file.read())
+        await save_upload_file(file, xml_file.xml_file_path)
 
     paragraph_extractor_task = ParagraphExtractorTask(
         task=PARAGRAPH_EXTRACTION_NAME,
         key=paragraph_extraction_data.key,
         xmls=[XML(**x.model_dump()) for x in paragraph_extraction_data.xmls_segments],
     )
+
+    paragraphs_from_languages = await run_in_threadpool(
+        get_cached_paragraphs_from_languages, extractor_identifier, paragraph_extraction_data.xmls_segments
+    )
+    if paragraphs_from_languages:
+        config_logger.info(f"Paragraphs loaded from the cache for {extractor_identifier.extraction_name}")
+        await app.persistence_repository.save_paragraphs_from_languages(extractor_identifier, paragraphs_from_languages)
+        results_message = ParagraphExtractionResultsMessage(
+            key=paragraph_extractor_task.key,
+            xmls=paragraph_extractor_task.xmls,
+            success=True,
+            error_message="",
+            data_url=f"{SERVICE_HOST}:{SERVICE_PORT}/get_paragraphs_translations/{paragraph_extractor_task.key}",
+        )
+        await run_in_threadpool(app.task_publisher.send_result, PARAGRAPH_EXTRACTION_NAME, results_message.model_dump())
+        return "ok"
+
+    await app.persistence_repository.save_paragraph_extraction_data(extractor_identifier, paragraph_extraction_data)
     config_logger.info(f"add task {paragraph_extractor_task.model_dump()}")
 
     task = paragraph_extractor_task.model_dump()
-    QueueProcessor(REDIS_HOST, REDIS_PORT, [PARAGRAPH_EXTRACTION_NAME]).send_message(task)
+    await run_in_threadpool(app.task_publisher.send_message, PARAGRAPH_EXTRACTION_NAME, task)
     return "ok"
 
 
@@ -165,6 +332,6 @@ async def get_paragraphs_translations(key: str) -> ParagraphsTranslations:
     extractor_identifier = ExtractionIdentifier(
         run_name=PARAGRAPH_EXTRACTION_NAME, extraction_name=key, output_path=DATA_PATH
     )
-    paragraphs_from_languages = app.persistence_repository.load_paragraphs_from_languages(extractor_identifier)
-    app.persistence_repository.delete_paragraphs_from_languages(extractor_identifier)
+    paragraphs_from_languages = await app.persistence_repository.load_paragraphs_from_languages(extractor_identifier)
+    await app.persistence_repository.delete_paragraphs_from_languages(extractor_identifier)
     return ParagraphsTranslations.from_paragraphs_from_languages(key, paragraphs_from_languages)
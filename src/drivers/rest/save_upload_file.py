@@ -0,0 +1,86 @@
+import tarfile
+import zipfile
+from os.path import join, basename
+from typing import BinaryIO, Iterator
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+
+from config import UPLOAD_CHUNK_SIZE
+from drivers.rest.XmlUploadStatus import XmlUploadStatus
+from use_cases.XmlFileWriter import XmlFileWriter
+
+
+async def save_upload_file(upload_file: UploadFile, file_path: str):
+    xml_file_writer = await run_in_threadpool(XmlFileWriter, file_path)
+    try:
+        while chunk := await upload_file.read(UPLOAD_CHUNK_SIZE):
+            await run_in_threadpool(xml_file_writer.write, chunk)
+        await run_in_threadpool(xml_file_writer.close)
+    except BaseException:
+        await run_in_threadpool(xml_file_writer.discard)
+        raise
+
+
+def save_stream(source: BinaryIO, file_path: str):
+    xml_file_writer = XmlFileWriter(file_path)
+    try:
+        while chunk := source.read(UPLOAD_CHUNK_SIZE):
+            xml_file_writer.write(chunk)
+        xml_file_writer.close()
+    except BaseException:
+        xml_file_writer.discard()
+        raise
+
+
+def get_archive_entries(archive: BinaryIO) -> Iterator[tuple[str, BinaryIO]]:
+    if zipfile.is_zipfile(archive):
+        archive.seek(0)
+        with zipfile.ZipFile(archive) as zip_file:
+            for zip_info in zip_file.infolist():
+                if not zip_info.is_dir():
+                    with zip_file.open(zip_info) as entry:
+                        yield zip_info.filename, entry
+        return
+
+    archive.seek(0)
+    with tarfile.open(fileobj=archive, mode="r|*") as tar_file:
+        for tar_info in tar_file:
+            if tar_info.isfile():
+                yield tar_info.name, tar_file.extractfile(tar_info)
+
+
+def save_archive(archive: BinaryIO, folder_path: str) -> list[XmlUploadStatus]:
+    uploads_status: list[XmlUploadStatus] = list()
+    for entry_name, entry in get_archive_entries(archive):
+        xml_file_name = basename(entry_name)
+        if not xml_file_name or xml_file_name.startswith("."):
+            continue
+        try:
+            save_stream(entry, join(folder_path, xml_file_name))
+            uploads_status.append(XmlUploadStatus(xml_file_name=xml_file_name, success=True))
+        except Exception as exception:
+            uploads_status.append(XmlUploadStatus(xml_file_name=xml_file_name, success=False, error_message=str(exception)))
+
+    return uploads_status
+
+
+async def save_upload_files(
+    folder_path: str, files: list[UploadFile] = None, archive: UploadFile = None
+) -> list[XmlUploadStatus]:
+    uploads_status: list[XmlUploadStatus] = list()
+    for file in files or list():
+        xml_file_name = basename(file.filename or "")
+        if not xml_file_name:
+            uploads_status.append(XmlUploadStatus(xml_file_name="", success=False, error_message="Missing file name"))
+            continue
+        try:
+            await save_upload_file(file, join(folder_path, xml_file_name))
+            uploads_status.append(XmlUploadStatus(xml_file_name=xml_file_name, success=True))
+        except Exception as exception:
+            uploads_status.append(XmlUploadStatus(xml_file_name=xml_file_name, success=False, error_message=str(exception)))
+
+    if archive:
+        uploads_status.extend(await run_in_threadpool(save_archive, archive.file, folder_path))
+
+    return uploads_status
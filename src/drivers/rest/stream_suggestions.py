@@ -0,0 +1,29 @@
+from typing import AsyncIterator
+
+import orjson
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.Suggestion import Suggestion
+from trainable_entity_extractor.send_logs import send_logs
+
+from config import SUGGESTIONS_PAGE_SIZE
+from ports.AsyncPersistenceRepository import AsyncPersistenceRepository
+
+
+def suggestions_to_ndjson(suggestions: list[Suggestion]) -> bytes:
+    return b"".join([orjson.dumps(suggestion.scale_up().to_output()) + b"\n" for suggestion in suggestions])
+
+
+async def stream_suggestions(
+    persistence_repository: AsyncPersistenceRepository, extraction_identifier: ExtractionIdentifier
+) -> AsyncIterator[bytes]:
+    suggestions_count = 0
+    after_suggestion_id = None
+    while page := await persistence_repository.load_suggestions_page(
+        extraction_identifier, after_suggestion_id, SUGGESTIONS_PAGE_SIZE
+    ):
+        yield suggestions_to_ndjson([suggestion for _, suggestion in page])
+        after_suggestion_id = page[-1][0]
+        suggestions_count += len(page)
+        await persistence_repository.delete_suggestions_until(extraction_identifier, after_suggestion_id)
+
+    send_logs(extraction_identifier, f"{suggestions_count} suggestions streamed")
@@ -0,0 +1,24 @@
+import sys
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+
+
+def migrate_mongo_indexes(check_only: bool) -> bool:
+    persistence_repository = MongoPersistenceRepository()
+    if check_only:
+        missing_indexes = persistence_repository.get_missing_indexes()
+    else:
+        missing_indexes = persistence_repository.create_indexes()
+    persistence_repository.close()
+
+    for missing_index in missing_indexes:
+        print("Missing index", missing_index)
+
+    if not missing_indexes:
+        print("All mongo indexes are created")
+
+    return not missing_indexes
+
+
+if __name__ == "__main__":
+    sys.exit(0 if migrate_mongo_indexes(check_only="--check" in sys.argv) else 1)
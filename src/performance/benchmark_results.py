@@ -0,0 +1,33 @@
+import json
+from os.path import join
+from pathlib import Path
+from statistics import median
+
+from config import APP_PATH
+
+RESULTS_PATH = join(APP_PATH, "performance", "results")
+
+
+def percentile(values: list[float], percent: float) -> float:
+    if not values:
+        return 0
+    sorted_values = sorted(values)
+    index = min(len(sorted_values) - 1, round(percent / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def latency_summary(latencies: list[float]) -> dict[str, float]:
+    return {
+        "count": len(latencies),
+        "p50_ms": round(1000 * median(latencies), 2) if latencies else 0,
+        "p99_ms": round(1000 * percentile(latencies, 99), 2),
+        "max_ms": round(1000 * max(latencies), 2) if latencies else 0,
+    }
+
+
+def save_results(benchmark_name: str, results: dict):
+    Path(RESULTS_PATH).mkdir(parents=True, exist_ok=True)
+    results_path = join(RESULTS_PATH, f"{benchmark_name}.json")
+    Path(results_path).write_text(json.dumps(results, indent=4))
+    print(json.dumps(results, indent=4))
+    print(f"Results saved in {results_path}")
@@ -0,0 +1,71 @@
+import json
+from time import time
+
+import requests
+
+from config import SERVICE_HOST, SERVICE_PORT
+from performance.benchmark_results import save_results
+
+SERVER_URL = f"{SERVICE_HOST}:{SERVICE_PORT}"
+TENANT = "bulk_ingestion_benchmark"
+RECORDS_COUNT = 20000
+SINGLE_RECORDS_COUNT = 1000
+
+
+def get_labeled_data(index: int) -> dict:
+    return {
+        "tenant": TENANT,
+        "id": "labeled_data",
+        "xml_file_name": f"document_{index}.xml",
+        "language_iso": "en",
+        "label_text": f"text {index}",
+        "page_width": 612,
+        "page_height": 792,
+        "xml_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}] * 20,
+        "label_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}],
+    }
+
+
+def get_prediction_data(index: int) -> dict:
+    return {
+        "tenant": TENANT,
+        "id": "prediction_data",
+        "xml_file_name": f"document_{index}.xml",
+        "page_width": 612,
+        "page_height": 792,
+        "xml_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}] * 20,
+    }
+
+
+def single_records_per_second(endpoint: str, get_record) -> float:
+    start = time()
+    for index in range(SINGLE_RECORDS_COUNT):
+        requests.post(f"{SERVER_URL}/{endpoint}", json=get_record(index))
+    return SINGLE_RECORDS_COUNT / (time() - start)
+
+
+def bulk_records_per_second(endpoint: str, get_record) -> float:
+    lines = (f"{json.dumps(get_record(index))}\n".encode() for index in range(RECORDS_COUNT))
+    start = time()
+    response = requests.post(f"{SERVER_URL}/{endpoint}/bulk", data=lines, headers={"Content-Type": "application/x-ndjson"})
+    elapsed = time() - start
+    print(f"{endpoint}/bulk saved {response.json()['saved']} records")
+    return RECORDS_COUNT / elapsed
+
+
+def run():
+    results = dict()
+    for endpoint, get_record in [("labeled_data", get_labeled_data), ("prediction_data", get_prediction_data)]:
+        single = single_records_per_second(endpoint, get_record)
+        bulk = bulk_records_per_second(endpoint, get_record)
+        results[endpoint] = {
+            "single_records_per_second": round(single, 2),
+            "bulk_records_per_second": round(bulk, 2),
+            "speedup": round(bulk / single, 2),
+        }
+
+    save_results("bulk_ingestion", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,99 @@
+from time import time
+
+import mongomock
+import pymongo
+from bson import ObjectId
+from pymongo.errors import ServerSelectionTimeoutError
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import DATA_PATH, MONGO_HOST, MONGO_PORT
+from performance.benchmark_results import save_results
+
+TENANT = "bulk_persistence_benchmark"
+EXTRACTION_ID = "extraction_id"
+SUGGESTIONS_COUNT = 10000
+
+
+def get_suggestions() -> list[Suggestion]:
+    return [
+        Suggestion(tenant=TENANT, id=EXTRACTION_ID, xml_file_name=f"{index}.xml", entity_name=f"{index}.xml", text="text")
+        for index in range(SUGGESTIONS_COUNT)
+    ]
+
+
+def save_prediction_data(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    prediction_data_list = [
+        PredictionData(tenant=TENANT, id=EXTRACTION_ID, xml_file_name=f"{index}.xml") for index in range(SUGGESTIONS_COUNT)
+    ]
+    persistence_repository.save_prediction_data_list(extraction_identifier, prediction_data_list)
+
+
+def get_prediction_data_ids(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    watermark = persistence_repository.load_prediction_data_watermark(extraction_identifier)
+    page = persistence_repository.load_prediction_data_page(extraction_identifier, None, watermark, SUGGESTIONS_COUNT)
+    return [prediction_data_id for prediction_data_id, _ in page]
+
+
+def save_one_by_one(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    prediction_data_ids = get_prediction_data_ids(persistence_repository, extraction_identifier)
+    for suggestion, prediction_data_id in zip(get_suggestions(), prediction_data_ids):
+        persistence_repository.save_data(extraction_identifier, suggestion, "suggestions")
+        persistence_repository.mongo_db.prediction_data.delete_one({"_id": ObjectId(prediction_data_id)})
+
+
+def save_in_bulk(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    prediction_data_ids = get_prediction_data_ids(persistence_repository, extraction_identifier)
+    persistence_repository.save_suggestions(extraction_identifier, get_suggestions())
+    persistence_repository.delete_prediction_data_ids(extraction_identifier, prediction_data_ids)
+
+
+def get_seconds(save_function) -> float:
+    persistence_repository = MongoPersistenceRepository()
+    extraction_identifier = ExtractionIdentifier(run_name=TENANT, extraction_name=EXTRACTION_ID, output_path=DATA_PATH)
+    save_prediction_data(persistence_repository, extraction_identifier)
+
+    start = time()
+    save_function(persistence_repository, extraction_identifier)
+    seconds = round(time() - start, 3)
+
+    for collection_name in ["suggestions", "prediction_data"]:
+        persistence_repository.mongo_db[collection_name].delete_many(
+            persistence_repository.get_filter(extraction_identifier)
+        )
+    persistence_repository.close()
+    return seconds
+
+
+def get_results() -> dict[str, float]:
+    return {"one_by_one_seconds": get_seconds(save_one_by_one), "bulk_seconds": get_seconds(save_in_bulk)}
+
+
+def is_mongod_running() -> bool:
+    mongo_client = pymongo.MongoClient(f"{MONGO_HOST}:{MONGO_PORT}", serverSelectionTimeoutMS=2000)
+    try:
+        mongo_client.admin.command("ping")
+        return True
+    except ServerSelectionTimeoutError:
+        return False
+    finally:
+        mongo_client.close()
+
+
+def run():
+    results = {"suggestions": SUGGESTIONS_COUNT}
+    if is_mongod_running():
+        results["mongod"] = get_results()
+    else:
+        print(f"No mongod at {MONGO_HOST}:{MONGO_PORT}, measuring only mongomock")
+
+    with mongomock.patch(servers=[f"{MONGO_HOST}:{MONGO_PORT}"]):
+        results["mongomock"] = get_results()
+
+    save_results("bulk_persistence", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,63 @@
+import io
+import tarfile
+from pathlib import Path
+from time import time
+
+import requests
+
+from config import APP_PATH, SERVICE_HOST, SERVICE_PORT
+from performance.benchmark_results import save_results
+
+SERVER_URL = f"{SERVICE_HOST}:{SERVICE_PORT}"
+TENANT = "bulk_upload_benchmark"
+FILES_COUNT = 1000
+MULTIPART_BATCH_SIZE = 100
+
+
+def single_file_uploads(xml_content: bytes) -> float:
+    start = time()
+    for index in range(FILES_COUNT):
+        files = {"file": (f"document_{index}.xml", xml_content)}
+        requests.post(f"{SERVER_URL}/xml_to_train/{TENANT}/single_file", files=files)
+    return FILES_COUNT / (time() - start)
+
+
+def multipart_list_uploads(xml_content: bytes) -> float:
+    start = time()
+    for batch_start in range(0, FILES_COUNT, MULTIPART_BATCH_SIZE):
+        batch_indexes = range(batch_start, min(FILES_COUNT, batch_start + MULTIPART_BATCH_SIZE))
+        files = [("files", (f"document_{index}.xml", xml_content)) for index in batch_indexes]
+        requests.post(f"{SERVER_URL}/xmls_to_train/{TENANT}/multipart_list", files=files)
+    return FILES_COUNT / (time() - start)
+
+
+def archive_upload(xml_content: bytes) -> float:
+    start = time()
+    archive = io.BytesIO()
+    with tarfile.open(fileobj=archive, mode="w:gz") as tar_file:
+        for index in range(FILES_COUNT):
+            tar_info = tarfile.TarInfo(f"document_{index}.xml")
+            tar_info.size = len(xml_content)
+            tar_file.addfile(tar_info, io.BytesIO(xml_content))
+    files = {"archive": ("xmls.tar.gz", archive.getvalue())}
+    requests.post(f"{SERVER_URL}/xmls_to_train/{TENANT}/archive", files=files)
+    return FILES_COUNT / (time() - start)
+
+
+def run():
+    xml_content = Path(APP_PATH, "tests", "resources", "test_en.xml").read_bytes()
+    results = {
+        "files_count": FILES_COUNT,
+        "single_file_files_per_second": round(single_file_uploads(xml_content), 2),
+        "multipart_list_files_per_second": round(multipart_list_uploads(xml_content), 2),
+        "tar_archive_files_per_second": round(archive_upload(xml_content), 2),
+    }
+
+    for extraction_name in ["single_file", "multipart_list", "archive"]:
+        requests.delete(f"{SERVER_URL}/{TENANT}/{extraction_name}")
+
+    save_results("bulk_upload", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,121 @@
+import os
+import resource
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os.path import join
+from time import time
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.PredictionSample import PredictionSample
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+import use_cases.Extractor
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import APP_PATH, DATA_PATH
+from performance.benchmark_results import save_results
+from use_cases.Extractor import Extractor
+from use_cases.XmlFileWriter import XmlFileWriter
+
+TENANT = "chunked_prediction_benchmark"
+EXTRACTION_ID = "extraction_id"
+DOCUMENTS_COUNTS = [100, 1000, 10000, 50000]
+INSERT_BATCH_SIZE = 1000
+
+
+class StandInModel:
+    def __init__(self, extraction_identifier: ExtractionIdentifier):
+        self.extraction_identifier = extraction_identifier
+
+    def predict(self, prediction_samples: list[PredictionSample]) -> list[Suggestion]:
+        return [
+            Suggestion(
+                tenant=self.extraction_identifier.run_name,
+                id=self.extraction_identifier.extraction_name,
+                xml_file_name=prediction_sample.entity_name,
+                entity_name=prediction_sample.entity_name,
+                text="text",
+            )
+            for prediction_sample in prediction_samples
+        ]
+
+
+def save_documents(extraction_identifier: ExtractionIdentifier, documents_count: int):
+    with open(
+        join(APP_PATH, "tests", "resources", "tenant_test", "extraction_id", "xml_to_predict", "test.xml"), "rb"
+    ) as file:
+        xml_content = file.read()
+
+    persistence_repository = MongoPersistenceRepository()
+    segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_number=1)
+    xml_folder_path = XmlFile(extraction_identifier=extraction_identifier, to_train=False).xml_folder_path
+    os.makedirs(xml_folder_path, exist_ok=True)
+    for batch_start in range(0, documents_count, INSERT_BATCH_SIZE):
+        prediction_data_list = list()
+        for index in range(batch_start, min(documents_count, batch_start + INSERT_BATCH_SIZE)):
+            xml_file_writer = XmlFileWriter(join(xml_folder_path, f"document_{index}.xml"))
+            xml_file_writer.write(xml_content)
+            xml_file_writer.close()
+            prediction_data_list.append(
+                PredictionData(
+                    tenant=TENANT,
+                    id=EXTRACTION_ID,
+                    xml_file_name=f"document_{index}.xml",
+                    page_width=612,
+                    page_height=792,
+                    xml_segments_boxes=[segment_box],
+                )
+            )
+        persistence_repository.save_prediction_data_list(extraction_identifier, prediction_data_list)
+
+    persistence_repository.close()
+
+
+def calculate_suggestions(documents_count: int, prediction_batch_size: int | None) -> dict:
+    if prediction_batch_size:
+        use_cases.Extractor.PREDICTION_BATCH_SIZE = prediction_batch_size
+    else:
+        use_cases.Extractor.PREDICTION_BATCH_SIZE = documents_count
+
+    extraction_identifier = ExtractionIdentifier(run_name=TENANT, extraction_name=EXTRACTION_ID, output_path=DATA_PATH)
+    save_documents(extraction_identifier, documents_count)
+    Extractor.predict = lambda extractor, samples: StandInModel(extractor.extraction_identifier).predict(samples)
+
+    persistence_repository = MongoPersistenceRepository()
+    start_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    start = time()
+    Extractor(extraction_identifier, persistence_repository).calculate_suggestions()
+    seconds = time() - start
+    peak_rss_mb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+    persistence_repository.mongo_db.suggestions.delete_many(persistence_repository.get_filter(extraction_identifier))
+    persistence_repository.close()
+    shutil.rmtree(join(DATA_PATH, TENANT), ignore_errors=True)
+    return {
+        "seconds": round(seconds, 2),
+        "peak_rss_mb": round(peak_rss_mb, 1),
+        "peak_rss_increase_mb": round(peak_rss_mb - start_rss_mb, 1),
+    }
+
+
+def run_in_new_process(documents_count: int, prediction_batch_size: int | None) -> dict:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(calculate_suggestions, documents_count, prediction_batch_size).result()
+
+
+def run():
+    results = {"prediction_batch_size": use_cases.Extractor.PREDICTION_BATCH_SIZE}
+    for documents_count in DOCUMENTS_COUNTS:
+        results[f"{documents_count}_documents"] = {
+            "batched": run_in_new_process(documents_count, use_cases.Extractor.PREDICTION_BATCH_SIZE),
+            "all_at_once": run_in_new_process(documents_count, None),
+        }
+
+    save_results("chunked_prediction", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,61 @@
+from time import time
+
+from queue_processor.QueueProcessor import QueueProcessor
+from rsmq import RedisSMQ
+
+from adapters.RedisTaskPublisher import RedisTaskPublisher
+from config import REDIS_HOST, REDIS_PORT
+from performance.benchmark_results import latency_summary, save_results
+
+QUEUE_NAME = "enqueue_latency_benchmark"
+MESSAGES_COUNT = 2000
+MESSAGE = {
+    "task": QUEUE_NAME,
+    "key": "key",
+    "xmls": [{"xml_file_name": "file.xml", "language": "en", "is_main_language": True}],
+}
+
+
+def queue_processor_latencies() -> list[float]:
+    latencies = list()
+    for _ in range(MESSAGES_COUNT):
+        start = time()
+        QueueProcessor(REDIS_HOST, REDIS_PORT, [QUEUE_NAME]).send_message(MESSAGE)
+        latencies.append(time() - start)
+    return latencies
+
+
+def task_publisher_latencies(task_publisher: RedisTaskPublisher) -> list[float]:
+    latencies = list()
+    for _ in range(MESSAGES_COUNT):
+        start = time()
+        task_publisher.send_message(QUEUE_NAME, MESSAGE)
+        latencies.append(time() - start)
+    return latencies
+
+
+def pipelined_seconds(task_publisher: RedisTaskPublisher) -> float:
+    start = time()
+    task_publisher.send_messages(QUEUE_NAME, [MESSAGE] * MESSAGES_COUNT)
+    return time() - start
+
+
+def delete_queue():
+    RedisSMQ(host=REDIS_HOST, port=REDIS_PORT, qname=f"{QUEUE_NAME}_tasks").deleteQueue().exceptions(False).execute()
+
+
+def run():
+    task_publisher = RedisTaskPublisher()
+    results = {
+        "messages_count": MESSAGES_COUNT,
+        "new_queue_processor_per_message": latency_summary(queue_processor_latencies()),
+        "pooled_task_publisher": latency_summary(task_publisher_latencies(task_publisher)),
+        "pipelined_seconds_per_message_ms": round(1000 * pipelined_seconds(task_publisher) / MESSAGES_COUNT, 4),
+    }
+    task_publisher.close()
+    delete_queue()
+    save_results("enqueue_latency", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,86 @@
+from time import time
+
+import pymongo
+import requests
+
+from config import MONGO_HOST, MONGO_PORT, SERVICE_HOST, SERVICE_PORT
+from performance.benchmark_results import save_results
+
+SERVER_URL = f"{SERVICE_HOST}:{SERVICE_PORT}"
+TENANT = "get_suggestions_benchmark"
+EXTRACTION_ID = "extraction_id"
+SUGGESTIONS_COUNT = 50000
+
+
+def insert_suggestions():
+    mongo_client = pymongo.MongoClient(f"{MONGO_HOST}:{MONGO_PORT}")
+    suggestion = {
+        "run_name": TENANT,
+        "extraction_name": EXTRACTION_ID,
+        "tenant": TENANT,
+        "id": EXTRACTION_ID,
+        "text": "text predicted",
+        "segment_text": "segment text " * 20,
+        "page_number": 1,
+        "segments_boxes": [{"left": 1, "top": 2, "width": 3, "height": 4, "page_number": 1}] * 5,
+    }
+    documents = [{**suggestion, "xml_file_name": f"document_{index}.xml"} for index in range(SUGGESTIONS_COUNT)]
+    mongo_client.pdf_metadata_extraction.suggestions.insert_many(documents)
+    mongo_client.close()
+
+
+def get_full_list() -> dict:
+    insert_suggestions()
+    start = time()
+    response = requests.get(f"{SERVER_URL}/get_suggestions/{TENANT}/{EXTRACTION_ID}")
+    return {"seconds": round(time() - start, 2), "response_mb": round(len(response.content) / 1024 / 1024, 2)}
+
+
+def get_stream() -> dict:
+    insert_suggestions()
+    start = time()
+    first_line_seconds = None
+    lines_count = 0
+    with requests.get(f"{SERVER_URL}/get_suggestions/{TENANT}/{EXTRACTION_ID}/stream", stream=True) as response:
+        for line in response.iter_lines():
+            if line and first_line_seconds is None:
+                first_line_seconds = time() - start
+            lines_count += 1 if line else 0
+
+    return {
+        "seconds": round(time() - start, 2),
+        "first_suggestion_seconds": round(first_line_seconds, 3),
+        "suggestions": lines_count,
+    }
+
+
+def get_pages() -> dict:
+    insert_suggestions()
+    start = time()
+    pages_count = 0
+    next_page = None
+    while True:
+        url = f"{SERVER_URL}/get_suggestions/{TENANT}/{EXTRACTION_ID}/page" + (f"?after={next_page}" if next_page else "")
+        page = requests.get(url).json()
+        if not page["suggestions"]:
+            break
+        pages_count += 1
+        next_page = page["next_page"]
+
+    return {"seconds": round(time() - start, 2), "pages": pages_count}
+
+
+def run():
+    save_results(
+        "get_suggestions",
+        {
+            "suggestions_count": SUGGESTIONS_COUNT,
+            "full_list": get_full_list(),
+            "ndjson_stream": get_stream(),
+            "cursor_pages": get_pages(),
+        },
+    )
+
+
+if __name__ == "__main__":
+    run()
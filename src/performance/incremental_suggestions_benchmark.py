@@ -0,0 +1,65 @@
+from time import time
+
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import DATA_PATH
+from performance.benchmark_results import save_results
+
+TENANT = "incremental_suggestions_benchmark"
+EXTRACTION_ID = "extraction_id"
+RUNS = 20
+PREDICTION_DATA_PER_RUN = 500
+
+
+def get_prediction_data_list(run: int) -> list[PredictionData]:
+    segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_number=1)
+    return [
+        PredictionData(
+            tenant=TENANT,
+            id=EXTRACTION_ID,
+            xml_file_name=f"document_{run}_{index}.xml",
+            page_width=612,
+            page_height=792,
+            xml_segments_boxes=[segment_box] * 20,
+        )
+        for index in range(PREDICTION_DATA_PER_RUN)
+    ]
+
+
+def run_seconds(persistence_repository: MongoPersistenceRepository, consume: bool) -> list[float]:
+    extraction_identifier = ExtractionIdentifier(run_name=TENANT, extraction_name=EXTRACTION_ID, output_path=DATA_PATH)
+    persistence_repository.mongo_db.prediction_data.delete_many(persistence_repository.get_filter(extraction_identifier))
+
+    runs_seconds = list()
+    for run in range(RUNS):
+        persistence_repository.save_prediction_data_list(extraction_identifier, get_prediction_data_list(run))
+
+        start = time()
+        watermark = persistence_repository.load_prediction_data_watermark(extraction_identifier)
+        page = persistence_repository.load_prediction_data_page(
+            extraction_identifier, None, watermark, RUNS * PREDICTION_DATA_PER_RUN
+        )
+        if consume:
+            persistence_repository.delete_prediction_data_ids(extraction_identifier, [x for x, _ in page])
+        runs_seconds.append(round(time() - start, 3))
+
+    persistence_repository.mongo_db.prediction_data.delete_many(persistence_repository.get_filter(extraction_identifier))
+    return runs_seconds
+
+
+def run():
+    persistence_repository = MongoPersistenceRepository()
+    results = {
+        "prediction_data_per_run": PREDICTION_DATA_PER_RUN,
+        "consumed_runs_seconds": run_seconds(persistence_repository, consume=True),
+        "never_consumed_runs_seconds": run_seconds(persistence_repository, consume=False),
+    }
+    persistence_repository.close()
+    save_results("incremental_suggestions", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,73 @@
+from concurrent.futures import ThreadPoolExecutor
+from itertools import cycle
+from time import time
+
+import requests
+
+from config import SERVICE_HOST, SERVICE_PORT
+from performance.benchmark_results import latency_summary, save_results
+
+SERVER_URL = f"{SERVICE_HOST}:{SERVICE_PORT}"
+TENANT = "mixed_traffic_benchmark"
+REQUESTS_COUNT = 3000
+CONCURRENCY_LEVELS = [1, 8, 32, 64]
+
+LABELED_DATA = {
+    "tenant": TENANT,
+    "id": "extraction_id",
+    "xml_file_name": "document.xml",
+    "language_iso": "en",
+    "label_text": "text",
+    "page_width": 612,
+    "page_height": 792,
+    "xml_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}] * 20,
+    "label_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}],
+}
+
+PREDICTION_DATA = {
+    "tenant": TENANT,
+    "id": "extraction_id",
+    "xml_file_name": "document.xml",
+    "page_width": 612,
+    "page_height": 792,
+    "xml_segments_boxes": [{"left": 124, "top": 48, "width": 83, "height": 13, "page_number": 1}] * 20,
+}
+
+
+def post_labeled_data(session: requests.Session):
+    session.post(f"{SERVER_URL}/labeled_data", json=LABELED_DATA)
+
+
+def post_prediction_data(session: requests.Session):
+    session.post(f"{SERVER_URL}/prediction_data", json=PREDICTION_DATA)
+
+
+def get_suggestions(session: requests.Session):
+    session.get(f"{SERVER_URL}/get_suggestions/{TENANT}/extraction_id")
+
+
+def timed_request(request_function) -> float:
+    start = time()
+    with requests.Session() as session:
+        request_function(session)
+    return time() - start
+
+
+def run_concurrency_level(concurrency: int) -> dict:
+    request_functions = cycle([post_labeled_data, post_prediction_data, get_suggestions])
+    requests_functions = [next(request_functions) for _ in range(REQUESTS_COUNT)]
+    start = time()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        latencies = list(executor.map(timed_request, requests_functions))
+    elapsed = time() - start
+    return {"requests_per_second": round(REQUESTS_COUNT / elapsed, 2), "latency": latency_summary(latencies)}
+
+
+def run():
+    results = {f"concurrency_{concurrency}": run_concurrency_level(concurrency) for concurrency in CONCURRENCY_LEVELS}
+    requests.delete(f"{SERVER_URL}/{TENANT}/extraction_id")
+    save_results("mixed_traffic", results)
+
+
+if __name__ == "__main__":
+    run()
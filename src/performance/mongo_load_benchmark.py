@@ -0,0 +1,71 @@
+from time import time
+
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import DATA_PATH
+from performance.benchmark_results import save_results
+
+TENANT = "mongo_load_benchmark"
+EXTRACTION_ID = "extraction_id"
+DOCUMENTS_COUNT = 100000
+SEGMENTS_PER_DOCUMENT = 20
+
+
+def save_documents(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_width=612, page_height=792, page_number=1)
+    prediction_data_list = [
+        PredictionData(
+            tenant=TENANT,
+            id=EXTRACTION_ID,
+            xml_file_name=f"document_{index}.xml",
+            page_width=612,
+            page_height=792,
+            xml_segments_boxes=[segment_box] * SEGMENTS_PER_DOCUMENT,
+        )
+        for index in range(DOCUMENTS_COUNT)
+    ]
+    persistence_repository.save_prediction_data_list(extraction_identifier, prediction_data_list)
+
+
+def load_full_documents(persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier):
+    documents = persistence_repository.mongo_db.prediction_data.find(
+        persistence_repository.get_filter(extraction_identifier)
+    )
+    return [PredictionData(**document) for document in documents]
+
+
+def load_projected_documents(
+    persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier
+):
+    return persistence_repository.load_prediction_data(extraction_identifier)
+
+
+def get_seconds(load_function, persistence_repository, extraction_identifier) -> float:
+    start = time()
+    load_function(persistence_repository, extraction_identifier)
+    return round(time() - start, 3)
+
+
+def run():
+    persistence_repository = MongoPersistenceRepository()
+    extraction_identifier = ExtractionIdentifier(run_name=TENANT, extraction_name=EXTRACTION_ID, output_path=DATA_PATH)
+    persistence_repository.mongo_db.prediction_data.delete_many(persistence_repository.get_filter(extraction_identifier))
+    save_documents(persistence_repository, extraction_identifier)
+
+    results = {
+        "documents": DOCUMENTS_COUNT,
+        "segments_per_document": SEGMENTS_PER_DOCUMENT,
+        "full_documents_seconds": get_seconds(load_full_documents, persistence_repository, extraction_identifier),
+        "projected_documents_seconds": get_seconds(load_projected_documents, persistence_repository, extraction_identifier),
+    }
+
+    persistence_repository.mongo_db.prediction_data.delete_many(persistence_repository.get_filter(extraction_identifier))
+    persistence_repository.close()
+    save_results("mongo_load", results)
+
+
+if __name__ == "__main__":
+    run()
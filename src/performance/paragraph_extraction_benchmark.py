@@ -0,0 +1,98 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os.path import join
+from time import time
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import APP_PATH, DATA_PATH, PDF_DATA_CACHE_MAX_BYTES, PARAGRAPH_EXTRACTION_NAME
+from domain.ParagraphExtractionData import ParagraphExtractionData, XmlSegments
+from performance.benchmark_results import save_results
+from use_cases.DiskCache import DiskCache
+from use_cases.DocumentsParser import DocumentsParser
+from use_cases.Extractor import Extractor
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlFileWriter import XmlFileWriter
+
+KEY = "paragraph_extraction_benchmark"
+LANGUAGES_COUNTS = [2, 6, 10]
+
+
+def save_paragraph_extraction_data(
+    persistence_repository: MongoPersistenceRepository, extraction_identifier: ExtractionIdentifier, languages_count: int
+):
+    segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_number=1)
+    xml_folder_path = XmlFile(extraction_identifier=extraction_identifier, to_train=True).xml_folder_path
+    os.makedirs(xml_folder_path, exist_ok=True)
+    xmls_segments = list()
+    for index in range(languages_count):
+        resource_name = "test_en.xml" if index % 2 else "test_fr.xml"
+        with open(join(APP_PATH, "tests", "resources", resource_name), "rb") as file:
+            xml_file_writer = XmlFileWriter(join(xml_folder_path, f"language_{index}.xml"))
+            xml_file_writer.write(file.read())
+            xml_file_writer.close()
+
+        xml_segments = XmlSegments(
+            xml_file_name=f"language_{index}.xml",
+            language=f"language_{index}",
+            is_main_language=index == 0,
+            xml_segments_boxes=[segment_box],
+        )
+        xmls_segments.append(xml_segments)
+
+    paragraph_extraction_data = ParagraphExtractionData(key=KEY, xmls_segments=xmls_segments)
+    persistence_repository.save_paragraph_extraction_data(extraction_identifier, paragraph_extraction_data)
+
+
+def extract_paragraphs(languages_count: int, workers: int) -> float:
+    DocumentsParser.workers = workers
+    PdfDataCache.disk_cache = DiskCache(join(DATA_PATH, PARAGRAPH_EXTRACTION_NAME, KEY, "cache"), PDF_DATA_CACHE_MAX_BYTES)
+    extraction_identifier = ExtractionIdentifier(
+        run_name=PARAGRAPH_EXTRACTION_NAME, extraction_name=KEY, output_path=DATA_PATH
+    )
+    persistence_repository = MongoPersistenceRepository()
+    save_paragraph_extraction_data(persistence_repository, extraction_identifier, languages_count)
+
+    if workers > 1:
+        DocumentsParser.get_executor().submit(int).result()
+
+    start = time()
+    Extractor(extraction_identifier, persistence_repository).save_paragraphs_from_languages()
+    seconds = time() - start
+
+    DocumentsParser.close()
+    for collection_name in ["paragraph_extraction_data", "paragraphs_from_languages"]:
+        persistence_repository.mongo_db[collection_name].delete_many(
+            persistence_repository.get_filter(extraction_identifier)
+        )
+    persistence_repository.close()
+    shutil.rmtree(extraction_identifier.get_path(), ignore_errors=True)
+    return round(seconds, 3)
+
+
+def run_in_new_process(languages_count: int, workers: int) -> float:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(extract_paragraphs, languages_count, workers).result()
+
+
+def run():
+    results = {"cpu_count": os.cpu_count(), "parse_workers": DocumentsParser.workers}
+    for languages_count in LANGUAGES_COUNTS:
+        serial_seconds = run_in_new_process(languages_count, 1)
+        parallel_seconds = run_in_new_process(languages_count, DocumentsParser.workers)
+        results[f"{languages_count}_languages"] = {
+            "serial_seconds": serial_seconds,
+            "parallel_seconds": parallel_seconds,
+            "speedup": round(serial_seconds / parallel_seconds, 2) if parallel_seconds else None,
+        }
+
+    save_results("paragraph_extraction", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,87 @@
+import os
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+from os.path import join
+from time import time
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+
+from config import APP_PATH, DATA_PATH, PDF_DATA_CACHE_MAX_BYTES
+from performance.benchmark_results import save_results
+from use_cases.DiskCache import DiskCache
+from use_cases.DocumentsParser import DocumentsParser
+from use_cases.Extractor import Extractor
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlFileWriter import XmlFileWriter
+
+TENANT = "parallel_parsing_benchmark"
+EXTRACTION_ID = "extraction_id"
+DOCUMENTS_COUNTS = [10, 100, 1000]
+WORKERS_COUNTS = sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def save_documents(extraction_identifier: ExtractionIdentifier, documents_count: int) -> list[PredictionData]:
+    with open(join(APP_PATH, "tests", "resources", "test_en.xml"), "rb") as file:
+        xml_content = file.read()
+
+    segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_number=1)
+    xml_folder_path = XmlFile(extraction_identifier=extraction_identifier, to_train=False).xml_folder_path
+    os.makedirs(xml_folder_path, exist_ok=True)
+    prediction_data_list = list()
+    for index in range(documents_count):
+        xml_file_writer = XmlFileWriter(join(xml_folder_path, f"document_{index}.xml"))
+        xml_file_writer.write(xml_content)
+        xml_file_writer.close()
+        prediction_data_list.append(
+            PredictionData(
+                tenant=TENANT,
+                id=EXTRACTION_ID,
+                xml_file_name=f"document_{index}.xml",
+                page_width=612,
+                page_height=792,
+                xml_segments_boxes=[segment_box],
+            )
+        )
+
+    return prediction_data_list
+
+
+def get_prediction_samples_seconds(documents_count: int, workers: int) -> float:
+    DocumentsParser.workers = workers
+    PdfDataCache.disk_cache = DiskCache(join(DATA_PATH, TENANT, "cache"), PDF_DATA_CACHE_MAX_BYTES)
+    extraction_identifier = ExtractionIdentifier(run_name=TENANT, extraction_name=EXTRACTION_ID, output_path=DATA_PATH)
+    prediction_data_list = save_documents(extraction_identifier, documents_count)
+
+    if workers > 1:
+        DocumentsParser.get_executor().submit(int).result()
+
+    start = time()
+    Extractor(extraction_identifier, None).get_prediction_samples(prediction_data_list)
+    seconds = time() - start
+
+    DocumentsParser.close()
+    shutil.rmtree(join(DATA_PATH, TENANT), ignore_errors=True)
+    return round(seconds, 3)
+
+
+def run_in_new_process(documents_count: int, workers: int) -> float:
+    with ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn")) as executor:
+        return executor.submit(get_prediction_samples_seconds, documents_count, workers).result()
+
+
+def run():
+    results = {"cpu_count": os.cpu_count()}
+    for documents_count in DOCUMENTS_COUNTS:
+        results[f"{documents_count}_documents"] = {
+            f"{workers}_workers_seconds": run_in_new_process(documents_count, workers) for workers in WORKERS_COUNTS
+        }
+
+    save_results("parallel_parsing", results)
+
+
+if __name__ == "__main__":
+    run()
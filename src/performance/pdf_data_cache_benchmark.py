@@ -0,0 +1,51 @@
+import os
+import shutil
+from os.path import join
+from time import time
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.SegmentationData import SegmentationData
+
+from config import DATA_PATH
+from performance.benchmark_results import save_results
+from performance.upload_concurrency_benchmark import get_large_xml
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlFileWriter import XmlFileWriter
+
+EXTRACTION_IDENTIFIER = ExtractionIdentifier(
+    run_name="pdf_data_cache_benchmark", extraction_name="extraction_id", output_path=DATA_PATH
+)
+SEGMENTATION_DATA = SegmentationData(page_width=0, page_height=0, xml_segments_boxes=[], label_segments_boxes=[])
+
+
+def parse_seconds(xml_file: XmlFile) -> float:
+    start = time()
+    PdfDataCache.from_xml_file(xml_file, SEGMENTATION_DATA)
+    return round(time() - start, 3)
+
+
+def run():
+    xml_file = XmlFile(extraction_identifier=EXTRACTION_IDENTIFIER, to_train=False, xml_file_name="large.xml")
+    os.makedirs(xml_file.xml_folder_path, exist_ok=True)
+    xml_file_writer = XmlFileWriter(xml_file.xml_file_path)
+    xml_file_writer.write(get_large_xml())
+    xml_file_writer.close()
+
+    cache_key = PdfDataCache.get_key(xml_file, SEGMENTATION_DATA)
+    if os.path.exists(PdfDataCache.disk_cache.get_cache_path(cache_key)):
+        os.remove(PdfDataCache.disk_cache.get_cache_path(cache_key))
+
+    results = {"cold_seconds": parse_seconds(xml_file), "memory_hit_seconds": parse_seconds(xml_file)}
+    PdfDataCache.memory_cache.clear()
+    PdfDataCache.memory_cache_bytes = 0
+    results["disk_hit_seconds"] = parse_seconds(xml_file)
+    results["cache_file_mb"] = round(os.path.getsize(PdfDataCache.disk_cache.get_cache_path(cache_key)) / 1024 / 1024, 2)
+    results["statistics"] = dict(PdfDataCache.statistics)
+
+    shutil.rmtree(join(DATA_PATH, EXTRACTION_IDENTIFIER.run_name), ignore_errors=True)
+    save_results("pdf_data_cache", results)
+
+
+if __name__ == "__main__":
+    run()
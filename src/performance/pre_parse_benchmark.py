@@ -0,0 +1,67 @@
+import shutil
+from os.path import join
+from time import time
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+
+from config import DATA_PATH, APP_PATH
+from performance.benchmark_results import save_results
+from performance.upload_concurrency_benchmark import get_large_xml
+from use_cases.DocumentPreParser import DocumentPreParser
+from use_cases.Extractor import Extractor
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlFileWriter import XmlFileWriter
+
+EXTRACTION_IDENTIFIER = ExtractionIdentifier(
+    run_name="pre_parse_benchmark", extraction_name="extraction_id", output_path=DATA_PATH
+)
+BLANK_XML_PATH = join(APP_PATH, "tests", "resources", "tenant_test", "extraction_id", "xml_to_predict", "blank.xml")
+
+
+def save_xml(xml_file_name: str, content: bytes) -> PredictionData:
+    xml_file = XmlFile(extraction_identifier=EXTRACTION_IDENTIFIER, to_train=False, xml_file_name=xml_file_name)
+    xml_file_writer = XmlFileWriter(xml_file.xml_file_path)
+    xml_file_writer.write(content)
+    xml_file_writer.close()
+    return PredictionData(
+        tenant=EXTRACTION_IDENTIFIER.run_name, id=EXTRACTION_IDENTIFIER.extraction_name, xml_file_name=xml_file_name
+    )
+
+
+def critical_path_seconds(prediction_data_list: list[PredictionData]) -> float:
+    PdfDataCache.memory_cache.clear()
+    PdfDataCache.memory_cache_bytes = 0
+    start = time()
+    Extractor(EXTRACTION_IDENTIFIER, None).get_prediction_samples(prediction_data_list)
+    return round(time() - start, 3)
+
+
+def run():
+    shutil.rmtree(join(DATA_PATH, EXTRACTION_IDENTIFIER.run_name), ignore_errors=True)
+    large_xml_content = get_large_xml()
+    cold_prediction_data = save_xml("cold.xml", large_xml_content + b"<!-- cold -->")
+    pre_parsed_prediction_data = save_xml("pre_parsed.xml", large_xml_content + b"<!-- pre parsed -->")
+    with open(BLANK_XML_PATH, "rb") as stream:
+        blank_prediction_data = save_xml("blank.xml", stream.read())
+
+    document_pre_parser = DocumentPreParser()
+    start = time()
+    document_pre_parser.pre_parse(EXTRACTION_IDENTIFIER, [pre_parsed_prediction_data]).result()
+    background_seconds = round(time() - start, 3)
+    document_pre_parser.close()
+
+    results = {
+        "cold_critical_path_seconds": critical_path_seconds([cold_prediction_data]),
+        "pre_parsed_critical_path_seconds": critical_path_seconds([pre_parsed_prediction_data]),
+        "background_pre_parse_seconds": background_seconds,
+        "blank_critical_path_seconds": critical_path_seconds([blank_prediction_data]),
+    }
+
+    shutil.rmtree(join(DATA_PATH, EXTRACTION_IDENTIFIER.run_name), ignore_errors=True)
+    save_results("pre_parse", results)
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,68 @@
+import json
+import threading
+from time import time, sleep
+
+import redis
+from rsmq import RedisSMQ
+
+from config import REDIS_HOST, REDIS_PORT
+from drivers.queues_processor.TaskDispatcher import TaskDispatcher
+from performance.benchmark_results import save_results
+
+QUEUE_NAME = "task_dispatcher_benchmark"
+TASKS_SECONDS = {"create_model": 4, "suggestions": 0.5, "paragraph_extraction": 1}
+MIXED_TASKS = ["create_model"] * 2 + ["suggestions"] * 24 + ["paragraph_extraction"] * 6
+
+
+def process(message: dict) -> dict:
+    end = time() + TASKS_SECONDS[message["task"]]
+    while time() < end:
+        pass
+    return {"task": message["task"], "success": True}
+
+
+def restart_condition(message: dict) -> bool:
+    return False
+
+
+def get_error_result(message: dict, error_message: str) -> dict:
+    return {"task": message["task"], "success": False}
+
+
+def get_results_count(results_queue: RedisSMQ) -> int:
+    return int(results_queue.getQueueAttributes().execute()["msgs"])
+
+
+def run_mixed_queue(workers: int) -> dict:
+    redis_client = redis.Redis(host=REDIS_HOST, port=REDIS_PORT, decode_responses=True)
+    tasks_queue = RedisSMQ(client=redis_client, qname=f"{QUEUE_NAME}_tasks", quiet=True)
+    results_queue = RedisSMQ(client=redis_client, qname=f"{QUEUE_NAME}_results", quiet=True)
+    for queue in [tasks_queue, results_queue]:
+        queue.deleteQueue().exceptions(False).execute()
+        queue.createQueue().exceptions(False).execute()
+
+    task_dispatcher = TaskDispatcher(REDIS_HOST, REDIS_PORT, [QUEUE_NAME], workers)
+    dispatcher_thread = threading.Thread(target=task_dispatcher.start, args=(process, restart_condition, get_error_result))
+    dispatcher_thread.start()
+    sleep(5)
+
+    start = time()
+    for task in MIXED_TASKS:
+        tasks_queue.sendMessage().message(json.dumps({"task": task})).execute()
+
+    while get_results_count(results_queue) < len(MIXED_TASKS):
+        sleep(0.1)
+
+    seconds = time() - start
+    task_dispatcher.stop()
+    dispatcher_thread.join()
+    return {"seconds": round(seconds, 2), "tasks_per_minute": round(60 * len(MIXED_TASKS) / seconds, 1)}
+
+
+def run():
+    results = {f"workers_{workers}": run_mixed_queue(workers) for workers in [1, 2, 4, 8]}
+    save_results("task_dispatcher", results)
+
+
+if __name__ == "__main__":
+    run()
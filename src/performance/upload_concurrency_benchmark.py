@@ -0,0 +1,78 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from time import time, sleep
+
+import requests
+
+from config import APP_PATH, SERVICE_HOST, SERVICE_PORT
+from performance.benchmark_results import latency_summary, save_results
+
+SERVER_URL = f"{SERVICE_HOST}:{SERVICE_PORT}"
+TENANT = "upload_benchmark"
+PARALLEL_UPLOADS = 50
+TARGET_FILE_SIZE = 30 * 1024 * 1024
+
+
+def get_large_xml() -> bytes:
+    xml_content = Path(APP_PATH, "tests", "resources", "test_en.xml").read_bytes()
+    pages_start = xml_content.index(b"<page ")
+    pages_end = xml_content.rindex(b"</page>") + len(b"</page>")
+    header, pages, footer = xml_content[:pages_start], xml_content[pages_start:pages_end], xml_content[pages_end:]
+    return header + pages * (TARGET_FILE_SIZE // len(pages) + 1) + footer
+
+
+def measure_info_latency(stop_event: threading.Event) -> list[float]:
+    latencies = list()
+    while not stop_event.is_set():
+        start = time()
+        requests.get(f"{SERVER_URL}/info")
+        latencies.append(time() - start)
+        sleep(0.05)
+    return latencies
+
+
+def upload(xml_content: bytes, index: int):
+    files = {"file": (f"document_{index}.xml", xml_content)}
+    requests.post(f"{SERVER_URL}/xml_to_train/{TENANT}/extraction_{index}", files=files)
+
+
+def info_latency_while(action) -> (list[float], float):
+    stop_event = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as latency_executor:
+        latencies_future = latency_executor.submit(measure_info_latency, stop_event)
+        start = time()
+        action()
+        elapsed = time() - start
+        stop_event.set()
+        return latencies_future.result(), elapsed
+
+
+def run():
+    xml_content = get_large_xml()
+
+    idle_latencies, _ = info_latency_while(lambda: sleep(5))
+
+    def parallel_uploads():
+        with ThreadPoolExecutor(max_workers=PARALLEL_UPLOADS) as executor:
+            list(executor.map(lambda index: upload(xml_content, index), range(PARALLEL_UPLOADS)))
+
+    uploading_latencies, uploads_time = info_latency_while(parallel_uploads)
+
+    for index in range(PARALLEL_UPLOADS):
+        requests.delete(f"{SERVER_URL}/{TENANT}/extraction_{index}")
+
+    save_results(
+        "upload_concurrency",
+        {
+            "parallel_uploads": PARALLEL_UPLOADS,
+            "file_size_mb": round(len(xml_content) / 1024 / 1024, 2),
+            "uploads_seconds": round(uploads_time, 2),
+            "info_latency_idle": latency_summary(idle_latencies),
+            "info_latency_during_uploads": latency_summary(uploading_latencies),
+        },
+    )
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,66 @@
+import os
+import shutil
+from os.path import join
+from time import time
+
+import zstandard
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PdfData import PdfData
+from trainable_entity_extractor.data.SegmentationData import SegmentationData
+
+from config import DATA_PATH
+from performance.benchmark_results import save_results
+from performance.upload_concurrency_benchmark import get_large_xml
+from use_cases.CompressedXml import CompressedXml
+from use_cases.XmlFileWriter import XmlFileWriter
+
+EXTRACTION_IDENTIFIER = ExtractionIdentifier(
+    run_name="xml_compression_benchmark", extraction_name="extraction_id", output_path=DATA_PATH
+)
+SEGMENTATION_DATA = SegmentationData(page_width=0, page_height=0, xml_segments_boxes=[], label_segments_boxes=[])
+
+
+def store(xml_file: XmlFile, content: bytes):
+    os.makedirs(xml_file.xml_folder_path, exist_ok=True)
+    with open(xml_file.xml_file_path, "wb") as stream:
+        stream.write(content)
+
+
+def parse_seconds(xml_file: XmlFile) -> float:
+    start = time()
+    with CompressedXml.readable_xml_file(xml_file) as readable_xml_file:
+        PdfData.from_xml_file(readable_xml_file, SEGMENTATION_DATA)
+    return time() - start
+
+
+def run():
+    xml_content = get_large_xml()
+    results = dict()
+
+    raw_xml_file = XmlFile(extraction_identifier=EXTRACTION_IDENTIFIER, to_train=True, xml_file_name="raw.xml")
+    store(raw_xml_file, xml_content)
+
+    gzip_xml_file = XmlFile(extraction_identifier=EXTRACTION_IDENTIFIER, to_train=True, xml_file_name="gzip.xml")
+    start = time()
+    xml_file_writer = XmlFileWriter(gzip_xml_file.xml_file_path)
+    xml_file_writer.write(xml_content)
+    xml_file_writer.close()
+    gzip_write_seconds = time() - start
+
+    zstd_xml_file = XmlFile(extraction_identifier=EXTRACTION_IDENTIFIER, to_train=True, xml_file_name="zstd.xml")
+    store(zstd_xml_file, zstandard.compress(xml_content))
+
+    for name, xml_file in [("raw", raw_xml_file), ("gzip", gzip_xml_file), ("zstd", zstd_xml_file)]:
+        results[name] = {
+            "disk_mb": round(os.path.getsize(xml_file.xml_file_path) / 1024 / 1024, 2),
+            "parse_seconds": round(parse_seconds(xml_file), 3),
+        }
+
+    results["gzip"]["write_seconds"] = round(gzip_write_seconds, 3)
+    shutil.rmtree(join(DATA_PATH, EXTRACTION_IDENTIFIER.run_name), ignore_errors=True)
+    save_results("xml_compression", results)
+
+
+if __name__ == "__main__":
+    run()
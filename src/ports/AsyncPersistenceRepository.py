@@ -0,0 +1,81 @@
+from abc import abstractmethod, ABC
+from typing import Optional
+
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.LabeledData import LabeledData
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from domain.ParagraphExtractionData import ParagraphExtractionData
+
+
+class AsyncPersistenceRepository(ABC):
+
+    @abstractmethod
+    async def close(self):
+        pass
+
+    @abstractmethod
+    async def save_prediction_data(self, extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData):
+        pass
+
+    @abstractmethod
+    async def save_prediction_data_list(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+    ):
+        pass
+
+    @abstractmethod
+    async def save_labeled_data(self, extraction_identifier: ExtractionIdentifier, labeled_data: LabeledData):
+        pass
+
+    @abstractmethod
+    async def save_labeled_data_list(
+        self, extraction_identifier: ExtractionIdentifier, labeled_data_list: list[LabeledData]
+    ):
+        pass
+
+    @abstractmethod
+    async def load_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
+        pass
+
+    @abstractmethod
+    async def load_suggestions_page(
+        self, extraction_identifier: ExtractionIdentifier, after_suggestion_id: Optional[str], page_size: int
+    ) -> list[tuple[str, Suggestion]]:
+        pass
+
+    @abstractmethod
+    async def delete_suggestions_until(self, extraction_identifier: ExtractionIdentifier, suggestion_id: str):
+        pass
+
+    @abstractmethod
+    async def save_paragraph_extraction_data(
+        self, extraction_identifier: ExtractionIdentifier, paragraph_extraction_data: ParagraphExtractionData
+    ):
+        pass
+
+    @abstractmethod
+    async def save_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: list[ParagraphsFromLanguage]
+    ):
+        pass
+
+    @abstractmethod
+    async def load_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier
+    ) -> list[ParagraphsFromLanguage]:
+        pass
+
+    @abstractmethod
+    async def delete_paragraphs_from_languages(self, extraction_identifier: ExtractionIdentifier):
+        pass
+
+    @abstractmethod
+    async def save_extractor_usage(self, extraction_identifier: ExtractionIdentifier):
+        pass
+
+    @abstractmethod
+    async def save_extractor_deletion(self, extraction_identifier: ExtractionIdentifier):
+        pass
@@ -1,4 +1,5 @@
 from abc import abstractmethod, ABC
+from typing import Optional
 
 from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
 from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
@@ -6,6 +7,7 @@ from trainable_entity_extractor.data.LabeledData import LabeledData
 from trainable_entity_extractor.data.PredictionData import PredictionData
 from trainable_entity_extractor.data.Suggestion import Suggestion
 
+from domain.ExtractorUsage import ExtractorUsage
 from domain.ParagraphExtractionData import ParagraphExtractionData
 
 
@@ -15,18 +17,60 @@ class PersistenceRepository(ABC):
     def close(self):
         pass
 
+    @abstractmethod
+    def create_indexes(self) -> list[str]:
+        pass
+
+    @abstractmethod
+    def get_missing_indexes(self) -> list[str]:
+        pass
+
     @abstractmethod
     def save_prediction_data(self, extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData):
         pass
 
     @abstractmethod
-    def load_prediction_data(self, extraction_identifier: ExtractionIdentifier) -> list[PredictionData]:
+    def save_prediction_data_list(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+    ):
+        pass
+
+    @abstractmethod
+    def load_prediction_data(
+        self, extraction_identifier: ExtractionIdentifier, until_prediction_data_id: Optional[str] = None
+    ) -> list[PredictionData]:
+        pass
+
+    @abstractmethod
+    def load_prediction_data_page(
+        self,
+        extraction_identifier: ExtractionIdentifier,
+        after_prediction_data_id: Optional[str],
+        until_prediction_data_id: str,
+        page_size: int,
+    ) -> list[tuple[str, PredictionData]]:
+        pass
+
+    @abstractmethod
+    def count_prediction_data(self, extraction_identifier: ExtractionIdentifier, until_prediction_data_id: str) -> int:
+        pass
+
+    @abstractmethod
+    def load_prediction_data_watermark(self, extraction_identifier: ExtractionIdentifier) -> Optional[str]:
+        pass
+
+    @abstractmethod
+    def delete_prediction_data_ids(self, extraction_identifier: ExtractionIdentifier, prediction_data_ids: list[str]):
         pass
 
     @abstractmethod
     def save_labeled_data(self, extraction_identifier: ExtractionIdentifier, labeled_data: LabeledData):
         pass
 
+    @abstractmethod
+    def save_labeled_data_list(self, extraction_identifier: ExtractionIdentifier, labeled_data_list: list[LabeledData]):
+        pass
+
     @abstractmethod
     def delete_labeled_data(self, extraction_identifier: ExtractionIdentifier):
         pass
@@ -43,6 +87,16 @@ class PersistenceRepository(ABC):
     def load_suggestions(self, extraction_identifier: ExtractionIdentifier) -> list[Suggestion]:
         pass
 
+    @abstractmethod
+    def load_suggestions_page(
+        self, extraction_identifier: ExtractionIdentifier, after_suggestion_id: Optional[str], page_size: int
+    ) -> list[tuple[str, Suggestion]]:
+        pass
+
+    @abstractmethod
+    def delete_suggestions_until(self, extraction_identifier: ExtractionIdentifier, suggestion_id: str):
+        pass
+
     @abstractmethod
     def save_paragraph_extraction_data(
         self, extraction_identifier: ExtractionIdentifier, paragraph_extraction_data: ParagraphExtractionData
@@ -54,8 +108,8 @@ class PersistenceRepository(ABC):
         pass
 
     @abstractmethod
-    def save_paragraphs_from_language(
-        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: ParagraphsFromLanguage
+    def save_paragraphs_from_languages(
+        self, extraction_identifier: ExtractionIdentifier, paragraphs_from_languages: list[ParagraphsFromLanguage]
     ):
         pass
 
@@ -68,5 +122,27 @@ class PersistenceRepository(ABC):
         pass
 
     @abstractmethod
-    def delete_prediction_data(self, extraction_identifier: ExtractionIdentifier, filters: list[dict[str, str]]):
+    def save_extractor_usage(self, extraction_identifier: ExtractionIdentifier, last_used: Optional[float] = None):
+        pass
+
+    @abstractmethod
+    def save_extractor_deletion(self, extraction_identifier: ExtractionIdentifier):
+        pass
+
+    @abstractmethod
+    def has_extractors_usage(self) -> bool:
+        pass
+
+    @abstractmethod
+    def load_extractors_usage_to_remove(self, expiration_time: float, limit: int) -> list[ExtractorUsage]:
+        pass
+
+    @abstractmethod
+    def delete_extractor_data(self, extraction_identifier: ExtractionIdentifier, until_id: Optional[str] = None):
+        pass
+
+    @abstractmethod
+    def delete_extractor_usage(
+        self, extraction_identifier: ExtractionIdentifier, deleted_before: Optional[str], expiration_time: float
+    ):
         pass
@@ -0,0 +1,20 @@
+from abc import abstractmethod, ABC
+
+
+class TaskPublisher(ABC):
+
+    @abstractmethod
+    def close(self):
+        pass
+
+    @abstractmethod
+    def send_message(self, queue_name: str, message: dict):
+        pass
+
+    @abstractmethod
+    def send_messages(self, queue_name: str, messages: list[dict]):
+        pass
+
+    @abstractmethod
+    def send_result(self, queue_name: str, result: dict):
+        pass
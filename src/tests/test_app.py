@@ -1,22 +1,63 @@
+import gzip
+import hashlib
+import io
 import json
 import os
 import shutil
-from os.path import join
+import zipfile
+from os.path import join, dirname
 
+import httpx
 import mongomock
 import pymongo
+import zstandard
 from fastapi.testclient import TestClient
 from unittest import TestCase
+from unittest.mock import patch
 
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.data.Suggestion import Suggestion
 
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from adapters.RedisTaskPublisher import RedisTaskPublisher
+from domain.ParagraphExtractionData import ParagraphExtractionData, XmlSegments
+from drivers.rest.DecompressRequestMiddleware import (
+    DecompressRequestMiddleware,
+    DecompressedBody,
+    RequestTooLarge,
+    DECOMPRESS_OUTPUT_BYTES,
+)
 from drivers.rest.app import app
-from config import DATA_PATH, APP_PATH, MONGO_HOST, MONGO_PORT
+from use_cases.ParagraphsCache import ParagraphsCache
+from use_cases.CompressedXml import CompressedXml
+from use_cases.Extractor import Extractor
+from use_cases.XmlStore import XmlStore
+from config import (
+    DATA_PATH,
+    APP_PATH,
+    MONGO_HOST,
+    MONGO_PORT,
+    TRASH_PATH,
+    PARAGRAPH_EXTRACTION_NAME,
+    XML_STORE_PATH,
+    PDF_DATA_CACHE_PATH,
+    PARAGRAPHS_CACHE_PATH,
+)
+
+
+def get_models_cache_statistics() -> tuple[int, int]:
+    return Extractor.trainable_entity_extractor_cache.hits, Extractor.trainable_entity_extractor_cache.misses
 
 
 class TestApp(TestCase):
     test_file_path = f"{APP_PATH}/tests/resources/tenant_test/extraction_id/xml_to_predict/test.xml"
 
+    def tearDown(self):
+        cache_paths = [dirname(PDF_DATA_CACHE_PATH), dirname(PARAGRAPHS_CACHE_PATH)]
+        for path in [XML_STORE_PATH, *cache_paths, join(DATA_PATH, PARAGRAPH_EXTRACTION_NAME)]:
+            shutil.rmtree(path, ignore_errors=True)
+
     def test_info(self):
         with TestClient(app) as client:
             response = client.get("/")
@@ -40,6 +81,140 @@ class TestApp(TestCase):
 
         shutil.rmtree(join(DATA_PATH, run_name), ignore_errors=True)
 
+    def test_post_xml_file_should_store_the_exact_content(self):
+        run_name = "endpoint_test"
+        extraction_name = "extraction_id"
+
+        shutil.rmtree(join(DATA_PATH, run_name), ignore_errors=True)
+
+        with open(self.test_file_path, "rb") as stream:
+            files = {"file": stream}
+            with TestClient(app) as client:
+                response = client.post(f"/xml_to_train/{run_name}/{extraction_name}", files=files)
+
+        self.assertEqual(200, response.status_code)
+        to_train_xml_folder = f"{DATA_PATH}/{run_name}/{extraction_name}/xml_to_train"
+        self.assertEqual(["test.xml"], os.listdir(to_train_xml_folder))
+        self.assertTrue(CompressedXml.is_compressed(join(to_train_xml_folder, "test.xml")))
+        with open(self.test_file_path, "rb") as original, CompressedXml.open(join(to_train_xml_folder, "test.xml")) as saved:
+            self.assertEqual(original.read(), saved.read())
+
+        shutil.rmtree(join(DATA_PATH, run_name), ignore_errors=True)
+
+    def test_post_same_xml_file_to_several_extractors_should_store_it_once(self):
+        tenant = "endpoint_test"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with TestClient(app) as client:
+            for extraction_id in ["first_extraction_id", "second_extraction_id"]:
+                with open(self.test_file_path, "rb") as stream:
+                    client.post(f"/xml_to_train/{tenant}/{extraction_id}", files={"file": stream})
+
+        first_xml_stat = os.stat(f"{DATA_PATH}/{tenant}/first_extraction_id/xml_to_train/test.xml")
+        second_xml_stat = os.stat(f"{DATA_PATH}/{tenant}/second_extraction_id/xml_to_train/test.xml")
+
+        self.assertEqual(first_xml_stat.st_ino, second_xml_stat.st_ino)
+        self.assertEqual(3, first_xml_stat.st_nlink)
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    def test_post_same_xml_content_with_different_encodings_should_store_it_once(self):
+        tenant = "endpoint_test"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with open(self.test_file_path, "rb") as stream:
+            xml_content = stream.read()
+
+        encoded_xml_contents = {
+            "plain_extraction_id": xml_content,
+            "gzip_extraction_id": gzip.compress(xml_content),
+            "zstd_extraction_id": zstandard.compress(xml_content),
+        }
+        with TestClient(app) as client:
+            for extraction_id, encoded_xml_content in encoded_xml_contents.items():
+                client.post(f"/xml_to_train/{tenant}/{extraction_id}", files={"file": ("test.xml", encoded_xml_content)})
+
+        xml_paths = [f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_train/test.xml" for extraction_id in encoded_xml_contents]
+
+        self.assertEqual({hashlib.sha256(xml_content).hexdigest()}, {XmlStore.get_content_hash(x) for x in xml_paths})
+        self.assertEqual(1, len({os.stat(xml_path).st_ino for xml_path in xml_paths}))
+        self.assertEqual(4, os.stat(xml_paths[0]).st_nlink)
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    def test_post_gzip_encoded_xml_file(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with open(self.test_file_path, "rb") as stream:
+            xml_content = stream.read()
+
+        multipart_request = httpx.Request("POST", "http://test", files={"file": ("test.xml", xml_content)})
+        headers = {"Content-Type": multipart_request.headers["Content-Type"], "Content-Encoding": "gzip"}
+        with TestClient(app) as client:
+            response = client.post(
+                f"/xml_to_predict/{tenant}/{extraction_id}", content=gzip.compress(multipart_request.read()), headers=headers
+            )
+
+        self.assertEqual(200, response.status_code)
+        with CompressedXml.open(f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_predict/test.xml") as saved:
+            self.assertEqual(xml_content, saved.read())
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    @patch("drivers.rest.DecompressRequestMiddleware.MAX_DECOMPRESSED_REQUEST_BYTES", 10000)
+    def test_reject_too_large_decompressed_requests(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+
+        prediction_data = {"tenant": tenant, "id": extraction_id, "xml_file_name": "test.xml"}
+        lines = "\n".join([json.dumps(prediction_data)] * 1000).encode()
+        multipart_request = httpx.Request("POST", "http://test", files={"file": ("test.xml", b"<pages>" * 10000)})
+
+        with TestClient(app) as client:
+            bulk_response = client.post(
+                "/prediction_data/bulk",
+                content=gzip.compress(lines),
+                headers={"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"},
+            )
+            xml_response = client.post(
+                f"/xml_to_predict/{tenant}/{extraction_id}",
+                content=zstandard.compress(multipart_request.read()),
+                headers={"Content-Type": multipart_request.headers["Content-Type"], "Content-Encoding": "zstd"},
+            )
+            small_request_response = client.post(
+                "/prediction_data/bulk",
+                content=gzip.compress(lines[:1000]),
+                headers={"Content-Type": "application/x-ndjson", "Content-Encoding": "gzip"},
+            )
+
+        self.assertEqual(413, bulk_response.status_code)
+        self.assertEqual(413, xml_response.status_code)
+        self.assertEqual(200, small_request_response.status_code)
+        saved_documents_count = mongo_client.pdf_metadata_extraction.prediction_data.count_documents({})
+        self.assertEqual(small_request_response.json()["saved"], saved_documents_count)
+        self.assertFalse(os.path.exists(f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_predict/test.xml"))
+
+    @patch("drivers.rest.DecompressRequestMiddleware.MAX_DECOMPRESSED_REQUEST_BYTES", 3 * 1024 * 1024)
+    def test_decompress_large_chunks_with_bounded_output(self):
+        content = b"<pages>" * 1024 * 1024
+        for content_encoding, compress in [("gzip", gzip.compress), ("zstd", zstandard.compress)]:
+            decompressed_body = DecompressedBody()
+            writer = DecompressRequestMiddleware.get_writer(content_encoding, decompressed_body)
+            with self.assertRaises(RequestTooLarge):
+                writer.write(compress(content))
+
+            self.assertLessEqual(max([len(x) for x in decompressed_body.chunks]), DECOMPRESS_OUTPUT_BYTES)
+            self.assertLessEqual(len(decompressed_body.pop()), 3 * 1024 * 1024)
+
     def test_post_xml_to_predict(self):
         tenant = "endpoint_test"
         extraction_id = "extraction_id"
@@ -57,6 +232,125 @@ class TestApp(TestCase):
 
         shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
 
+    def test_post_xml_files_without_text_should_be_marked_as_trivial(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+        resources_path = f"{APP_PATH}/tests/resources/tenant_test/extraction_id/xml_to_predict"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with TestClient(app) as client:
+            for xml_file_name in ["test.xml", "blank.xml", "no_pages.xml"]:
+                with open(join(resources_path, xml_file_name), "rb") as stream:
+                    client.post(f"/xml_to_predict/{tenant}/{extraction_id}", files={"file": stream})
+
+        to_predict_xml_folder = f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_predict"
+        trivial_xml_files = {
+            xml_file_name: XmlStore.is_trivial(XmlStore.get_content_hash(join(to_predict_xml_folder, xml_file_name)))
+            for xml_file_name in ["test.xml", "blank.xml", "no_pages.xml"]
+        }
+        self.assertEqual({"test.xml": False, "blank.xml": True, "no_pages.xml": True}, trivial_xml_files)
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_predict_xml_file_without_text(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+        blank_xml_path = f"{APP_PATH}/tests/resources/tenant_test/extraction_id/xml_to_predict/blank.xml"
+        prediction_data = {"page_width": 612, "page_height": 792, "xml_segments_boxes": []}
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with open(blank_xml_path, "rb") as stream:
+            with TestClient(app) as client:
+                response = client.post(
+                    f"/predict/{tenant}/{extraction_id}",
+                    data={"json_data": json.dumps(prediction_data)},
+                    files={"file": ("blank.xml", stream)},
+                )
+
+        suggestions = [Suggestion(**x) for x in response.json()]
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(1, len(suggestions))
+        self.assertEqual(tenant, suggestions[0].tenant)
+        self.assertEqual(extraction_id, suggestions[0].id)
+        self.assertEqual("blank.xml", suggestions[0].xml_file_name)
+        self.assertEqual("", suggestions[0].text)
+        self.assertEqual([], os.listdir(f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_predict"))
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_predict_twice_with_the_same_extractor_should_load_it_once(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+        prediction_data = {"page_width": 612, "page_height": 792, "xml_segments_boxes": []}
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with TestClient(app) as client:
+            for _ in range(2):
+                with open(self.test_file_path, "rb") as stream:
+                    response = client.post(
+                        f"/predict/{tenant}/{extraction_id}",
+                        data={"json_data": json.dumps(prediction_data)},
+                        files={"file": ("test.xml", stream)},
+                    )
+                self.assertEqual(200, response.status_code)
+
+            hits, misses = app.inference_process.executor.submit(get_models_cache_statistics).result()
+
+        self.assertEqual(1, misses)
+        self.assertEqual(1, hits)
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    def test_post_xml_files_to_train(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        with open(self.test_file_path, "rb") as stream:
+            xml_content = stream.read()
+
+        files = [("files", ("one.xml", xml_content)), ("files", ("other.xml", xml_content))]
+        with TestClient(app) as client:
+            response = client.post(f"/xmls_to_train/{tenant}/{extraction_id}", files=files)
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["one.xml", "other.xml"], [x["xml_file_name"] for x in response.json()])
+        self.assertTrue(all([x["success"] for x in response.json()]))
+        to_train_xml_folder = f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_train"
+        self.assertEqual(["one.xml", "other.xml"], sorted(os.listdir(to_train_xml_folder)))
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+    def test_post_xml_files_to_predict_in_zip_archive(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
+        archive = io.BytesIO()
+        with zipfile.ZipFile(archive, "w") as zip_file:
+            zip_file.write(self.test_file_path, "folder/one.xml")
+            zip_file.write(self.test_file_path, "other.xml")
+
+        with TestClient(app) as client:
+            response = client.post(
+                f"/xmls_to_predict/{tenant}/{extraction_id}", files={"archive": ("xmls.zip", archive.getvalue())}
+            )
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["one.xml", "other.xml"], [x["xml_file_name"] for x in response.json()])
+        to_predict_xml_folder = f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_predict"
+        self.assertEqual(["one.xml", "other.xml"], sorted(os.listdir(to_predict_xml_folder)))
+
+        shutil.rmtree(join(DATA_PATH, tenant), ignore_errors=True)
+
     @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
     def test_post_labeled_data(self):
         tenant = "endpoint_test"
@@ -126,6 +420,25 @@ class TestApp(TestCase):
             labeled_data_document["label_segments_boxes"],
         )
 
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_delete_extractor(self):
+        tenant = "delete_extractor_test"
+        extraction_id = "extraction_id"
+        os.makedirs(f"{DATA_PATH}/{tenant}/{extraction_id}/xml_to_train", exist_ok=True)
+
+        with TestClient(app) as client:
+            response = client.delete(f"/{tenant}/{extraction_id}")
+
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+        extractor_usage = mongo_client.pdf_metadata_extraction.extractors_usage.find_one()
+
+        self.assertEqual(200, response.status_code)
+        self.assertFalse(os.path.exists(f"{DATA_PATH}/{tenant}/{extraction_id}"))
+        self.assertEqual(extraction_id, extractor_usage["extraction_name"])
+        self.assertIn("deleted_before", extractor_usage)
+        shutil.rmtree(f"{DATA_PATH}/{tenant}", ignore_errors=True)
+        shutil.rmtree(TRASH_PATH, ignore_errors=True)
+
     @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
     def test_post_labeled_data_different_values(self):
         tenant = "different_endpoint_test"
@@ -229,6 +542,43 @@ class TestApp(TestCase):
             labeled_data_document["label_segments_boxes"],
         )
 
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_post_labeled_data_bulk(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+
+        labeled_data = {
+            "tenant": tenant,
+            "id": extraction_id,
+            "xml_file_name": "xml_file_name",
+            "language_iso": "en",
+            "label_text": "text",
+            "page_width": 1.1,
+            "page_height": 2.1,
+            "xml_segments_boxes": [],
+            "label_segments_boxes": [
+                {"left": 8, "top": 12, "width": 16, "height": 20, "page_width": 5, "page_height": 6, "page_number": 10}
+            ],
+        }
+        lines = [json.dumps(labeled_data), "not a json", json.dumps({**labeled_data, "xml_file_name": "other"})]
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/labeled_data/bulk", content="\n".join(lines), headers={"Content-Type": "application/x-ndjson"}
+            )
+
+        labeled_data_documents = list(mongo_client.pdf_metadata_extraction.labeled_data.find())
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(2, response.json()["saved"])
+        self.assertEqual([2], [x["line"] for x in response.json()["errors"]])
+        self.assertEqual(["xml_file_name", "other"], [x["xml_file_name"] for x in labeled_data_documents])
+        self.assertEqual({tenant}, {x["run_name"] for x in labeled_data_documents})
+        self.assertEqual({extraction_id}, {x["extraction_name"] for x in labeled_data_documents})
+        self.assertEqual(6, labeled_data_documents[0]["label_segments_boxes"][0]["left"])
+
     @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
     def test_post_prediction_data(self):
         tenant = "endpoint_test"
@@ -283,6 +633,82 @@ class TestApp(TestCase):
             prediction_data_document["xml_segments_boxes"],
         )
 
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_post_data_should_save_the_extractor_usage_once_per_interval(self):
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+        json_data = {"tenant": "usage_endpoint_test", "id": "extraction_id", "xml_file_name": "test.xml"}
+
+        with patch.object(
+            MongoPersistenceRepository,
+            "save_extractor_usage",
+            autospec=True,
+            side_effect=MongoPersistenceRepository.save_extractor_usage,
+        ) as save_extractor_usage:
+            with TestClient(app) as client:
+                for _ in range(3):
+                    client.post("/prediction_data", json=json_data)
+
+        extractor_usage = mongo_client.pdf_metadata_extraction.extractors_usage.find_one()
+        self.assertEqual(1, save_extractor_usage.call_count)
+        self.assertEqual("usage_endpoint_test", extractor_usage["run_name"])
+        self.assertIn("last_used", extractor_usage)
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_post_prediction_data_bulk(self):
+        tenant = "endpoint_test"
+        extraction_id = "extraction_id"
+
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+
+        prediction_data = {
+            "tenant": tenant,
+            "id": extraction_id,
+            "page_width": 612,
+            "page_height": 792,
+            "xml_segments_boxes": [
+                {"left": 6, "top": 7, "width": 8, "height": 9, "page_width": 5, "page_height": 6, "page_number": 10}
+            ],
+        }
+        lines = [json.dumps({**prediction_data, "xml_file_name": f"file_{i}.xml"}) for i in range(5)]
+        lines.append(json.dumps({**prediction_data, "page_width": "wrong width"}))
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/prediction_data/bulk", content="\n".join(lines), headers={"Content-Type": "application/x-ndjson"}
+            )
+
+        prediction_data_documents = list(mongo_client.pdf_metadata_extraction.prediction_data.find())
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(5, response.json()["saved"])
+        self.assertEqual([6], [x["line"] for x in response.json()["errors"]])
+        self.assertEqual([f"file_{i}.xml" for i in range(5)], [x["xml_file_name"] for x in prediction_data_documents])
+        self.assertEqual({tenant}, {x["run_name"] for x in prediction_data_documents})
+        self.assertEqual(6, prediction_data_documents[0]["xml_segments_boxes"][0]["left"])
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    @patch("adapters.MongoPersistenceRepository.MONGO_WRITE_BATCH_SIZE", 2)
+    def test_post_prediction_data_bulk_with_failing_writes(self):
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+        mongo_client.pdf_metadata_extraction.prediction_data.create_index("xml_file_name", unique=True)
+
+        prediction_data = {"tenant": "endpoint_test", "id": "extraction_id", "page_width": 612, "page_height": 792}
+        xml_files_names = ["file_0.xml", "file_1.xml", "file_0.xml", "file_2.xml", "file_1.xml"]
+        lines = [json.dumps({**prediction_data, "xml_file_name": xml_file_name}) for xml_file_name in xml_files_names]
+
+        with TestClient(app) as client:
+            response = client.post(
+                "/prediction_data/bulk", content="\n".join(lines), headers={"Content-Type": "application/x-ndjson"}
+            )
+
+        prediction_data_documents = list(mongo_client.pdf_metadata_extraction.prediction_data.find())
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(3, response.json()["saved"])
+        self.assertEqual([3, 5], [x["line"] for x in response.json()["errors"]])
+        self.assertIn("Duplicate", response.json()["errors"][0]["error_message"])
+        self.assertEqual(["file_0.xml", "file_1.xml", "file_2.xml"], [x["xml_file_name"] for x in prediction_data_documents])
+
     @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
     def test_get_suggestions(self):
         print(f"mongodb://{MONGO_HOST}:{MONGO_PORT}")
@@ -515,6 +941,84 @@ class TestApp(TestCase):
         self.assertEqual(tenant + "2", suggestion.tenant)
         self.assertEqual(extraction_id, suggestion.id)
 
+    @staticmethod
+    def get_suggestions_documents(tenant: str, extraction_id: str, count: int) -> list[dict]:
+        return [
+            {
+                "run_name": tenant,
+                "extraction_name": extraction_id,
+                "tenant": tenant,
+                "id": extraction_id,
+                "xml_file_name": f"file_name_{i}",
+                "text": f"text_predicted_{i}",
+                "segment_text": f"segment_text_{i}",
+                "page_number": 1,
+                "segments_boxes": [
+                    {"left": 3, "top": 6, "width": 9, "height": 12, "page_width": 5, "page_height": 6, "page_number": 1}
+                ],
+            }
+            for i in range(count)
+        ]
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_get_suggestions_page(self):
+        tenant = "example_tenant_name"
+        extraction_id = "prediction_extraction_id"
+
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+        suggestions_collection = mongo_client.pdf_metadata_extraction.suggestions
+        suggestions_collection.insert_many(self.get_suggestions_documents(tenant, extraction_id, 3))
+        suggestions_collection.insert_many(self.get_suggestions_documents("other_tenant", extraction_id, 1))
+
+        with TestClient(app) as client:
+            first_page = client.get(f"/get_suggestions/{tenant}/{extraction_id}/page?page_size=2").json()
+            documents_count_before_acknowledge = suggestions_collection.count_documents({})
+            second_page = client.get(
+                f"/get_suggestions/{tenant}/{extraction_id}/page?page_size=2&after={first_page['next_page']}"
+            ).json()
+            last_page = client.get(
+                f"/get_suggestions/{tenant}/{extraction_id}/page?page_size=2&after={second_page['next_page']}"
+            ).json()
+
+        self.assertEqual(["file_name_0", "file_name_1"], [x["xml_file_name"] for x in first_page["suggestions"]])
+        self.assertEqual(4, documents_count_before_acknowledge)
+        self.assertEqual(["file_name_2"], [x["xml_file_name"] for x in second_page["suggestions"]])
+        self.assertEqual(4, second_page["suggestions"][0]["segments_boxes"][0]["left"])
+        self.assertEqual([], last_page["suggestions"])
+        self.assertIsNone(last_page["next_page"])
+        self.assertEqual(1, suggestions_collection.count_documents({}))
+        self.assertEqual("other_tenant", suggestions_collection.find_one()["tenant"])
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_get_suggestions_page_with_malformed_cursor(self):
+        tenant = "example_tenant_name"
+        extraction_id = "prediction_extraction_id"
+
+        with TestClient(app) as client:
+            response = client.get(f"/get_suggestions/{tenant}/{extraction_id}/page?after=not_a_page_cursor")
+
+        self.assertEqual(422, response.status_code)
+        self.assertEqual(["query", "after"], response.json()["detail"][0]["loc"])
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_get_suggestions_stream(self):
+        tenant = "example_tenant_name"
+        extraction_id = "prediction_extraction_id"
+
+        mongo_client = pymongo.MongoClient("mongodb://127.0.0.1:29017")
+        suggestions_collection = mongo_client.pdf_metadata_extraction.suggestions
+        suggestions_collection.insert_many(self.get_suggestions_documents(tenant, extraction_id, 3))
+
+        with TestClient(app) as client:
+            response = client.get(f"/get_suggestions/{tenant}/{extraction_id}/stream")
+
+        suggestions = [json.loads(line) for line in response.text.splitlines()]
+
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(["file_name_0", "file_name_1", "file_name_2"], [x["xml_file_name"] for x in suggestions])
+        self.assertEqual({tenant}, {x["tenant"] for x in suggestions})
+        self.assertEqual(0, suggestions_collection.count_documents({}))
+
     @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
     def test_get_suggestions_when_no_suggestions(self):
         with TestClient(app) as client:
@@ -523,3 +1027,53 @@ class TestApp(TestCase):
 
         self.assertEqual(200, response.status_code)
         self.assertEqual(0, len(suggestions))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    @patch.object(RedisTaskPublisher, "send_result")
+    @patch.object(RedisTaskPublisher, "send_message")
+    def test_extract_paragraphs_from_cache(self, send_message, send_result):
+        key = "paragraphs_cache_test"
+        xmls_segments = [
+            XmlSegments(xml_file_name="test_en.xml", language="en", is_main_language=True, xml_segments_boxes=[]),
+            XmlSegments(xml_file_name="test_fr.xml", language="fr", is_main_language=False, xml_segments_boxes=[]),
+        ]
+        paragraph_extraction_data = ParagraphExtractionData(key=key, xmls_segments=xmls_segments)
+        extractor_path = join(DATA_PATH, PARAGRAPH_EXTRACTION_NAME, key)
+        shutil.rmtree(extractor_path, ignore_errors=True)
+
+        def post_extract_paragraphs(client: TestClient) -> httpx.Response:
+            with open(join(APP_PATH, "tests", "resources", "test_en.xml"), "rb") as en_stream:
+                with open(join(APP_PATH, "tests", "resources", "test_fr.xml"), "rb") as fr_stream:
+                    files = [
+                        ("json_data", (None, paragraph_extraction_data.model_dump_json())),
+                        ("xml_files", ("test_en.xml", en_stream)),
+                        ("xml_files", ("test_fr.xml", fr_stream)),
+                    ]
+                    return client.post("/extract_paragraphs", files=files)
+
+        with TestClient(app) as client:
+            first_response = post_extract_paragraphs(client)
+            extraction_identifier = ExtractionIdentifier(
+                run_name=PARAGRAPH_EXTRACTION_NAME, extraction_name=key, output_path=DATA_PATH
+            )
+            cache_key = ParagraphsCache.get_key(extraction_identifier, xmls_segments)
+            paragraphs_from_languages = [
+                ParagraphsFromLanguage(language="en", paragraphs=[], is_main_language=True),
+                ParagraphsFromLanguage(language="fr", paragraphs=[], is_main_language=False),
+            ]
+            ParagraphsCache.set(cache_key, paragraphs_from_languages)
+            second_response = post_extract_paragraphs(client)
+            translations_response = client.get(f"/get_paragraphs_translations/{key}")
+
+        os.remove(ParagraphsCache.disk_cache.get_cache_path(cache_key))
+        shutil.rmtree(extractor_path, ignore_errors=True)
+
+        self.assertEqual(200, first_response.status_code)
+        self.assertEqual(200, second_response.status_code)
+        self.assertEqual(1, send_message.call_count)
+        self.assertEqual(1, send_result.call_count)
+        queue_name, result = send_result.call_args.args
+        self.assertEqual(PARAGRAPH_EXTRACTION_NAME, queue_name)
+        self.assertTrue(result["success"])
+        self.assertTrue(result["data_url"].endswith(f"/get_paragraphs_translations/{key}"))
+        self.assertEqual(["en", "fr"], translations_response.json()["available_languages"])
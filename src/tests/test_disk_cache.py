@@ -0,0 +1,52 @@
+import os
+import shutil
+from os.path import join
+from unittest import TestCase
+from unittest.mock import patch
+
+from config import DATA_PATH
+from use_cases.DiskCache import DiskCache
+
+
+class TestDiskCache(TestCase):
+    def setUp(self):
+        self.cache_path = join(DATA_PATH, "tenant_disk_cache")
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+
+    def tearDown(self):
+        shutil.rmtree(self.cache_path, ignore_errors=True)
+
+    def test_set_and_get(self):
+        disk_cache = DiskCache(self.cache_path, 1000)
+
+        disk_cache.set("00key", b"content")
+
+        self.assertEqual(b"content", disk_cache.get("00key"))
+        self.assertIsNone(disk_cache.get("00missing"))
+        self.assertEqual(["00key"], os.listdir(join(self.cache_path, "00")))
+
+    def test_remove_unreadable_files_on_get(self):
+        disk_cache = DiskCache(self.cache_path, 1000)
+        os.makedirs(join(self.cache_path, "00"), exist_ok=True)
+        with open(disk_cache.get_cache_path("00key"), "wb") as stream:
+            stream.write(b"not compressed")
+
+        self.assertIsNone(disk_cache.get("00key"))
+        self.assertFalse(os.path.exists(disk_cache.get_cache_path("00key")))
+
+    def test_evict_skips_partial_and_removed_files(self):
+        disk_cache = DiskCache(self.cache_path, 150)
+        os.makedirs(join(self.cache_path, "00"), exist_ok=True)
+        for index, file_name in enumerate(["first", "second", "third", "fourth.part"]):
+            with open(join(self.cache_path, "00", file_name), "wb") as stream:
+                stream.write(b"0" * 100)
+            os.utime(join(self.cache_path, "00", file_name), (index + 1, index + 1))
+
+        cache_files = disk_cache.get_cache_files()
+        os.remove(join(self.cache_path, "00", "first"))
+        with patch.object(disk_cache, "get_cache_files", return_value=cache_files):
+            disk_cache.evict()
+
+        self.assertEqual(3, len(cache_files))
+        self.assertEqual(["fourth.part", "third"], sorted(os.listdir(join(self.cache_path, "00"))))
+        self.assertEqual(100, disk_cache.cache_bytes)
@@ -0,0 +1,21 @@
+from unittest import TestCase
+
+from use_cases.DocumentPreParser import DocumentPreParser
+from use_cases.DocumentsParser import DocumentsParser
+from use_cases.PdfDataCache import PdfDataCache
+
+
+def get_worker_settings() -> tuple[int, int]:
+    return DocumentsParser.workers, PdfDataCache.memory_cache_max_bytes
+
+
+class TestDocumentPreParser(TestCase):
+    def test_workers_do_not_keep_parsed_documents_in_memory(self):
+        document_pre_parser = DocumentPreParser(workers=1)
+        try:
+            workers, memory_cache_max_bytes = document_pre_parser.executor.submit(get_worker_settings).result()
+        finally:
+            document_pre_parser.close()
+
+        self.assertEqual(1, workers)
+        self.assertEqual(0, memory_cache_max_bytes)
@@ -35,6 +35,9 @@ QUEUE = RedisSMQ(
 
 SERVER_URL = "http://127.0.0.1:5056"
 
+PREDICT_P50_SLO_SECONDS = 0.5
+PREDICT_P99_SLO_SECONDS = 2
+
 
 class TestEndToEnd(TestCase):
     def tearDown(self):
@@ -142,6 +145,54 @@ class TestEndToEnd(TestCase):
         self.assertEqual(15, suggestion.segments_boxes[0].height)
         self.assertEqual(1, suggestion.segments_boxes[0].page_number)
 
+    def test_predict_latency_on_warm_model(self):
+        tenant = "end_to_end_test"
+        extraction_id = "extraction_id"
+
+        test_xml_path = f"{APP_PATH}/tests/resources/tenant_test/extraction_id/xml_to_train/test.xml"
+        with open(test_xml_path, mode="rb") as stream:
+            requests.post(f"{SERVER_URL}/xml_to_train/{tenant}/{extraction_id}", files={"file": stream})
+
+        labeled_data_json = {
+            "id": extraction_id,
+            "tenant": tenant,
+            "xml_file_name": "test.xml",
+            "language_iso": "en",
+            "label_text": "Original: English",
+            "page_width": 612,
+            "page_height": 792,
+            "xml_segments_boxes": [],
+            "label_segments_boxes": [{"left": 123, "top": 45, "width": 87, "height": 16, "page_number": 1}],
+        }
+        requests.post(f"{SERVER_URL}/labeled_data", json=labeled_data_json)
+
+        task = TrainableEntityExtractionTask(
+            tenant=tenant, task="create_model", params=Params(id=extraction_id, metadata={"name": "test"})
+        )
+        QUEUE.sendMessage(delay=0).message(task.model_dump_json()).execute()
+        self.assertTrue(self.get_results_message().success)
+
+        prediction_data = {"page_width": 612, "page_height": 792, "xml_segments_boxes": []}
+        latencies = list()
+        for i in range(55):
+            with open(test_xml_path, mode="rb") as stream:
+                start = time.time()
+                response = requests.post(
+                    f"{SERVER_URL}/predict/{tenant}/{extraction_id}",
+                    data={"json_data": json.dumps(prediction_data)},
+                    files={"file": stream},
+                )
+                latencies.append(time.time() - start)
+
+            self.assertEqual(200, response.status_code)
+            self.assertEqual("Original: English", Suggestion(**response.json()[0]).text)
+
+        warm_latencies = sorted(latencies[5:])
+        p50 = warm_latencies[len(warm_latencies) // 2]
+        p99 = warm_latencies[min(len(warm_latencies) - 1, round(0.99 * len(warm_latencies)))]
+        self.assertLess(p50, PREDICT_P50_SLO_SECONDS)
+        self.assertLess(p99, PREDICT_P99_SLO_SECONDS)
+
     def test_create_model_without_data(self):
         tenant = "end_to_end_test"
         extraction_id = "extraction_id"
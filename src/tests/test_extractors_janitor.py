@@ -0,0 +1,92 @@
+import os
+import shutil
+from os.path import join, exists
+from time import time
+from unittest import TestCase
+
+import mongomock
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import DATA_PATH, TRASH_PATH
+from use_cases.ExtractorsJanitor import ExtractorsJanitor
+
+
+class TestExtractorsJanitor(TestCase):
+    tenant = "tenant_extractors_janitor"
+
+    def setUp(self):
+        self.extraction_identifiers = [
+            ExtractionIdentifier(run_name=self.tenant, extraction_name=f"extraction_{i}", output_path=DATA_PATH)
+            for i in range(2)
+        ]
+        for extraction_identifier in self.extraction_identifiers:
+            os.makedirs(join(extraction_identifier.get_path(), "xml_to_predict"), exist_ok=True)
+
+    def tearDown(self):
+        shutil.rmtree(join(DATA_PATH, self.tenant), ignore_errors=True)
+        shutil.rmtree(TRASH_PATH, ignore_errors=True)
+
+    def save_prediction_data(self, persistence_repository: MongoPersistenceRepository, xml_file_name: str):
+        prediction_data = PredictionData(tenant=self.tenant, id="extraction_0", xml_file_name=xml_file_name)
+        persistence_repository.save_prediction_data(self.extraction_identifiers[0], prediction_data)
+
+    @staticmethod
+    def set_old_modification_time(extraction_identifier: ExtractionIdentifier):
+        old_time = time() - 365 * 24 * 60 * 60
+        for path in [join(extraction_identifier.get_path(), "xml_to_predict"), extraction_identifier.get_path()]:
+            os.utime(path, (old_time, old_time))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_remove_expired_extractors(self):
+        persistence_repository = MongoPersistenceRepository()
+        self.set_old_modification_time(self.extraction_identifiers[0])
+        persistence_repository.save_extractor_usage(self.extraction_identifiers[0], time() - 365 * 24 * 60 * 60)
+        persistence_repository.save_extractor_usage(self.extraction_identifiers[1])
+        self.save_prediction_data(persistence_repository, "1.xml")
+
+        ExtractorsJanitor(persistence_repository).clean()
+
+        self.assertFalse(exists(self.extraction_identifiers[0].get_path()))
+        self.assertTrue(exists(self.extraction_identifiers[1].get_path()))
+        self.assertEqual([], persistence_repository.load_prediction_data(self.extraction_identifiers[0]))
+        self.assertEqual([], os.listdir(TRASH_PATH))
+        self.assertEqual(1, persistence_repository.mongo_db.extractors_usage.count_documents({}))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_remove_deleted_extractors_data_saved_before_deletion(self):
+        persistence_repository = MongoPersistenceRepository()
+        persistence_repository.save_extractor_usage(self.extraction_identifiers[0])
+        self.save_prediction_data(persistence_repository, "1.xml")
+
+        persistence_repository.save_extractor_deletion(self.extraction_identifiers[0])
+        ExtractorsJanitor.move_to_trash(self.extraction_identifiers[0])
+        self.save_prediction_data(persistence_repository, "2.xml")
+        ExtractorsJanitor(persistence_repository).clean()
+
+        prediction_data_list = persistence_repository.load_prediction_data(self.extraction_identifiers[0])
+        self.assertEqual(["2.xml"], [x.xml_file_name for x in prediction_data_list])
+        self.assertFalse(exists(self.extraction_identifiers[0].get_path()))
+        self.assertEqual([], os.listdir(TRASH_PATH))
+        self.assertEqual(
+            [], persistence_repository.load_extractors_usage_to_remove(ExtractorsJanitor.get_expiration_time(), 10)
+        )
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_keep_expired_extractors_with_recently_uploaded_xml_files(self):
+        persistence_repository = MongoPersistenceRepository()
+        persistence_repository.save_extractor_usage(self.extraction_identifiers[0], time() - 365 * 24 * 60 * 60)
+        self.save_prediction_data(persistence_repository, "1.xml")
+        self.set_old_modification_time(self.extraction_identifiers[0])
+        with open(join(self.extraction_identifiers[0].get_path(), "xml_to_predict", "1.xml"), "w") as xml_file:
+            xml_file.write("<pdf2xml/>")
+
+        ExtractorsJanitor(persistence_repository).clean()
+
+        self.assertTrue(exists(self.extraction_identifiers[0].get_path()))
+        prediction_data_list = persistence_repository.load_prediction_data(self.extraction_identifiers[0])
+        self.assertEqual(["1.xml"], [x.xml_file_name for x in prediction_data_list])
+        self.assertEqual(
+            [], persistence_repository.load_extractors_usage_to_remove(ExtractorsJanitor.get_expiration_time(), 10)
+        )
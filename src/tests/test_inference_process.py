@@ -0,0 +1,53 @@
+import asyncio
+import os
+from concurrent.futures.process import BrokenProcessPool
+from unittest import TestCase
+from unittest.mock import patch
+
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+
+from config import DATA_PATH
+from use_cases.Extractor import Extractor
+from use_cases.InferenceProcess import InferenceProcess, predict
+
+
+class TestInferenceProcess(TestCase):
+    def test_restart_a_stopped_inference_process(self):
+        inference_process = InferenceProcess()
+        inference_process.extractors_names.add("tenant/extraction_id")
+        extraction_identifier = ExtractionIdentifier(
+            run_name="tenant", extraction_name="extraction_id", output_path=DATA_PATH
+        )
+        prediction_data = PredictionData(
+            tenant="tenant", id="extraction_id", xml_file_name="missing.xml", page_width=612, page_height=792
+        )
+        try:
+            with self.assertRaises(BrokenProcessPool):
+                inference_process.executor.submit(os._exit, 1).result()
+
+            with self.assertLogs(config_logger, level="ERROR") as logs:
+                with self.assertRaises(BrokenProcessPool):
+                    asyncio.run(inference_process.predict(extraction_identifier, prediction_data))
+
+            self.assertEqual(0, inference_process.executor.submit(int).result())
+        finally:
+            inference_process.close()
+
+        self.assertIn("starting a new one", logs.output[0])
+        self.assertIn("tenant/extraction_id", logs.output[0])
+        self.assertEqual(set(), inference_process.extractors_names)
+
+    def test_check_once_if_the_document_is_trivial(self):
+        extraction_identifier = ExtractionIdentifier(
+            run_name="tenant", extraction_name="extraction_id", output_path=DATA_PATH
+        )
+        prediction_data = PredictionData(
+            tenant="tenant", id="extraction_id", xml_file_name="missing.xml", page_width=612, page_height=792
+        )
+
+        with patch.object(Extractor, "is_trivial", return_value=False) as is_trivial:
+            predict(extraction_identifier, prediction_data)
+
+        self.assertEqual(1, is_trivial.call_count)
@@ -0,0 +1,70 @@
+from unittest import TestCase
+
+from bson import ObjectId
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import DATA_PATH
+
+
+class TestMongoIndexes(TestCase):
+    extraction_identifier = ExtractionIdentifier(
+        run_name="mongo_indexes_test", extraction_name="extraction_id", output_path=DATA_PATH
+    )
+
+    def setUp(self):
+        self.persistence_repository = MongoPersistenceRepository()
+        self.persistence_repository.create_indexes()
+
+    def tearDown(self):
+        self.persistence_repository.mongo_db.command("profile", 0)
+        self.persistence_repository.close()
+
+    def get_plans_summaries(self, repository_method) -> list[str]:
+        mongo_db = self.persistence_repository.mongo_db
+        mongo_db.command("profile", 0)
+        mongo_db.drop_collection("system.profile")
+        mongo_db.command("profile", 2)
+        repository_method()
+        mongo_db.command("profile", 0)
+
+        namespaces = [f"{mongo_db.name}.{collection_name}" for collection_name in MongoPersistenceRepository.INDEXES]
+        profiled_operations = mongo_db.system.profile.find({"ns": {"$in": namespaces}, "planSummary": {"$exists": True}})
+        return [profiled_operation["planSummary"] for profiled_operation in profiled_operations]
+
+    def test_indexes_are_created(self):
+        self.assertEqual([], self.persistence_repository.get_missing_indexes())
+
+    def test_repository_methods_use_indexes(self):
+        extraction_identifier = self.extraction_identifier
+        repository = self.persistence_repository
+        object_id = str(ObjectId())
+        repository_methods = {
+            "load_prediction_data": lambda: repository.load_prediction_data(extraction_identifier),
+            "load_prediction_data_until": lambda: repository.load_prediction_data(extraction_identifier, object_id),
+            "load_prediction_data_page": lambda: repository.load_prediction_data_page(
+                extraction_identifier, object_id, object_id, 10
+            ),
+            "count_prediction_data": lambda: repository.count_prediction_data(extraction_identifier, object_id),
+            "load_prediction_data_watermark": lambda: repository.load_prediction_data_watermark(extraction_identifier),
+            "delete_prediction_data_ids": lambda: repository.delete_prediction_data_ids(extraction_identifier, [object_id]),
+            "load_labeled_data": lambda: repository.load_labeled_data(extraction_identifier),
+            "delete_labeled_data": lambda: repository.delete_labeled_data(extraction_identifier),
+            "load_suggestions": lambda: repository.load_suggestions(extraction_identifier),
+            "load_suggestions_page": lambda: repository.load_suggestions_page(extraction_identifier, object_id, 10),
+            "delete_suggestions_until": lambda: repository.delete_suggestions_until(extraction_identifier, object_id),
+            "load_paragraph_extraction_data": lambda: repository.load_paragraph_extraction_data(extraction_identifier),
+            "load_paragraphs_from_languages": lambda: repository.load_paragraphs_from_languages(extraction_identifier),
+            "delete_paragraphs_from_languages": lambda: repository.delete_paragraphs_from_languages(extraction_identifier),
+            "load_extractors_usage_to_remove": lambda: repository.load_extractors_usage_to_remove(0, 10),
+            "delete_extractor_data": lambda: repository.delete_extractor_data(extraction_identifier, object_id),
+            "delete_extractor_usage": lambda: repository.delete_extractor_usage(extraction_identifier, object_id, 0),
+        }
+
+        for method_name, repository_method in repository_methods.items():
+            with self.subTest(method_name):
+                plans_summaries = self.get_plans_summaries(repository_method)
+                self.assertTrue(plans_summaries)
+                for plan_summary in plans_summaries:
+                    self.assertIn("IXSCAN", plan_summary)
+                    self.assertNotIn("COLLSCAN", plan_summary)
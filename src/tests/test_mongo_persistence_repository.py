@@ -0,0 +1,141 @@
+import gc
+from unittest import TestCase
+from unittest.mock import patch
+
+import mongomock
+import pymongo
+from bson import ObjectId
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.SegmentBox import SegmentBox
+
+from adapters.MongoPersistenceRepository import MongoPersistenceRepository
+from config import MONGO_HOST, MONGO_PORT, DATA_PATH
+
+
+class TestMongoPersistenceRepository(TestCase):
+    extraction_identifier = ExtractionIdentifier(run_name="tenant", extraction_name="extraction_id", output_path=DATA_PATH)
+
+    @staticmethod
+    def get_prediction_data(xml_file_name: str) -> PredictionData:
+        return PredictionData(tenant="tenant", id="extraction_id", xml_file_name=xml_file_name)
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_load_only_unprocessed_prediction_data(self):
+        persistence_repository = MongoPersistenceRepository()
+        persistence_repository.save_prediction_data_list(
+            self.extraction_identifier, [self.get_prediction_data("1.xml"), self.get_prediction_data("2.xml")]
+        )
+        other_extraction_identifier = ExtractionIdentifier(run_name="tenant", extraction_name="other", output_path=DATA_PATH)
+        persistence_repository.save_prediction_data(other_extraction_identifier, self.get_prediction_data("other.xml"))
+
+        late_prediction_data_id = ObjectId()
+        watermark = persistence_repository.load_prediction_data_watermark(self.extraction_identifier)
+        persistence_repository.save_prediction_data(self.extraction_identifier, self.get_prediction_data("3.xml"))
+        page = persistence_repository.load_prediction_data_page(self.extraction_identifier, None, watermark, 10)
+        late_prediction_data = persistence_repository.inject_extractor_identifier(
+            self.extraction_identifier, self.get_prediction_data("late.xml").model_dump()
+        )
+        persistence_repository.mongo_db.prediction_data.insert_one({**late_prediction_data, "_id": late_prediction_data_id})
+        persistence_repository.delete_prediction_data_ids(self.extraction_identifier, [x for x, _ in page])
+        unprocessed_prediction_data = persistence_repository.load_prediction_data(self.extraction_identifier)
+
+        self.assertEqual(["1.xml", "2.xml"], [x.xml_file_name for _, x in page])
+        self.assertEqual(["late.xml", "3.xml"], [x.xml_file_name for x in unprocessed_prediction_data])
+        mongo_client = pymongo.MongoClient(f"{MONGO_HOST}:{MONGO_PORT}")
+        self.assertEqual(3, mongo_client.pdf_metadata_extraction.prediction_data.count_documents({}))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_load_empty_prediction_data_watermark(self):
+        persistence_repository = MongoPersistenceRepository()
+        self.assertIsNone(
+            persistence_repository.load_prediction_data_watermark(
+                ExtractionIdentifier(run_name="tenant", extraction_name="empty", output_path=DATA_PATH)
+            )
+        )
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_load_prediction_data_in_pages(self):
+        persistence_repository = MongoPersistenceRepository()
+        persistence_repository.save_prediction_data_list(
+            self.extraction_identifier, [self.get_prediction_data(f"{index}.xml") for index in range(5)]
+        )
+        watermark = persistence_repository.load_prediction_data_watermark(self.extraction_identifier)
+        persistence_repository.save_prediction_data(self.extraction_identifier, self.get_prediction_data("5.xml"))
+
+        pages = list()
+        last_prediction_data_id = None
+        while page := persistence_repository.load_prediction_data_page(
+            self.extraction_identifier, last_prediction_data_id, watermark, 2
+        ):
+            pages.append([prediction_data.xml_file_name for _, prediction_data in page])
+            last_prediction_data_id = page[-1][0]
+
+        self.assertEqual([["0.xml", "1.xml"], ["2.xml", "3.xml"], ["4.xml"]], pages)
+        self.assertEqual(watermark, last_prediction_data_id)
+        self.assertEqual(5, persistence_repository.count_prediction_data(self.extraction_identifier, watermark))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_delete_prediction_data_ids_in_one_bulk_write(self):
+        persistence_repository = MongoPersistenceRepository()
+        persistence_repository.save_prediction_data_list(
+            self.extraction_identifier, [self.get_prediction_data(f"{index}.xml") for index in range(6)]
+        )
+        watermark = persistence_repository.load_prediction_data_watermark(self.extraction_identifier)
+        page = persistence_repository.load_prediction_data_page(self.extraction_identifier, None, watermark, 10)
+
+        with patch("adapters.MongoPersistenceRepository.MONGO_WRITE_BATCH_SIZE", 2):
+            collection_bulk_write = mongomock.collection.Collection.bulk_write
+            with patch.object(
+                mongomock.collection.Collection, "bulk_write", autospec=True, side_effect=collection_bulk_write
+            ) as bulk_write:
+                persistence_repository.delete_prediction_data_ids(self.extraction_identifier, [x for x, _ in page[1:]])
+
+        prediction_data_list = persistence_repository.load_prediction_data(self.extraction_identifier)
+        self.assertEqual(["0.xml"], [x.xml_file_name for x in prediction_data_list])
+        self.assertEqual(1, bulk_write.call_count)
+        self.assertEqual(3, len(bulk_write.call_args.args[1]))
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_load_models_with_nested_segment_boxes(self):
+        persistence_repository = MongoPersistenceRepository()
+        segment_box = SegmentBox(left=1, top=2, width=3, height=4, page_width=5, page_height=6, page_number=7)
+        prediction_data = PredictionData(
+            tenant="tenant", id="extraction_id", xml_file_name="1.xml", page_width=612, xml_segments_boxes=[segment_box]
+        )
+        persistence_repository.save_prediction_data(self.extraction_identifier, prediction_data)
+
+        loaded_prediction_data = persistence_repository.load_prediction_data(self.extraction_identifier)[0]
+
+        self.assertEqual(prediction_data, loaded_prediction_data)
+        self.assertIsInstance(loaded_prediction_data.xml_segments_boxes[0], SegmentBox)
+        self.assertEqual(segment_box.segment_type, loaded_prediction_data.xml_segments_boxes[0].segment_type)
+
+    def test_fetch_documents_before_pausing_garbage_collection(self):
+        garbage_collection_enabled = list()
+
+        def get_documents():
+            for index in range(2):
+                garbage_collection_enabled.append(gc.isenabled())
+                yield {"_id": ObjectId(), "tenant": "tenant", "id": "extraction_id", "xml_file_name": f"{index}.xml"}
+
+        prediction_data_list = MongoPersistenceRepository.build_models_with_ids(PredictionData, get_documents())
+
+        self.assertEqual([True, True], garbage_collection_enabled)
+        self.assertEqual(["0.xml", "1.xml"], [x.xml_file_name for _, x in prediction_data_list])
+        self.assertTrue(gc.isenabled())
+
+    @mongomock.patch(servers=["mongodb://127.0.0.1:29017"])
+    def test_save_paragraphs_from_languages_in_bulk(self):
+        persistence_repository = MongoPersistenceRepository()
+        paragraphs_from_languages = [
+            ParagraphsFromLanguage(language=language, paragraphs=[], is_main_language=language == "en")
+            for language in ["en", "fr", "es"]
+        ]
+
+        persistence_repository.save_paragraphs_from_languages(self.extraction_identifier, paragraphs_from_languages)
+        loaded_paragraphs_from_languages = persistence_repository.load_paragraphs_from_languages(self.extraction_identifier)
+
+        self.assertEqual(["en", "fr", "es"], [x.language for x in loaded_paragraphs_from_languages])
+        self.assertEqual([True, False, False], [x.is_main_language for x in loaded_paragraphs_from_languages])
@@ -0,0 +1,132 @@
+import os
+import shutil
+from os.path import join, dirname
+from unittest import TestCase
+from unittest.mock import patch
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.SegmentationData import SegmentationData
+
+from config import APP_PATH, DATA_PATH, PDF_DATA_CACHE_PATH
+from domain.ParagraphExtractionData import XmlSegments
+from use_cases.CompressedXml import CompressedXml
+from use_cases.DocumentsParser import DocumentsParser
+from use_cases.Extractor import Extractor
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlStore import XmlStore
+
+
+class TestPdfDataCache(TestCase):
+    def setUp(self):
+        self.extraction_identifier = ExtractionIdentifier(
+            run_name="tenant_cache", extraction_name="extraction_id", output_path=DATA_PATH
+        )
+        self.xml_file = XmlFile(extraction_identifier=self.extraction_identifier, to_train=False, xml_file_name="test.xml")
+        os.makedirs(self.xml_file.xml_folder_path, exist_ok=True)
+        shutil.copyfile(join(APP_PATH, "tests", "resources", "test_en.xml"), self.xml_file.xml_file_path)
+        self.segmentation_data = SegmentationData(
+            page_width=0, page_height=0, xml_segments_boxes=[], label_segments_boxes=[]
+        )
+
+    def tearDown(self):
+        shutil.rmtree(join(DATA_PATH, "tenant_cache"), ignore_errors=True)
+        shutil.rmtree(dirname(PDF_DATA_CACHE_PATH), ignore_errors=True)
+
+    def test_parse_once_and_load_from_cache(self):
+        cache_key = PdfDataCache.get_key(self.xml_file, self.segmentation_data)
+        if os.path.exists(PdfDataCache.disk_cache.get_cache_path(cache_key)):
+            os.remove(PdfDataCache.disk_cache.get_cache_path(cache_key))
+        PdfDataCache.memory_cache.clear()
+        PdfDataCache.memory_cache_bytes = 0
+        statistics = dict(PdfDataCache.statistics)
+
+        parsed_pdf_data = PdfDataCache.from_xml_file(self.xml_file, self.segmentation_data)
+        memory_pdf_data = PdfDataCache.from_xml_file(self.xml_file, self.segmentation_data)
+        PdfDataCache.memory_cache.clear()
+        PdfDataCache.memory_cache_bytes = 0
+        disk_pdf_data = PdfDataCache.from_xml_file(self.xml_file, self.segmentation_data)
+
+        self.assertEqual(statistics["misses"] + 1, PdfDataCache.statistics["misses"])
+        self.assertEqual(statistics["memory_hits"] + 1, PdfDataCache.statistics["memory_hits"])
+        self.assertEqual(statistics["disk_hits"] + 1, PdfDataCache.statistics["disk_hits"])
+        self.assertIsNot(parsed_pdf_data, memory_pdf_data)
+        self.assertEqual(len(parsed_pdf_data.pdf_data_segments), len(memory_pdf_data.pdf_data_segments))
+        self.assertEqual(len(parsed_pdf_data.pdf_data_segments), len(disk_pdf_data.pdf_data_segments))
+
+    def test_different_pages_use_different_cache_entries(self):
+        first_page_key = PdfDataCache.get_key(self.xml_file, self.segmentation_data, [1])
+        all_pages_key = PdfDataCache.get_key(self.xml_file, self.segmentation_data)
+
+        self.assertNotEqual(first_page_key, all_pages_key)
+
+    def test_read_each_document_once_to_hash_it(self):
+        XmlStore.content_hashes.clear()
+        extractor = Extractor(self.extraction_identifier, persistence_repository=None)
+        prediction_data = PredictionData(xml_file_name="test.xml")
+
+        with patch.object(CompressedXml, "open", wraps=CompressedXml.open) as open_xml:
+            self.assertFalse(extractor.is_trivial(prediction_data))
+            first_key = PdfDataCache.get_key(self.xml_file, self.segmentation_data)
+            self.assertEqual(first_key, PdfDataCache.get_key(self.xml_file, self.segmentation_data))
+            self.assertEqual(1, open_xml.call_count)
+
+            with open(self.xml_file.xml_file_path, "ab") as stream:
+                stream.write(b"\n")
+            self.assertNotEqual(first_key, PdfDataCache.get_key(self.xml_file, self.segmentation_data))
+            self.assertEqual(2, open_xml.call_count)
+
+    @patch("use_cases.DocumentsParser.PARSE_SERIAL_THRESHOLD", 0)
+    @patch.object(DocumentsParser, "workers", 2)
+    def test_parse_documents_in_parallel_keeps_order(self):
+        parse_arguments_list = list()
+        for index in range(6):
+            xml_file = XmlFile(
+                extraction_identifier=self.extraction_identifier, to_train=False, xml_file_name=f"test_{index}.xml"
+            )
+            resource_name = "test_en.xml" if index % 2 else "test_fr.xml"
+            shutil.copyfile(join(APP_PATH, "tests", "resources", resource_name), xml_file.xml_file_path)
+            parse_arguments_list.append((xml_file, self.segmentation_data, [index + 1]))
+
+        for parse_arguments in parse_arguments_list:
+            cache_path = PdfDataCache.disk_cache.get_cache_path(PdfDataCache.get_key(*parse_arguments))
+            if os.path.exists(cache_path):
+                os.remove(cache_path)
+        PdfDataCache.memory_cache.clear()
+        PdfDataCache.memory_cache_bytes = 0
+
+        try:
+            parsed_pdf_data_list = DocumentsParser.parse(parse_arguments_list)
+        finally:
+            DocumentsParser.close()
+
+        self.assertEqual(6, len(parsed_pdf_data_list))
+        for parse_arguments, parsed_pdf_data in zip(parse_arguments_list, parsed_pdf_data_list):
+            expected_pdf_data = PdfDataCache.parse(*parse_arguments)
+            self.assertEqual(expected_pdf_data.pdf_data_segments, parsed_pdf_data.pdf_data_segments)
+            self.assertIsNotNone(PdfDataCache.get(PdfDataCache.get_key(*parse_arguments)))
+
+    @patch.object(DocumentsParser, "workers", 2)
+    def test_count_the_statistics_of_paragraphs_parsed_in_parallel(self):
+        xml_files = list()
+        for index in range(2):
+            xml_file = XmlFile(
+                extraction_identifier=self.extraction_identifier, to_train=True, xml_file_name=f"test_{index}.xml"
+            )
+            os.makedirs(xml_file.xml_folder_path, exist_ok=True)
+            shutil.copyfile(join(APP_PATH, "tests", "resources", "test_en.xml"), xml_file.xml_file_path)
+            xml_files.append(xml_file)
+        xmls_segments = [
+            XmlSegments(xml_file_name=f"test_{index}.xml", xml_segments_boxes=[], language="en", is_main_language=True)
+            for index in range(2)
+        ]
+        statistics = dict(PdfDataCache.statistics)
+
+        try:
+            DocumentsParser.parse_paragraphs(xml_files, xmls_segments)
+        finally:
+            DocumentsParser.close()
+
+        requests_count = sum(PdfDataCache.statistics.values()) - sum(statistics.values())
+        self.assertEqual(2, requests_count)
@@ -0,0 +1,40 @@
+import json
+from unittest import TestCase
+from unittest.mock import patch
+
+import fakeredis
+from rsmq import RedisSMQ
+
+from adapters.RedisTaskPublisher import RedisTaskPublisher
+
+QUEUE_NAME = "task_publisher_test"
+
+
+class TestRedisTaskPublisher(TestCase):
+    def setUp(self):
+        self.redis_server = fakeredis.FakeServer()
+        redis_patch = patch("adapters.RedisTaskPublisher.redis.Redis", self.get_redis_client)
+        redis_patch.start()
+        self.addCleanup(redis_patch.stop)
+
+    def get_redis_client(self, *args, **kwargs) -> fakeredis.FakeRedis:
+        return fakeredis.FakeRedis(server=self.redis_server, decode_responses=True)
+
+    def test_send_messages_in_one_pipeline(self):
+        task_publisher = RedisTaskPublisher()
+        task_publisher.send_message(QUEUE_NAME, {"number": 0})
+
+        with patch.object(
+            fakeredis.FakeRedis, "pipeline", autospec=True, side_effect=fakeredis.FakeRedis.pipeline
+        ) as pipeline:
+            task_publisher.send_messages(QUEUE_NAME, [{"number": number} for number in range(1, 4)])
+
+        queue = RedisSMQ(client=self.get_redis_client(), qname=f"{QUEUE_NAME}_tasks", quiet=True)
+        messages = list()
+        while message := queue.popMessage().exceptions(False).execute():
+            messages.append(json.loads(message["message"]))
+
+        self.assertEqual(2, pipeline.call_count)
+        self.assertEqual([{"number": number} for number in range(4)], messages)
+        self.assertEqual(4, queue.getQueueAttributes().execute()["totalsent"])
+        task_publisher.close()
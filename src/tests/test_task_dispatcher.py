@@ -0,0 +1,220 @@
+import json
+import os
+from threading import Thread
+from time import time, sleep
+from types import SimpleNamespace
+from typing import Any
+from unittest import TestCase
+from unittest.mock import patch
+
+import fakeredis
+from rsmq import RedisSMQ
+
+from drivers.queues_processor.TaskDispatcher import TaskDispatcher
+from drivers.queues_processor.TaskWorker import send_partial_result
+
+QUEUE_NAME = "dispatcher_test"
+
+
+def process(message: dict[str, Any]) -> dict[str, Any]:
+    if message.get("crash"):
+        os._exit(1)
+    if message.get("progress"):
+        send_partial_result({"number": message["number"], "success": True, "progress": 0.5})
+    return {"number": message["number"], "success": True}
+
+
+def get_coalescing_key(message: dict[str, Any]) -> tuple[str, ...] | None:
+    return (message["key"],) if "key" in message else None
+
+
+def get_coalesced_result(result: dict[str, Any], message: dict[str, Any]) -> dict[str, Any]:
+    return {**result, "number": message["number"]}
+
+
+def get_error_result(message: dict[str, Any], error_message: str) -> dict[str, Any]:
+    return {"number": message["number"], "success": False, "error_message": error_message}
+
+
+class TestTaskDispatcher(TestCase):
+    def setUp(self):
+        self.redis_server = fakeredis.FakeServer()
+        redis_patch = patch("drivers.queues_processor.TaskDispatcher.redis.Redis", self.get_redis_client)
+        redis_patch.start()
+        self.addCleanup(redis_patch.stop)
+        self.redis_client = self.get_redis_client()
+        self.tasks_queue = self.get_queue(f"{QUEUE_NAME}_tasks")
+        self.results_queue = self.get_queue(f"{QUEUE_NAME}_results")
+        self.progress_queue = self.get_queue(f"{QUEUE_NAME}_progress")
+
+    def get_redis_client(self, *args, **kwargs) -> fakeredis.FakeRedis:
+        return fakeredis.FakeRedis(server=self.redis_server, decode_responses=True)
+
+    def get_queue(self, queue_name: str) -> RedisSMQ:
+        queue = RedisSMQ(client=self.redis_client, qname=queue_name, quiet=True)
+        queue.createQueue().exceptions(False).execute()
+        return queue
+
+    def send_messages(self, messages: list[dict[str, Any]]):
+        for message in messages:
+            self.tasks_queue.sendMessage().message(json.dumps(message)).execute()
+
+    def get_results(self, queue: RedisSMQ = None) -> list[dict[str, Any]]:
+        results = list()
+        while message := (queue or self.results_queue).popMessage().exceptions(False).execute():
+            results.append(json.loads(message["message"]))
+        return results
+
+    def get_queued_messages_count(self) -> int:
+        return self.tasks_queue.getQueueAttributes().execute()["msgs"]
+
+    @staticmethod
+    def record_calls(queue: RedisSMQ, method_name: str, events: list[str], event: str):
+        method = getattr(queue, method_name)
+
+        def recorded_method(*args, **kwargs):
+            events.append(event)
+            return method(*args, **kwargs)
+
+        setattr(queue, method_name, recorded_method)
+
+    def run_until_drained(self, task_dispatcher: TaskDispatcher, results_count: int) -> list[dict[str, Any]]:
+        thread = Thread(target=task_dispatcher.start, args=(process, lambda message: False, get_error_result))
+        thread.start()
+        results = list()
+        start = time()
+        try:
+            while time() - start < 60:
+                results += self.get_results()
+                if len(results) >= results_count and not self.get_queued_messages_count():
+                    break
+                sleep(0.1)
+        finally:
+            task_dispatcher.stop()
+            thread.join()
+
+        return results + self.get_results()
+
+    def test_publish_results_before_deleting_messages_and_drain_the_queue(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 2)
+        events = list()
+        self.record_calls(task_dispatcher.tasks_queues[QUEUE_NAME], "deleteMessage", events, "delete")
+        self.record_calls(task_dispatcher.results_queues[QUEUE_NAME], "sendMessage", events, "result")
+        self.send_messages([{"number": number} for number in range(5)])
+
+        results = self.run_until_drained(task_dispatcher, 5)
+
+        self.assertEqual(list(range(5)), sorted([result["number"] for result in results]))
+        self.assertTrue(all([result["success"] for result in results]))
+        self.assertEqual(["result", "delete"] * 5, events)
+        self.assertEqual(0, self.get_queued_messages_count())
+
+    def test_crashed_worker_sends_error_result_and_is_restarted(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        self.send_messages([{"number": 0, "crash": True}, {"number": 1}])
+
+        results = self.run_until_drained(task_dispatcher, 2)
+
+        results_by_number = {result["number"]: result for result in results}
+        self.assertEqual(2, len(results))
+        self.assertFalse(results_by_number[0]["success"])
+        self.assertIn("stopped unexpectedly", results_by_number[0]["error_message"])
+        self.assertTrue(results_by_number[1]["success"])
+        self.assertEqual(0, self.get_queued_messages_count())
+
+    def test_coalesced_tasks_get_their_own_results_and_are_deleted(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        task_dispatcher.set_coalescing(get_coalescing_key, get_coalesced_result)
+        events = list()
+        self.record_calls(task_dispatcher.tasks_queues[QUEUE_NAME], "deleteMessage", events, "delete")
+        self.record_calls(task_dispatcher.results_queues[QUEUE_NAME], "sendMessage", events, "result")
+        self.send_messages([{"number": 0, "key": "model"}, {"number": 1, "key": "model"}, {"number": 2}])
+
+        results = self.run_until_drained(task_dispatcher, 3)
+
+        self.assertEqual([0, 1, 2], sorted([result["number"] for result in results]))
+        self.assertTrue(all([result["success"] for result in results]))
+        self.assertEqual(3, events.count("delete"))
+        self.assertEqual(2, events.count("result"))
+        self.assertEqual(2, task_dispatcher.metrics["executions"])
+        self.assertEqual(1, task_dispatcher.metrics["coalesced_tasks"])
+        self.assertEqual(0, self.get_queued_messages_count())
+
+    @patch("drivers.queues_processor.TaskDispatcher.TASK_VISIBILITY_TIMEOUT", 1)
+    def test_extend_visibility_of_running_and_pending_tasks(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        self.send_messages([{"number": 0}, {"number": 1}])
+        task_dispatcher.receive_tasks()
+        running_task = task_dispatcher.get_next_tasks()[0]
+        pending_task = task_dispatcher.get_held_tasks()[0]
+        task_dispatcher.workers = [SimpleNamespace(tasks=[running_task])]
+        running_task.visibility_time = pending_task.visibility_time = 0
+
+        sleep(1.2)
+        task_dispatcher.extend_visibility()
+
+        self.assertLess(0, running_task.visibility_time)
+        self.assertLess(0, pending_task.visibility_time)
+        self.assertEqual(2, self.tasks_queue.getQueueAttributes().execute()["hiddenmsgs"])
+
+    @patch("drivers.queues_processor.TaskDispatcher.TASK_VISIBILITY_TIMEOUT", 1)
+    def test_receive_again_expired_pending_tasks_without_duplicating_them(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        self.send_messages([{"number": 0}, {"number": 1}])
+        task_dispatcher.receive_tasks()
+        pending_tasks = task_dispatcher.get_held_tasks()
+        for task in pending_tasks:
+            task.visibility_time = 0
+
+        sleep(1.2)
+        task_dispatcher.receive_tasks()
+
+        self.assertEqual(pending_tasks, task_dispatcher.get_held_tasks())
+        self.assertTrue(all([task.visibility_time for task in pending_tasks]))
+        self.assertEqual(2, task_dispatcher.metrics["tasks"])
+
+    @patch("drivers.queues_processor.TaskDispatcher.TASK_PREFETCH", 2)
+    def test_interactive_tasks_are_received_when_the_batch_lane_is_full(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 2)
+        task_dispatcher.set_task_classes(lambda message: message["task_class"], {"interactive": 1, "batch": 0})
+        self.send_messages([{"number": number, "task_class": "batch"} for number in range(3)])
+        self.send_messages([{"number": 3, "task_class": "interactive"}])
+
+        task_dispatcher.receive_tasks()
+        task_dispatcher.receive_tasks()
+
+        self.assertEqual(
+            [[3]], [[task.message["number"] for task in tasks] for tasks in task_dispatcher.pending_tasks["interactive"]]
+        )
+        self.assertEqual(
+            [[0], [1]], [[task.message["number"] for task in tasks] for tasks in task_dispatcher.pending_tasks["batch"]]
+        )
+        self.assertEqual(3, task_dispatcher.get_next_tasks()[0].message["number"])
+        queue_attributes = self.tasks_queue.getQueueAttributes().execute()
+        self.assertEqual(3, queue_attributes["hiddenmsgs"])
+        self.assertEqual(3, queue_attributes["totalrecv"])
+        next_message = self.tasks_queue.receiveMessage().execute()
+        self.assertEqual(2, json.loads(next_message["message"])["number"])
+        self.assertEqual(1, next_message["rc"])
+
+    def test_send_progress_to_its_own_queue(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        self.send_messages([{"number": 0, "progress": True}])
+
+        results = self.run_until_drained(task_dispatcher, 1)
+
+        self.assertEqual([{"number": 0, "success": True}], results)
+        self.assertEqual([{"number": 0, "success": True, "progress": 0.5}], self.get_results(self.progress_queue))
+
+    @patch("drivers.queues_processor.TaskDispatcher.PROGRESS_QUEUE_MAX_MESSAGES", 2)
+    def test_keep_only_the_latest_progress_messages(self):
+        task_dispatcher = TaskDispatcher("localhost", 6379, [QUEUE_NAME], 1)
+        task = SimpleNamespace(queue_name=QUEUE_NAME, message={"number": 0})
+
+        for progress in [0.25, 0.5, 0.75]:
+            task_dispatcher.send_progress([task], {"number": 0, "progress": progress})
+
+        queue_attributes = ["vt", "delay", "maxsize", "created", "modified", "totalsent"]
+        queue_fields = self.redis_client.hkeys(f"rsmq:{QUEUE_NAME}_progress:Q")
+        self.assertEqual(2, len([field for field in queue_fields if field not in queue_attributes]))
+        self.assertEqual([0.5, 0.75], [result["progress"] for result in self.get_results(self.progress_queue)])
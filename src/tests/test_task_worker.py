@@ -0,0 +1,40 @@
+import os
+from time import time, sleep
+from typing import Any
+from unittest import TestCase
+
+from drivers.queues_processor.TaskWorker import TaskWorker
+from use_cases.DocumentsParser import DocumentsParser
+
+
+def get_process_id(_) -> int:
+    return os.getpid()
+
+
+def get_parse_processes_ids(message: dict[str, Any]) -> dict[str, Any]:
+    DocumentsParser.workers = message["workers"]
+    processes_ids = DocumentsParser.get_executor().map(get_process_id, range(message["workers"] * 4))
+    return {"processes_ids": sorted(set(processes_ids) - {os.getpid()})}
+
+
+def is_alive(process_id: int) -> bool:
+    try:
+        os.kill(process_id, 0)
+    except ProcessLookupError:
+        return False
+    return True
+
+
+class TestTaskWorker(TestCase):
+    def test_stopped_worker_shuts_down_its_parse_processes(self):
+        task_worker = TaskWorker(get_parse_processes_ids)
+        task_worker.connection.send({"workers": 2})
+        _, result, _ = task_worker.receive()
+        task_worker.stop()
+
+        start = time()
+        while any(map(is_alive, result["processes_ids"])) and time() - start < 10:
+            sleep(0.1)
+
+        self.assertLess(0, len(result["processes_ids"]))
+        self.assertFalse(any(map(is_alive, result["processes_ids"])))
@@ -0,0 +1,127 @@
+import os
+import shutil
+from os.path import join, dirname
+from unittest import TestCase
+from unittest.mock import patch
+
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionSample import PredictionSample
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from config import DATA_PATH
+from use_cases.TrainableEntityExtractorCache import TrainableEntityExtractorCache
+
+
+class LazyLoadingExtractor:
+    loads = 0
+
+    def __init__(self, extraction_identifier: ExtractionIdentifier):
+        self.extraction_identifier = extraction_identifier
+        self.model = None
+
+    def predict(self, prediction_samples: list[PredictionSample]) -> list[Suggestion]:
+        if self.model is None:
+            LazyLoadingExtractor.loads += 1
+            self.model = b"0" * 1000
+        return []
+
+
+class TestTrainableEntityExtractorCache(TestCase):
+    def setUp(self):
+        resident_bytes_patch = patch.object(TrainableEntityExtractorCache, "get_resident_bytes", return_value=0)
+        resident_bytes_patch.start()
+        self.addCleanup(resident_bytes_patch.stop)
+        self.extraction_identifiers = [
+            ExtractionIdentifier(run_name="tenant_models_cache", extraction_name=f"extraction_{i}", output_path=DATA_PATH)
+            for i in range(3)
+        ]
+        for extraction_identifier in self.extraction_identifiers:
+            os.makedirs(join(extraction_identifier.get_path(), "xml_to_predict"), exist_ok=True)
+            with open(join(extraction_identifier.get_path(), "model.bin"), "wb") as stream:
+                stream.write(b"0" * 100)
+
+    def tearDown(self):
+        shutil.rmtree(join(DATA_PATH, "tenant_models_cache"), ignore_errors=True)
+
+    def test_get_cached_extractor(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=1000)
+
+        first_extractor = cache.get(self.extraction_identifiers[0])
+        second_extractor = cache.get(self.extraction_identifiers[0])
+
+        self.assertIs(first_extractor, second_extractor)
+        self.assertEqual(1, cache.hits)
+        self.assertEqual(1, cache.misses)
+        self.assertEqual(100, cache.cached_bytes)
+
+    def test_reload_extractor_when_model_changes(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=1000)
+        model_path = join(self.extraction_identifiers[0].get_path(), "model.bin")
+
+        first_extractor = cache.get(self.extraction_identifiers[0])
+        os.utime(model_path, (1, 1))
+        os.utime(self.extraction_identifiers[0].get_path(), (1, 1))
+        second_extractor = cache.get(self.extraction_identifiers[0])
+
+        self.assertIsNot(first_extractor, second_extractor)
+        self.assertEqual(2, cache.misses)
+        self.assertEqual(100, cache.cached_bytes)
+
+    def test_reload_extractor_when_a_nested_model_file_changes(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=1000)
+        nested_model_path = join(self.extraction_identifiers[0].get_path(), "method", "model", "weights.bin")
+        os.makedirs(dirname(nested_model_path), exist_ok=True)
+        with open(nested_model_path, "wb") as stream:
+            stream.write(b"0" * 100)
+
+        first_extractor = cache.get(self.extraction_identifiers[0])
+        os.utime(join(self.extraction_identifiers[0].get_path(), "xml_to_predict"), (1e10, 1e10))
+        second_extractor = cache.get(self.extraction_identifiers[0])
+        os.utime(nested_model_path, (1e10, 1e10))
+        third_extractor = cache.get(self.extraction_identifiers[0])
+
+        self.assertIs(first_extractor, second_extractor)
+        self.assertIsNot(second_extractor, third_extractor)
+        self.assertEqual(2, cache.misses)
+
+    def test_evict_least_recently_used_extractors(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=150)
+
+        cache.get(self.extraction_identifiers[0])
+        cache.get(self.extraction_identifiers[1])
+        self.assertEqual(1, len(cache.trainable_entity_extractors))
+
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=1000)
+        for extraction_identifier in [
+            self.extraction_identifiers[0],
+            self.extraction_identifiers[1],
+            self.extraction_identifiers[0],
+        ]:
+            cache.get(extraction_identifier)
+        cache.get(self.extraction_identifiers[2])
+
+        cached_keys = list(cache.trainable_entity_extractors.keys())
+        self.assertEqual([("tenant_models_cache", "extraction_0"), ("tenant_models_cache", "extraction_2")], cached_keys)
+
+    def test_size_extractors_by_the_loaded_memory_and_keep_the_most_recently_used(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=500)
+
+        with patch.object(TrainableEntityExtractorCache, "get_resident_bytes", side_effect=[0, 1000]):
+            cache.predict(self.extraction_identifiers[0], [])
+        cache.predict(self.extraction_identifiers[0], [])
+
+        self.assertEqual(1000, cache.cached_bytes)
+        self.assertEqual(1, len(cache.trainable_entity_extractors))
+        self.assertEqual(1, cache.hits)
+
+    @patch("use_cases.TrainableEntityExtractorCache.TrainableEntityExtractor", LazyLoadingExtractor)
+    def test_keep_the_models_loaded_by_the_first_prediction(self):
+        cache = TrainableEntityExtractorCache(max_size=2, max_bytes=1000)
+        LazyLoadingExtractor.loads = 0
+
+        for _ in range(3):
+            cache.predict(self.extraction_identifiers[0], [])
+
+        self.assertEqual(1, LazyLoadingExtractor.loads)
+        self.assertEqual(2, cache.hits)
+        self.assertEqual({}, cache.loads_starts)
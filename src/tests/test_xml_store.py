@@ -0,0 +1,33 @@
+import os
+import shutil
+from os.path import join
+from unittest import TestCase
+from unittest.mock import patch
+
+from config import DATA_PATH, XML_STORE_PATH
+from use_cases.XmlStore import XmlStore
+
+
+class TestXmlStore(TestCase):
+    def setUp(self):
+        self.file_path = join(DATA_PATH, "tenant_xml_store", "extraction_id", "xml_to_train", "test.xml")
+        self.temporary_file_path = XmlStore.get_temporary_file_path()
+        with open(self.temporary_file_path, "wb") as stream:
+            stream.write(b"<pages></pages>")
+
+    def tearDown(self):
+        shutil.rmtree(join(DATA_PATH, "tenant_xml_store"), ignore_errors=True)
+        shutil.rmtree(XML_STORE_PATH, ignore_errors=True)
+
+    def test_save_links_the_stored_file(self):
+        XmlStore.save(self.temporary_file_path, "00content_hash", self.file_path)
+
+        self.assertEqual(2, os.stat(self.file_path).st_nlink)
+        self.assertFalse(os.path.exists(self.temporary_file_path))
+
+    def test_fail_when_the_stored_file_is_removed_before_linking_it(self):
+        with patch.object(XmlStore, "link", return_value=False):
+            with self.assertRaises(FileNotFoundError):
+                XmlStore.save(self.temporary_file_path, "00content_hash", self.file_path)
+
+        self.assertFalse(os.path.exists(self.file_path))
@@ -0,0 +1,102 @@
+import copy
+import gzip
+import os
+import shutil
+import tempfile
+import zlib
+from contextlib import contextmanager
+from os.path import join, exists
+from typing import BinaryIO, Iterator
+from xml.etree import ElementTree
+
+import zstandard
+from trainable_entity_extractor.XmlFile import XmlFile
+
+from config import XML_COMPRESSION_LEVEL
+
+
+class IdentityCompressor:
+    @staticmethod
+    def compress(chunk: bytes) -> bytes:
+        return chunk
+
+    @staticmethod
+    def flush() -> bytes:
+        return b""
+
+
+class CompressedXml:
+    GZIP_MAGIC_NUMBER = b"\x1f\x8b"
+    ZSTD_MAGIC_NUMBER = b"\x28\xb5\x2f\xfd"
+    TEMPORARY_FOLDER = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+    @staticmethod
+    def get_encoding(content_start: bytes) -> str:
+        if content_start.startswith(CompressedXml.GZIP_MAGIC_NUMBER):
+            return "gzip"
+
+        if content_start.startswith(CompressedXml.ZSTD_MAGIC_NUMBER):
+            return "zstd"
+
+        return "identity"
+
+    @staticmethod
+    def get_compressor(first_chunk: bytes):
+        if CompressedXml.get_encoding(first_chunk) != "identity":
+            return IdentityCompressor()
+
+        return zlib.compressobj(XML_COMPRESSION_LEVEL, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+
+    @staticmethod
+    def is_compressed(file_path: str) -> bool:
+        with open(file_path, "rb") as stream:
+            return CompressedXml.get_encoding(stream.read(4)) != "identity"
+
+    @staticmethod
+    def open(file_path: str) -> BinaryIO:
+        stream = open(file_path, "rb")
+        encoding = CompressedXml.get_encoding(stream.read(4))
+        stream.seek(0)
+
+        if encoding == "gzip":
+            return gzip.GzipFile(fileobj=stream, mode="rb")
+
+        if encoding == "zstd":
+            return zstandard.ZstdDecompressor().stream_reader(stream, closefd=True)
+
+        return stream
+
+    @staticmethod
+    def has_text(file_path: str) -> bool:
+        try:
+            with CompressedXml.open(file_path) as stream:
+                for _, element in ElementTree.iterparse(stream):
+                    if element.tag == "text" and "".join(element.itertext()).strip():
+                        return True
+                    if element.tag == "page":
+                        element.clear()
+        except (ElementTree.ParseError, OSError, EOFError, zstandard.ZstdError):
+            return True
+
+        return False
+
+    @staticmethod
+    @contextmanager
+    def readable_xml_file(xml_file: XmlFile) -> Iterator[XmlFile]:
+        if not exists(xml_file.xml_file_path) or os.path.isdir(xml_file.xml_file_path):
+            yield xml_file
+            return
+
+        if not CompressedXml.is_compressed(xml_file.xml_file_path):
+            yield xml_file
+            return
+
+        temporary_folder = tempfile.mkdtemp(dir=CompressedXml.TEMPORARY_FOLDER)
+        try:
+            readable_xml_file = copy.copy(xml_file)
+            readable_xml_file.xml_file_path = join(temporary_folder, xml_file.xml_file_name)
+            with CompressedXml.open(xml_file.xml_file_path) as source, open(readable_xml_file.xml_file_path, "wb") as target:
+                shutil.copyfileobj(source, target)
+            yield readable_xml_file
+        finally:
+            shutil.rmtree(temporary_folder, ignore_errors=True)
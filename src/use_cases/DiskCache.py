@@ -0,0 +1,95 @@
+import os
+from os.path import join, dirname
+from uuid import uuid4
+
+import zstandard
+from trainable_entity_extractor.config import config_logger
+
+
+class DiskCache:
+    TEMPORARY_SUFFIX = ".part"
+
+    def __init__(self, path: str, max_bytes: int):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.cache_bytes = None
+
+    def get_cache_path(self, key: str) -> str:
+        return join(self.path, key[:2], key)
+
+    def get(self, key: str) -> bytes | None:
+        cache_path = self.get_cache_path(key)
+        try:
+            with open(cache_path, "rb") as stream:
+                compressed_bytes = stream.read()
+            os.utime(cache_path)
+        except FileNotFoundError:
+            return None
+
+        try:
+            return zstandard.decompress(compressed_bytes)
+        except zstandard.ZstdError:
+            self.remove(key)
+            return None
+
+    def set(self, key: str, data: bytes):
+        cache_path = self.get_cache_path(key)
+        os.makedirs(dirname(cache_path), exist_ok=True)
+        temporary_cache_path = f"{cache_path}.{uuid4().hex}{self.TEMPORARY_SUFFIX}"
+        compressed_bytes = zstandard.compress(data)
+        with open(temporary_cache_path, "wb") as stream:
+            stream.write(compressed_bytes)
+        os.replace(temporary_cache_path, cache_path)
+
+        self.add_cache_bytes(len(compressed_bytes))
+
+    def remove(self, key: str):
+        config_logger.info(f"Removing unreadable cache file {self.get_cache_path(key)}")
+        self.remove_file(self.get_cache_path(key))
+
+    @staticmethod
+    def remove_file(path: str):
+        try:
+            os.remove(path)
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def scan_folder(folder_path: str) -> list[os.DirEntry]:
+        try:
+            return list(os.scandir(folder_path))
+        except (FileNotFoundError, NotADirectoryError):
+            return list()
+
+    def get_cache_files(self) -> list[tuple[os.stat_result, str]]:
+        cache_files = list()
+        for folder in self.scan_folder(self.path):
+            for entry in self.scan_folder(folder.path):
+                if entry.name.endswith(self.TEMPORARY_SUFFIX):
+                    continue
+                try:
+                    cache_files.append((entry.stat(), entry.path))
+                except FileNotFoundError:
+                    pass
+        return cache_files
+
+    def add_cache_bytes(self, added_bytes: int):
+        if self.cache_bytes is None:
+            self.cache_bytes = sum([file_stat.st_size for file_stat, _ in self.get_cache_files()])
+        else:
+            self.cache_bytes += added_bytes
+
+        if self.cache_bytes > self.max_bytes:
+            self.evict()
+
+    def evict(self):
+        cache_files = sorted(self.get_cache_files(), key=lambda x: x[0].st_mtime)
+        cache_bytes = sum([file_stat.st_size for file_stat, _ in cache_files])
+        bytes_to_keep = 0.9 * self.max_bytes
+        for file_stat, path in cache_files:
+            if cache_bytes <= bytes_to_keep:
+                break
+            self.remove_file(path)
+            cache_bytes -= file_stat.st_size
+
+        self.cache_bytes = cache_bytes
@@ -0,0 +1,51 @@
+from concurrent.futures import ProcessPoolExecutor, Future
+from multiprocessing import get_context
+from threading import BoundedSemaphore
+
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+
+from config import PRE_PARSE_WORKERS, PRE_PARSE_MAX_PENDING
+from use_cases.DocumentsParser import DocumentsParser
+from use_cases.Extractor import Extractor
+
+
+def pre_parse(extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]):
+    Extractor(extraction_identifier, None).get_prediction_samples(prediction_data_list)
+
+
+class DocumentPreParser:
+    def __init__(self, workers: int = PRE_PARSE_WORKERS, max_pending: int = PRE_PARSE_MAX_PENDING):
+        self.executor = None
+        if workers:
+            self.executor = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=get_context("spawn"),
+                initializer=DocumentsParser.initialize_worker,
+            )
+        self.pending = BoundedSemaphore(max_pending)
+
+    def pre_parse(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data_list: list[PredictionData]
+    ) -> Future | None:
+        prediction_data_list = [x for x in prediction_data_list if x.xml_file_name]
+        if not self.executor or not prediction_data_list:
+            return None
+
+        if not self.pending.acquire(blocking=False):
+            config_logger.info(f"Pre-parsing queue is full, skipping {extraction_identifier.run_name}")
+            return None
+
+        future = self.executor.submit(pre_parse, extraction_identifier, prediction_data_list)
+        future.add_done_callback(self.pre_parse_done)
+        return future
+
+    def pre_parse_done(self, future: Future):
+        self.pending.release()
+        if not future.cancelled() and future.exception():
+            config_logger.info(f"Pre-parsing error: {future.exception()}")
+
+    def close(self):
+        if self.executor:
+            self.executor.shutdown(wait=False, cancel_futures=True)
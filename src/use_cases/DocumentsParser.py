@@ -0,0 +1,100 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import get_context
+
+from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.PdfData import PdfData
+from trainable_entity_extractor.data.SegmentationData import SegmentationData
+
+from config import PARSE_WORKERS, PARSE_CHUNK_SIZE, PARSE_SERIAL_THRESHOLD
+from domain.ParagraphExtractionData import XmlSegments
+from use_cases.PdfDataCache import PdfDataCache
+
+ParseArguments = tuple[XmlFile, SegmentationData, list[int] | None]
+
+
+def parse(parse_arguments: ParseArguments) -> bytes:
+    return pickle.dumps(PdfDataCache.parse(*parse_arguments), protocol=pickle.HIGHEST_PROTOCOL)
+
+
+def parse_paragraphs(xml_file: XmlFile, xml_segments: XmlSegments) -> ParagraphsFromLanguage:
+    segmentation_data = SegmentationData(
+        page_width=0, page_height=0, xml_segments_boxes=xml_segments.xml_segments_boxes, label_segments_boxes=[]
+    )
+    pdf_data = PdfDataCache.from_xml_file(xml_file, segmentation_data)
+    return ParagraphsFromLanguage(
+        language=xml_segments.language,
+        paragraphs=[ParagraphFeatures.from_pdf_data(pdf_data, x) for x in pdf_data.pdf_data_segments],
+        is_main_language=xml_segments.is_main_language,
+    )
+
+
+def parse_paragraphs_in_worker(
+    xml_file: XmlFile, xml_segments: XmlSegments
+) -> tuple[ParagraphsFromLanguage, dict[str, int]]:
+    statistics = dict(PdfDataCache.statistics)
+    paragraphs_from_language = parse_paragraphs(xml_file, xml_segments)
+    return paragraphs_from_language, {name: PdfDataCache.statistics[name] - count for name, count in statistics.items()}
+
+
+class DocumentsParser:
+    workers = PARSE_WORKERS
+    executor: ProcessPoolExecutor | None = None
+
+    @staticmethod
+    def disable_parallel_parsing():
+        DocumentsParser.workers = 1
+
+    @staticmethod
+    def initialize_worker():
+        DocumentsParser.disable_parallel_parsing()
+        PdfDataCache.memory_cache_max_bytes = 0
+
+    @staticmethod
+    def get_executor() -> ProcessPoolExecutor:
+        if not DocumentsParser.executor:
+            DocumentsParser.executor = ProcessPoolExecutor(
+                max_workers=DocumentsParser.workers,
+                mp_context=get_context("spawn"),
+                initializer=DocumentsParser.initialize_worker,
+            )
+        return DocumentsParser.executor
+
+    @staticmethod
+    def parse(parse_arguments_list: list[ParseArguments]) -> list[PdfData]:
+        keys = [PdfDataCache.get_key(*parse_arguments) for parse_arguments in parse_arguments_list]
+        pdf_data_list = [PdfDataCache.get(key) for key in keys]
+        missing_indexes = [index for index, pdf_data in enumerate(pdf_data_list) if pdf_data is None]
+        PdfDataCache.statistics["misses"] += len(missing_indexes)
+
+        if DocumentsParser.workers < 2 or len(missing_indexes) < PARSE_SERIAL_THRESHOLD:
+            for index in missing_indexes:
+                pdf_data_list[index] = PdfDataCache.parse(*parse_arguments_list[index])
+                PdfDataCache.set(keys[index], pdf_data_list[index])
+            return pdf_data_list
+
+        missing_parse_arguments = [parse_arguments_list[index] for index in missing_indexes]
+        pdf_data_bytes_list = DocumentsParser.get_executor().map(parse, missing_parse_arguments, chunksize=PARSE_CHUNK_SIZE)
+        for index, pdf_data_bytes in zip(missing_indexes, pdf_data_bytes_list):
+            PdfDataCache.set_bytes(keys[index], pdf_data_bytes)
+            pdf_data_list[index] = pickle.loads(pdf_data_bytes)
+
+        return pdf_data_list
+
+    @staticmethod
+    def parse_paragraphs(xml_files: list[XmlFile], xmls_segments: list[XmlSegments]) -> list[ParagraphsFromLanguage]:
+        if DocumentsParser.workers < 2 or len(xml_files) < 2:
+            return [parse_paragraphs(xml_file, xml_segments) for xml_file, xml_segments in zip(xml_files, xmls_segments)]
+
+        results = list(DocumentsParser.get_executor().map(parse_paragraphs_in_worker, xml_files, xmls_segments))
+        for _, statistics in results:
+            PdfDataCache.add_statistics(statistics)
+        return [paragraphs_from_language for paragraphs_from_language, _ in results]
+
+    @staticmethod
+    def close():
+        if DocumentsParser.executor:
+            DocumentsParser.executor.shutdown(cancel_futures=True)
+            DocumentsParser.executor = None
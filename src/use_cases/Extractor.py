@@ -1,10 +1,11 @@
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor, Future
 from os.path import join, exists
 from pathlib import Path
 from time import time
+from typing import Callable
 
-from multilingual_paragraph_extractor.domain.ParagraphFeatures import ParagraphFeatures
 from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
 from multilingual_paragraph_extractor.use_cases.MultilingualParagraphAlignerUseCase import (
     MultilingualParagraphAlignerUseCase,
@@ -12,7 +13,6 @@ from multilingual_paragraph_extractor.use_cases.MultilingualParagraphAlignerUseC
 from trainable_entity_extractor.FilterValidSegmentsPages import FilterValidSegmentsPages
 from trainable_entity_extractor.TrainableEntityExtractor import TrainableEntityExtractor
 from trainable_entity_extractor.XmlFile import XmlFile
-from trainable_entity_extractor.config import config_logger
 from trainable_entity_extractor.data.ExtractionData import ExtractionData
 from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
 from trainable_entity_extractor.data.LabeledData import LabeledData
@@ -25,15 +25,23 @@ from trainable_entity_extractor.data.Suggestion import Suggestion
 from trainable_entity_extractor.data.TrainingSample import TrainingSample
 from trainable_entity_extractor.send_logs import send_logs
 
-from config import DATA_PATH, PARAGRAPH_EXTRACTION_NAME
+from config import DATA_PATH, PARAGRAPH_EXTRACTION_NAME, PREDICTION_BATCH_SIZE
+from domain.ParagraphExtractionData import ParagraphExtractionData
 from domain.ParagraphExtractorTask import ParagraphExtractorTask
 from domain.TrainableEntityExtractionTask import TrainableEntityExtractionTask
 from ports.PersistenceRepository import PersistenceRepository
+from use_cases.DocumentsParser import DocumentsParser, ParseArguments
+from use_cases.ParagraphsCache import ParagraphsCache
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.TrainableEntityExtractorCache import TrainableEntityExtractorCache
+from use_cases.XmlStore import XmlStore
 
 
 class Extractor:
     CREATE_MODEL_TASK_NAME = "create_model"
     SUGGESTIONS_TASK_NAME = "suggestions"
+    trainable_entity_extractor_cache = TrainableEntityExtractorCache()
+    xml_files_remover = ThreadPoolExecutor(max_workers=1, thread_name_prefix="xml_files_remover")
 
     def __init__(
         self,
@@ -48,10 +56,9 @@ class Extractor:
         self.options = options
 
     def get_extraction_data_for_training(self, labeled_data_list: list[LabeledData]) -> ExtractionData:
-        multi_option_samples: list[TrainingSample] = list()
         page_numbers_list = FilterValidSegmentsPages(self.extraction_identifier).for_training(labeled_data_list)
+        parse_arguments_list: list[ParseArguments | None] = list()
         for labeled_data, page_numbers_to_keep in zip(labeled_data_list, page_numbers_list):
-            segmentation_data = SegmentationData.from_labeled_data(labeled_data)
             xml_file = XmlFile(
                 extraction_identifier=self.extraction_identifier,
                 to_train=True,
@@ -59,9 +66,13 @@ class Extractor:
             )
 
             if exists(xml_file.xml_file_path) and not os.path.isdir(xml_file.xml_file_path):
-                pdf_data = PdfData.from_xml_file(xml_file, segmentation_data, page_numbers_to_keep)
+                segmentation_data = SegmentationData.from_labeled_data(labeled_data)
+                parse_arguments_list.append((xml_file, segmentation_data, page_numbers_to_keep))
             else:
-                pdf_data = PdfData.from_texts([""])
+                parse_arguments_list.append(None)
+
+        multi_option_samples: list[TrainingSample] = list()
+        for labeled_data, pdf_data in zip(labeled_data_list, self.parse_documents(parse_arguments_list)):
             sample = TrainingSample(
                 pdf_data=pdf_data, labeled_data=labeled_data, segment_selector_texts=[labeled_data.source_text]
             )
@@ -80,144 +91,205 @@ class Extractor:
         labeled_data_list = self.persistence_repository.load_labeled_data(self.extraction_identifier)
         extraction_data: ExtractionData = self.get_extraction_data_for_training(labeled_data_list)
         send_logs(self.extraction_identifier, f"Set data in {round(time() - start, 2)} seconds")
+        send_logs(self.extraction_identifier, PdfDataCache.get_statistics_message())
         self.delete_training_data()
+        Extractor.trainable_entity_extractor_cache.remove(self.extraction_identifier)
         trainable_entity_extractor = TrainableEntityExtractor(self.extraction_identifier)
         return trainable_entity_extractor.train(extraction_data)
 
-    def get_prediction_samples(self, prediction_data_list: list[PredictionData] = None) -> list[PredictionSample]:
+    def get_prediction_samples(
+        self, prediction_data_list: list[PredictionData] = None, trivial_list: list[bool] = None
+    ) -> list[PredictionSample]:
+        trivial_list = trivial_list or [self.is_trivial(prediction_data) for prediction_data in prediction_data_list]
         filter_valid_pages = FilterValidSegmentsPages(self.extraction_identifier)
         page_numbers_list = filter_valid_pages.for_prediction(prediction_data_list)
-        prediction_samples: list[PredictionSample] = []
-        for prediction_data, page_numbers in zip(prediction_data_list, page_numbers_list):
-            segmentation_data = SegmentationData.from_prediction_data(prediction_data)
-            entity_name = prediction_data.entity_name if prediction_data.entity_name else prediction_data.xml_file_name
-
+        parse_arguments_list: list[ParseArguments | None] = list()
+        for prediction_data, page_numbers, trivial in zip(prediction_data_list, page_numbers_list, trivial_list):
             xml_file = XmlFile(
                 extraction_identifier=self.extraction_identifier,
                 to_train=False,
                 xml_file_name=prediction_data.xml_file_name,
             )
 
-            if exists(xml_file.xml_file_path) and not os.path.isdir(xml_file.xml_file_path):
-                pdf_data = PdfData.from_xml_file(xml_file, segmentation_data, page_numbers)
+            if trivial:
+                parse_arguments_list.append(None)
+            elif exists(xml_file.xml_file_path) and not os.path.isdir(xml_file.xml_file_path):
+                segmentation_data = SegmentationData.from_prediction_data(prediction_data)
+                parse_arguments_list.append((xml_file, segmentation_data, page_numbers))
             else:
-                pdf_data = PdfData.from_texts([""])
+                parse_arguments_list.append(None)
 
+        prediction_samples: list[PredictionSample] = []
+        for prediction_data, pdf_data in zip(prediction_data_list, self.parse_documents(parse_arguments_list)):
+            entity_name = prediction_data.entity_name if prediction_data.entity_name else prediction_data.xml_file_name
             sample = PredictionSample(pdf_data=pdf_data, entity_name=entity_name, source_text=prediction_data.source_text)
             prediction_samples.append(sample)
 
         return prediction_samples
 
+    @staticmethod
+    def parse_documents(parse_arguments_list: list[ParseArguments | None]) -> list[PdfData]:
+        pdf_data_list = DocumentsParser.parse([x for x in parse_arguments_list if x])
+        pdf_data_iterator = iter(pdf_data_list)
+        return [next(pdf_data_iterator) if x else PdfData.from_texts([""]) for x in parse_arguments_list]
+
     def delete_training_data(self):
         training_xml_path = XmlFile(extraction_identifier=self.extraction_identifier, to_train=True).xml_folder_path
         send_logs(self.extraction_identifier, f"Deleting training data in {training_xml_path}")
         shutil.rmtree(training_xml_path, ignore_errors=True)
         self.persistence_repository.delete_labeled_data(self.extraction_identifier)
 
-    def save_suggestions(self, suggestions: list[Suggestion]) -> (bool, str):
+    def save_suggestions(self, suggestions: list[Suggestion], prediction_data_ids: list[str]) -> (bool, str):
         if not suggestions:
             return False, "No data to calculate suggestions"
 
         self.persistence_repository.save_suggestions(self.extraction_identifier, suggestions)
+        self.persistence_repository.delete_prediction_data_ids(self.extraction_identifier, prediction_data_ids)
+        return True, ""
+
+    def remove_xml_files(self, xml_files_names: list[str]):
         xml_folder_path = XmlFile(extraction_identifier=self.extraction_identifier, to_train=False).xml_folder_path
-        for suggestion in suggestions:
-            entity_name = {"entity_name": suggestion.entity_name, "xml_file_name": ""}
-            xml_file_name = {"xml_file_name": suggestion.xml_file_name, "entity_name": ""}
-            self.persistence_repository.delete_prediction_data(self.extraction_identifier, [entity_name, xml_file_name])
-            path = Path(join(xml_folder_path, suggestion.xml_file_name))
+        for xml_file_name in xml_files_names:
+            path = Path(join(xml_folder_path, xml_file_name))
             if not path.is_dir():
                 path.unlink(missing_ok=True)
 
-        return True, ""
+    def is_trivial(self, prediction_data: PredictionData) -> bool:
+        if not prediction_data.xml_file_name:
+            return False
 
-    def get_suggestions(self) -> list[Suggestion]:
-        prediction_data_list = self.persistence_repository.load_prediction_data(self.extraction_identifier)
-        prediction_samples = self.get_prediction_samples(prediction_data_list)
-        trainable_entity_extractor = TrainableEntityExtractor(self.extraction_identifier)
-        return trainable_entity_extractor.predict(prediction_samples)
+        xml_file = XmlFile(
+            extraction_identifier=self.extraction_identifier,
+            to_train=False,
+            xml_file_name=prediction_data.xml_file_name,
+        )
+        if not exists(xml_file.xml_file_path) or os.path.isdir(xml_file.xml_file_path):
+            return False
+
+        return XmlStore.is_trivial(XmlStore.get_content_hash(xml_file.xml_file_path))
+
+    def get_empty_suggestion(self, prediction_data: PredictionData) -> Suggestion:
+        return Suggestion(
+            tenant=self.extraction_identifier.run_name,
+            id=self.extraction_identifier.extraction_name,
+            xml_file_name=prediction_data.xml_file_name,
+            entity_name=prediction_data.entity_name if prediction_data.entity_name else prediction_data.xml_file_name,
+        )
+
+    def calculate_suggestions(self, report_progress: Callable[[int, int], None] = None) -> (bool, str):
+        watermark = self.persistence_repository.load_prediction_data_watermark(self.extraction_identifier)
+        if not watermark:
+            return False, "No data to calculate suggestions"
+
+        total = self.persistence_repository.count_prediction_data(self.extraction_identifier, watermark)
+        send_logs(self.extraction_identifier, f"Predicting {total} unprocessed prediction data")
+        processed = 0
+        last_prediction_data_id = None
+        xml_files_removals: list[Future] = list()
+        suggestions_saved, error_message = True, ""
+        while page := self.persistence_repository.load_prediction_data_page(
+            self.extraction_identifier, last_prediction_data_id, watermark, PREDICTION_BATCH_SIZE
+        ):
+            last_prediction_data_id = page[-1][0]
+            suggestions = self.get_suggestions([prediction_data for _, prediction_data in page])
+            prediction_data_ids = [prediction_data_id for prediction_data_id, _ in page]
+            suggestions_saved, error_message = self.save_suggestions(suggestions, prediction_data_ids)
+            if not suggestions_saved:
+                break
+
+            xml_files_names = [suggestion.xml_file_name for suggestion in suggestions]
+            xml_files_removals.append(Extractor.xml_files_remover.submit(self.remove_xml_files, xml_files_names))
+            processed += len(page)
+            send_logs(self.extraction_identifier, f"Suggestions calculated for {processed} of {total} prediction data")
+            if report_progress and processed < total:
+                report_progress(processed, total)
+
+        for xml_files_removal in xml_files_removals:
+            xml_files_removal.result()
+
+        return suggestions_saved, error_message
+
+    def get_suggestions(self, prediction_data_list: list[PredictionData]) -> list[Suggestion]:
+        trivial_list = [self.is_trivial(prediction_data) for prediction_data in prediction_data_list]
+        suggestions = [self.get_empty_suggestion(x) for x, trivial in zip(prediction_data_list, trivial_list) if trivial]
+        prediction_data_list = [x for x, trivial in zip(prediction_data_list, trivial_list) if not trivial]
+        send_logs(self.extraction_identifier, f"Skipping model for {len(suggestions)} documents without text")
+
+        if not prediction_data_list:
+            return suggestions
+
+        prediction_samples = self.get_prediction_samples(prediction_data_list, [False] * len(prediction_data_list))
+        send_logs(self.extraction_identifier, PdfDataCache.get_statistics_message())
+        return suggestions + self.predict(prediction_samples)
+
+    def predict(self, prediction_samples: list[PredictionSample]) -> list[Suggestion]:
+        suggestions = Extractor.trainable_entity_extractor_cache.predict(self.extraction_identifier, prediction_samples)
+        send_logs(self.extraction_identifier, Extractor.trainable_entity_extractor_cache.get_statistics_message())
+        return suggestions
 
     def save_paragraphs_from_languages(self) -> (bool, str):
         paragraph_extraction_data = self.persistence_repository.load_paragraph_extraction_data(self.extraction_identifier)
         if not paragraph_extraction_data:
             return False, "No data to extract paragraphs"
 
-        paragraphs_from_languages = self.get_paragraphs_from_languages(paragraph_extraction_data)
-
-        aligner_use_case = MultilingualParagraphAlignerUseCase(self.extraction_identifier)
-        aligner_use_case.align_languages(paragraphs_from_languages)
+        cache_key = ParagraphsCache.get_key(self.extraction_identifier, paragraph_extraction_data.xmls_segments)
+        paragraphs_from_languages = ParagraphsCache.get(cache_key)
+        if paragraphs_from_languages:
+            send_logs(self.extraction_identifier, "Paragraphs loaded from the cache")
+        else:
+            paragraphs_from_languages = self.get_paragraphs_from_languages(paragraph_extraction_data)
+            aligner_use_case = MultilingualParagraphAlignerUseCase(self.extraction_identifier)
+            aligner_use_case.align_languages(paragraphs_from_languages)
+            ParagraphsCache.set(cache_key, paragraphs_from_languages)
 
-        for paragraphs_from_language in paragraphs_from_languages:
-            self.persistence_repository.save_paragraphs_from_language(self.extraction_identifier, paragraphs_from_language)
+        self.persistence_repository.save_paragraphs_from_languages(self.extraction_identifier, paragraphs_from_languages)
 
         return True, ""
 
-    def get_paragraphs_from_languages(self, paragraph_extraction_data):
-        paragraphs_from_languages: list[ParagraphsFromLanguage] = list()
-        for xml_segments in paragraph_extraction_data.xmls_segments:
-            segmentation_data = SegmentationData(
-                page_width=0, page_height=0, xml_segments_boxes=xml_segments.xml_segments_boxes, label_segments_boxes=[]
-            )
-            xml_file = XmlFile(
-                extraction_identifier=self.extraction_identifier, to_train=True, xml_file_name=xml_segments.xml_file_name
-            )
-            pdf_data = PdfData.from_xml_file(xml_file, segmentation_data)
-            paragraphs_from_language = ParagraphsFromLanguage(
-                language=xml_segments.language,
-                paragraphs=[ParagraphFeatures.from_pdf_data(pdf_data, x) for x in pdf_data.pdf_data_segments],
-                is_main_language=xml_segments.is_main_language,
-            )
-            paragraphs_from_languages.append(paragraphs_from_language)
-        return paragraphs_from_languages
-
-    @staticmethod
-    def remove_old_models(extractor_identifier: ExtractionIdentifier):
-        if exists(extractor_identifier.get_path()):
-            os.utime(extractor_identifier.get_path())
-
-        for run_name in os.listdir(DATA_PATH):
-            if run_name == "cache":
-                continue
-
-            for extraction_name in os.listdir(join(DATA_PATH, run_name)):
-                extractor_identifier_to_check = ExtractionIdentifier(
-                    run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH
-                )
-                if extractor_identifier_to_check.is_old():
-                    config_logger.info(f"Removing old model folder {extractor_identifier_to_check.get_path()}")
-                    shutil.rmtree(extractor_identifier_to_check.get_path(), ignore_errors=True)
+    def get_paragraphs_from_languages(
+        self, paragraph_extraction_data: ParagraphExtractionData
+    ) -> list[ParagraphsFromLanguage]:
+        xml_files = [
+            XmlFile(extraction_identifier=self.extraction_identifier, to_train=True, xml_file_name=x.xml_file_name)
+            for x in paragraph_extraction_data.xmls_segments
+        ]
+        return DocumentsParser.parse_paragraphs(xml_files, paragraph_extraction_data.xmls_segments)
 
     @staticmethod
     def calculate_task(
-        task: TrainableEntityExtractionTask | ParagraphExtractorTask, persistence_repository: PersistenceRepository
+        task: TrainableEntityExtractionTask | ParagraphExtractorTask,
+        persistence_repository: PersistenceRepository,
+        report_progress: Callable[[int, int], None] = None,
     ) -> (bool, str):
         if task.task == Extractor.CREATE_MODEL_TASK_NAME:
             extractor_identifier = ExtractionIdentifier(
-                run_name=task.tenant, extraction_name=task.extraction_name, metadata=task.metadata, output_path=DATA_PATH
+                run_name=task.tenant, extraction_name=task.params.id, metadata=task.params.metadata, output_path=DATA_PATH
             )
 
-            Extractor.remove_old_models(extractor_identifier)
+            persistence_repository.save_extractor_usage(extractor_identifier)
 
-            if task.xmls.options:
-                options = task.xmls.options
+            if task.params.options:
+                options = task.params.options
             else:
                 options = extractor_identifier.get_options()
 
-            multi_value = task.xmls.multi_value
+            multi_value = task.params.multi_value
             extractor = Extractor(extractor_identifier, persistence_repository, options, multi_value)
             return extractor.create_models()
 
         if task.task == Extractor.SUGGESTIONS_TASK_NAME:
             extractor_identifier = ExtractionIdentifier(
-                run_name=task.tenant, extraction_name=task.extraction_name, metadata=task.metadata, output_path=DATA_PATH
+                run_name=task.tenant, extraction_name=task.params.id, metadata=task.params.metadata, output_path=DATA_PATH
             )
+            persistence_repository.save_extractor_usage(extractor_identifier)
             extractor = Extractor(extractor_identifier, persistence_repository)
-            suggestions = extractor.get_suggestions()
-            return extractor.save_suggestions(suggestions)
+            return extractor.calculate_suggestions(report_progress)
 
         if task.task == PARAGRAPH_EXTRACTION_NAME:
             extractor_identifier = ExtractionIdentifier(
                 run_name=PARAGRAPH_EXTRACTION_NAME, extraction_name=task.key, output_path=DATA_PATH
             )
+            persistence_repository.save_extractor_usage(extractor_identifier)
             extractor = Extractor(extractor_identifier, persistence_repository)
             return extractor.save_paragraphs_from_languages()
 
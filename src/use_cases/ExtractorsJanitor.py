@@ -0,0 +1,132 @@
+import os
+import shutil
+from os.path import join, exists, basename
+from threading import Thread, Event
+from time import time
+from uuid import uuid4
+
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+
+from config import (
+    DATA_PATH,
+    TRASH_PATH,
+    XML_STORE_PATH,
+    MODEL_EXPIRATION_DAYS,
+    JANITOR_INTERVAL_SECONDS,
+    JANITOR_BATCH_SIZE,
+)
+from ports.PersistenceRepository import PersistenceRepository
+from use_cases.XmlStore import XmlStore
+
+
+class ExtractorsJanitor:
+    NOT_EXTRACTORS_FOLDERS = ["cache", basename(XML_STORE_PATH), basename(TRASH_PATH)]
+    XML_FOLDERS = ["xml_to_train", "xml_to_predict"]
+
+    def __init__(self, persistence_repository: PersistenceRepository, batch_size: int = JANITOR_BATCH_SIZE):
+        self.persistence_repository = persistence_repository
+        self.batch_size = batch_size
+        self.stop_event = Event()
+        self.thread = Thread(target=self.run, daemon=True, name="extractors_janitor")
+
+    @staticmethod
+    def move_to_trash(extraction_identifier: ExtractionIdentifier):
+        os.makedirs(TRASH_PATH, exist_ok=True)
+        try:
+            os.rename(extraction_identifier.get_path(), join(TRASH_PATH, uuid4().hex))
+        except FileNotFoundError:
+            pass
+
+    @staticmethod
+    def get_expiration_time() -> float:
+        return time() - MODEL_EXPIRATION_DAYS * 24 * 60 * 60
+
+    @staticmethod
+    def get_last_modification_time(extraction_identifier: ExtractionIdentifier) -> float:
+        extractor_path = extraction_identifier.get_path()
+        last_modification_time = 0
+        for path in [extractor_path] + [join(extractor_path, x) for x in ExtractorsJanitor.XML_FOLDERS]:
+            try:
+                last_modification_time = max(last_modification_time, os.path.getmtime(path))
+            except FileNotFoundError:
+                pass
+        return last_modification_time
+
+    def save_existing_extractors_usage(self):
+        if self.persistence_repository.has_extractors_usage() or not exists(DATA_PATH):
+            return
+
+        for run_name in os.listdir(DATA_PATH):
+            if run_name in self.NOT_EXTRACTORS_FOLDERS or not os.path.isdir(join(DATA_PATH, run_name)):
+                continue
+
+            for extraction_name in os.listdir(join(DATA_PATH, run_name)):
+                extraction_identifier = ExtractionIdentifier(
+                    run_name=run_name, extraction_name=extraction_name, output_path=DATA_PATH
+                )
+                last_used = self.get_last_modification_time(extraction_identifier)
+                self.persistence_repository.save_extractor_usage(extraction_identifier, last_used)
+
+    def remove_extractors(self) -> int:
+        expiration_time = self.get_expiration_time()
+        extractors_usage = self.persistence_repository.load_extractors_usage_to_remove(expiration_time, self.batch_size)
+        for extractor_usage in extractors_usage:
+            extraction_identifier = ExtractionIdentifier(
+                run_name=extractor_usage.run_name, extraction_name=extractor_usage.extraction_name, output_path=DATA_PATH
+            )
+            last_used = max(extractor_usage.last_used, self.get_last_modification_time(extraction_identifier))
+            if last_used < expiration_time:
+                config_logger.info(f"Removing old model folder {extraction_identifier.get_path()}")
+                self.move_to_trash(extraction_identifier)
+                self.persistence_repository.delete_extractor_data(extraction_identifier)
+            else:
+                self.persistence_repository.save_extractor_usage(extraction_identifier, last_used)
+                if extractor_usage.deleted_before:
+                    self.persistence_repository.delete_extractor_data(extraction_identifier, extractor_usage.deleted_before)
+
+            self.persistence_repository.delete_extractor_usage(
+                extraction_identifier, extractor_usage.deleted_before, expiration_time
+            )
+
+        return len(extractors_usage)
+
+    def empty_trash(self) -> int:
+        if not exists(TRASH_PATH):
+            return 0
+
+        removed_folders = 0
+        for entry in os.scandir(TRASH_PATH):
+            if removed_folders == self.batch_size:
+                break
+            shutil.rmtree(entry.path, ignore_errors=True)
+            removed_folders += 1
+
+        return removed_folders
+
+    def clean(self):
+        removed_extractors = self.remove_extractors()
+        removed_folders = self.empty_trash()
+        if removed_extractors or removed_folders:
+            config_logger.info(f"Janitor removed {removed_extractors} extractors and {removed_folders} folders")
+        XmlStore.remove_unreferenced_blobs()
+
+    def run(self):
+        try:
+            self.save_existing_extractors_usage()
+        except Exception:
+            config_logger.error("Error saving the existing extractors usage", exc_info=1)
+
+        while not self.stop_event.is_set():
+            try:
+                self.clean()
+            except Exception:
+                config_logger.error("Error cleaning extractors", exc_info=1)
+            self.stop_event.wait(JANITOR_INTERVAL_SECONDS)
+
+    def start(self):
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        self.thread.join()
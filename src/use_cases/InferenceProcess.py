@@ -0,0 +1,56 @@
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from multiprocessing import get_context
+
+from trainable_entity_extractor.config import config_logger
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionData import PredictionData
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from use_cases.Extractor import Extractor
+
+
+def predict(extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData) -> list[Suggestion]:
+    extractor = Extractor(extraction_identifier, None)
+    trivial = extractor.is_trivial(prediction_data)
+    if trivial:
+        return [extractor.get_empty_suggestion(prediction_data)]
+
+    prediction_samples = extractor.get_prediction_samples([prediction_data], [trivial])
+    return extractor.predict(prediction_samples)
+
+
+class InferenceProcess:
+    def __init__(self):
+        self.executor = self.get_executor()
+        self.extractors_names: set[str] = set()
+
+    @staticmethod
+    def get_executor() -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=1, mp_context=get_context("spawn"))
+
+    async def predict(
+        self, extraction_identifier: ExtractionIdentifier, prediction_data: PredictionData
+    ) -> list[Suggestion]:
+        loop = asyncio.get_running_loop()
+        try:
+            suggestions = await loop.run_in_executor(self.executor, predict, extraction_identifier, prediction_data)
+        except BrokenProcessPool:
+            self.restart()
+            raise
+
+        self.extractors_names.add(f"{extraction_identifier.run_name}/{extraction_identifier.extraction_name}")
+        return suggestions
+
+    def restart(self):
+        config_logger.error(
+            f"Inference process stopped, starting a new one. Dropped {len(self.extractors_names)} loaded models: "
+            f"{sorted(self.extractors_names)}"
+        )
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        self.executor = self.get_executor()
+        self.extractors_names = set()
+
+    def close(self):
+        self.executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,50 @@
+import hashlib
+import json
+import pickle
+
+from multilingual_paragraph_extractor.domain.ParagraphsFromLanguage import ParagraphsFromLanguage
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+
+from config import PARAGRAPHS_CACHE_PATH, PARAGRAPHS_CACHE_MAX_BYTES
+from domain.ParagraphExtractionData import XmlSegments
+from use_cases.DiskCache import DiskCache
+from use_cases.PdfDataCache import PdfDataCache
+from use_cases.XmlStore import XmlStore
+
+
+class ParagraphsCache:
+    disk_cache = DiskCache(PARAGRAPHS_CACHE_PATH, PARAGRAPHS_CACHE_MAX_BYTES)
+
+    @staticmethod
+    def get_key(extraction_identifier: ExtractionIdentifier, xmls_segments: list[XmlSegments]) -> str:
+        key_content = [PdfDataCache.LIBRARY_VERSION]
+        for xml_segments in xmls_segments:
+            xml_file = XmlFile(
+                extraction_identifier=extraction_identifier, to_train=True, xml_file_name=xml_segments.xml_file_name
+            )
+            key_content.append(
+                [
+                    XmlStore.get_content_hash(xml_file.xml_file_path),
+                    [x.model_dump() for x in xml_segments.xml_segments_boxes],
+                    xml_segments.language,
+                    xml_segments.is_main_language,
+                ]
+            )
+        return hashlib.sha256(json.dumps(key_content, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def get(key: str) -> list[ParagraphsFromLanguage] | None:
+        paragraphs_from_languages_bytes = ParagraphsCache.disk_cache.get(key)
+        if paragraphs_from_languages_bytes is None:
+            return None
+
+        try:
+            return pickle.loads(paragraphs_from_languages_bytes)
+        except Exception:
+            ParagraphsCache.disk_cache.remove(key)
+            return None
+
+    @staticmethod
+    def set(key: str, paragraphs_from_languages: list[ParagraphsFromLanguage]):
+        ParagraphsCache.disk_cache.set(key, pickle.dumps(paragraphs_from_languages, protocol=pickle.HIGHEST_PROTOCOL))
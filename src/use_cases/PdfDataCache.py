@@ -0,0 +1,117 @@
+import hashlib
+import json
+import pickle
+from collections import OrderedDict
+from importlib import metadata
+
+from trainable_entity_extractor.XmlFile import XmlFile
+from trainable_entity_extractor.data.PdfData import PdfData
+from trainable_entity_extractor.data.SegmentationData import SegmentationData
+
+from config import PDF_DATA_CACHE_PATH, PDF_DATA_CACHE_MAX_BYTES, PDF_DATA_MEMORY_CACHE_BYTES
+from use_cases.CompressedXml import CompressedXml
+from use_cases.DiskCache import DiskCache
+from use_cases.XmlStore import XmlStore
+
+
+def get_library_version() -> str:
+    try:
+        return metadata.version("trainable_entity_extractor")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+class PdfDataCache:
+    LIBRARY_VERSION = get_library_version()
+    memory_cache: OrderedDict[str, bytes] = OrderedDict()
+    memory_cache_bytes = 0
+    memory_cache_max_bytes = PDF_DATA_MEMORY_CACHE_BYTES
+    disk_cache = DiskCache(PDF_DATA_CACHE_PATH, PDF_DATA_CACHE_MAX_BYTES)
+    statistics = {"memory_hits": 0, "disk_hits": 0, "misses": 0}
+
+    @staticmethod
+    def get_key(xml_file: XmlFile, segmentation_data: SegmentationData, pages_to_keep: list[int] = None) -> str:
+        segmentation_key = [
+            segmentation_data.page_width,
+            segmentation_data.page_height,
+            [x.model_dump() for x in segmentation_data.xml_segments_boxes],
+            [x.model_dump() for x in segmentation_data.label_segments_boxes],
+        ]
+        key_content = [
+            PdfDataCache.LIBRARY_VERSION,
+            XmlStore.get_content_hash(xml_file.xml_file_path),
+            segmentation_key,
+            pages_to_keep,
+        ]
+        return hashlib.sha256(json.dumps(key_content, sort_keys=True, default=str).encode()).hexdigest()
+
+    @staticmethod
+    def from_xml_file(xml_file: XmlFile, segmentation_data: SegmentationData, pages_to_keep: list[int] = None) -> PdfData:
+        key = PdfDataCache.get_key(xml_file, segmentation_data, pages_to_keep)
+        pdf_data = PdfDataCache.get(key)
+        if pdf_data:
+            return pdf_data
+
+        PdfDataCache.statistics["misses"] += 1
+        pdf_data = PdfDataCache.parse(xml_file, segmentation_data, pages_to_keep)
+        PdfDataCache.set(key, pdf_data)
+        return pdf_data
+
+    @staticmethod
+    def parse(xml_file: XmlFile, segmentation_data: SegmentationData, pages_to_keep: list[int] = None) -> PdfData:
+        with CompressedXml.readable_xml_file(xml_file) as readable_xml_file:
+            return PdfData.from_xml_file(readable_xml_file, segmentation_data, pages_to_keep)
+
+    @staticmethod
+    def get(key: str) -> PdfData | None:
+        if key in PdfDataCache.memory_cache:
+            PdfDataCache.memory_cache.move_to_end(key)
+            PdfDataCache.statistics["memory_hits"] += 1
+            return pickle.loads(PdfDataCache.memory_cache[key])
+
+        pdf_data_bytes = PdfDataCache.disk_cache.get(key)
+        if pdf_data_bytes is None:
+            return None
+
+        try:
+            pdf_data = pickle.loads(pdf_data_bytes)
+        except Exception:
+            PdfDataCache.disk_cache.remove(key)
+            return None
+
+        PdfDataCache.statistics["disk_hits"] += 1
+        PdfDataCache.set_in_memory(key, pdf_data_bytes)
+        return pdf_data
+
+    @staticmethod
+    def set(key: str, pdf_data: PdfData):
+        PdfDataCache.set_bytes(key, pickle.dumps(pdf_data, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @staticmethod
+    def set_bytes(key: str, pdf_data_bytes: bytes):
+        PdfDataCache.set_in_memory(key, pdf_data_bytes)
+        PdfDataCache.disk_cache.set(key, pdf_data_bytes)
+
+    @staticmethod
+    def set_in_memory(key: str, pdf_data_bytes: bytes):
+        if len(pdf_data_bytes) > PdfDataCache.memory_cache_max_bytes:
+            return
+
+        PdfDataCache.memory_cache[key] = pdf_data_bytes
+        PdfDataCache.memory_cache_bytes += len(pdf_data_bytes)
+        while PdfDataCache.memory_cache_bytes > PdfDataCache.memory_cache_max_bytes:
+            _, evicted_bytes = PdfDataCache.memory_cache.popitem(last=False)
+            PdfDataCache.memory_cache_bytes -= len(evicted_bytes)
+
+    @staticmethod
+    def add_statistics(statistics: dict[str, int]):
+        for name, count in statistics.items():
+            PdfDataCache.statistics[name] += count
+
+    @staticmethod
+    def get_statistics_message() -> str:
+        statistics = PdfDataCache.statistics
+        return (
+            f"Parsed documents cache: {statistics['memory_hits']} memory hits, "
+            f"{statistics['disk_hits']} disk hits, {statistics['misses']} misses"
+        )
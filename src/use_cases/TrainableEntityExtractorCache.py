@@ -0,0 +1,137 @@
+import os
+from collections import OrderedDict
+from os.path import exists, join
+from time import time
+
+from trainable_entity_extractor.TrainableEntityExtractor import TrainableEntityExtractor
+from trainable_entity_extractor.data.ExtractionIdentifier import ExtractionIdentifier
+from trainable_entity_extractor.data.PredictionSample import PredictionSample
+from trainable_entity_extractor.data.Suggestion import Suggestion
+
+from config import MODEL_CACHE_SIZE, MODEL_CACHE_MAX_BYTES
+
+
+class TrainableEntityExtractorCache:
+    XML_FOLDERS = ["xml_to_train", "xml_to_predict"]
+
+    def __init__(self, max_size: int = MODEL_CACHE_SIZE, max_bytes: int = MODEL_CACHE_MAX_BYTES):
+        self.max_size = max_size
+        self.max_bytes = max_bytes
+        self.trainable_entity_extractors: OrderedDict[tuple[str, str], tuple[float, int, TrainableEntityExtractor]] = (
+            OrderedDict()
+        )
+        self.loads_starts: dict[tuple[str, str], tuple[float, int]] = dict()
+        self.cached_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.last_load_seconds = 0
+        self.last_warm_predict_seconds = 0
+
+    @staticmethod
+    def get_key(extraction_identifier: ExtractionIdentifier) -> tuple[str, str]:
+        return extraction_identifier.run_name, extraction_identifier.extraction_name
+
+    @staticmethod
+    def get_model_modification_time(extraction_identifier: ExtractionIdentifier) -> float:
+        model_path = extraction_identifier.get_path()
+        if not exists(model_path):
+            return 0
+
+        modification_times = list()
+        for folder_path, folders_names, files_names in os.walk(model_path):
+            if folder_path == model_path:
+                folders_names[:] = [x for x in folders_names if x not in TrainableEntityExtractorCache.XML_FOLDERS]
+            modification_times.append(os.stat(folder_path).st_mtime)
+            modification_times += [os.stat(join(folder_path, x)).st_mtime for x in files_names]
+        return max(modification_times)
+
+    @staticmethod
+    def get_model_bytes(extraction_identifier: ExtractionIdentifier) -> int:
+        model_path = extraction_identifier.get_path()
+        if not exists(model_path):
+            return 0
+
+        model_bytes = 0
+        for folder_path, folders_names, files_names in os.walk(model_path):
+            if folder_path == model_path:
+                folders_names[:] = [x for x in folders_names if x not in TrainableEntityExtractorCache.XML_FOLDERS]
+            model_bytes += sum([os.path.getsize(join(folder_path, x)) for x in files_names])
+        return model_bytes
+
+    @staticmethod
+    def get_resident_bytes() -> int:
+        try:
+            with open("/proc/self/statm") as stream:
+                return int(stream.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        except (OSError, ValueError, IndexError):
+            return 0
+
+    def get(self, extraction_identifier: ExtractionIdentifier) -> TrainableEntityExtractor:
+        key = self.get_key(extraction_identifier)
+        modification_time = self.get_model_modification_time(extraction_identifier)
+        if key in self.trainable_entity_extractors:
+            cached_modification_time, _, trainable_entity_extractor = self.trainable_entity_extractors[key]
+            if cached_modification_time == modification_time:
+                self.trainable_entity_extractors.move_to_end(key)
+                self.hits += 1
+                return trainable_entity_extractor
+            self.remove(extraction_identifier)
+
+        self.misses += 1
+        self.loads_starts[key] = (time(), self.get_resident_bytes())
+        trainable_entity_extractor = TrainableEntityExtractor(extraction_identifier)
+        model_bytes = self.get_model_bytes(extraction_identifier)
+        self.trainable_entity_extractors[key] = (modification_time, model_bytes, trainable_entity_extractor)
+        self.cached_bytes += model_bytes
+        self.evict()
+        return trainable_entity_extractor
+
+    def predict(
+        self, extraction_identifier: ExtractionIdentifier, prediction_samples: list[PredictionSample]
+    ) -> list[Suggestion]:
+        key = self.get_key(extraction_identifier)
+        trainable_entity_extractor = self.get(extraction_identifier)
+        start = time()
+        suggestions = trainable_entity_extractor.predict(prediction_samples)
+        if key in self.loads_starts:
+            self.finish_load(key)
+        else:
+            self.last_warm_predict_seconds = time() - start
+        return suggestions
+
+    def finish_load(self, key: tuple[str, str]):
+        load_start, resident_bytes = self.loads_starts.pop(key)
+        self.last_load_seconds = time() - load_start
+        if key not in self.trainable_entity_extractors:
+            return
+
+        modification_time, model_bytes, trainable_entity_extractor = self.trainable_entity_extractors[key]
+        loaded_bytes = max(model_bytes, self.get_resident_bytes() - resident_bytes)
+        self.trainable_entity_extractors[key] = (modification_time, loaded_bytes, trainable_entity_extractor)
+        self.cached_bytes += loaded_bytes - model_bytes
+        self.evict()
+
+    def evict(self):
+        most_recently_used_key = next(reversed(self.trainable_entity_extractors))
+        for key in list(self.trainable_entity_extractors):
+            if self.max_size >= len(self.trainable_entity_extractors) and self.max_bytes >= self.cached_bytes:
+                return
+            if key != most_recently_used_key:
+                _, model_bytes, _ = self.trainable_entity_extractors.pop(key)
+                self.loads_starts.pop(key, None)
+                self.cached_bytes -= model_bytes
+
+    def remove(self, extraction_identifier: ExtractionIdentifier):
+        self.loads_starts.pop(self.get_key(extraction_identifier), None)
+        cached_extractor = self.trainable_entity_extractors.pop(self.get_key(extraction_identifier), None)
+        if cached_extractor:
+            self.cached_bytes -= cached_extractor[1]
+
+    def get_statistics_message(self) -> str:
+        requests_count = self.hits + self.misses
+        hit_rate = round(100 * self.hits / requests_count) if requests_count else 0
+        return (
+            f"Models cache: {hit_rate}% hit rate ({self.hits} hits, {self.misses} misses), "
+            f"{len(self.trainable_entity_extractors)} models, last load and first prediction in "
+            f"{round(self.last_load_seconds, 2)} seconds, last warm prediction in {round(self.last_warm_predict_seconds, 2)} seconds"
+        )
@@ -0,0 +1,46 @@
+import hashlib
+import os
+
+from use_cases.CompressedXml import CompressedXml, IdentityCompressor
+from use_cases.XmlStore import XmlStore
+
+
+class XmlFileWriter:
+    def __init__(self, file_path: str):
+        self.file_path = file_path
+        self.temporary_file_path = XmlStore.get_temporary_file_path()
+        self.stream = open(self.temporary_file_path, "wb")
+        self.compressor = None
+        self.content_hash = hashlib.sha256()
+
+    def write(self, chunk: bytes):
+        if self.compressor is None:
+            self.compressor = CompressedXml.get_compressor(chunk)
+        self.content_hash.update(chunk)
+        self.stream.write(self.compressor.compress(chunk))
+
+    def get_content_hash(self) -> str:
+        if isinstance(self.compressor, IdentityCompressor):
+            return XmlStore.get_content_hash(self.temporary_file_path)
+
+        return self.content_hash.hexdigest()
+
+    def close(self):
+        if self.compressor:
+            self.stream.write(self.compressor.flush())
+
+        self.stream.flush()
+        content_hash = self.get_content_hash()
+        is_new_content = not XmlStore.exists(content_hash)
+        if is_new_content:
+            os.fsync(self.stream.fileno())
+        self.stream.close()
+        XmlStore.save(self.temporary_file_path, content_hash, self.file_path)
+
+        if is_new_content and not CompressedXml.has_text(self.file_path):
+            XmlStore.mark_trivial(content_hash)
+
+    def discard(self):
+        self.stream.close()
+        if os.path.exists(self.temporary_file_path):
+            os.remove(self.temporary_file_path)
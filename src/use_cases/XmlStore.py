@@ -0,0 +1,114 @@
+import hashlib
+import os
+from collections import OrderedDict
+from os.path import join, dirname, basename, exists
+from pathlib import Path
+from time import time
+from uuid import uuid4
+
+from trainable_entity_extractor.config import config_logger
+
+from config import XML_STORE_PATH, XML_STORE_GRACE_SECONDS, XML_CONTENT_HASHES_CACHE_SIZE
+from use_cases.CompressedXml import CompressedXml
+
+
+class XmlStore:
+    TRIVIAL_MARK_EXTENSION = ".trivial"
+    content_hashes: OrderedDict[tuple[int, int, int, int], str] = OrderedDict()
+
+    @staticmethod
+    def get_temporary_file_path() -> str:
+        os.makedirs(XML_STORE_PATH, exist_ok=True)
+        return join(XML_STORE_PATH, f"{uuid4().hex}.part")
+
+    @staticmethod
+    def get_blob_path(content_hash: str) -> str:
+        return join(XML_STORE_PATH, content_hash[:2], content_hash)
+
+    @staticmethod
+    def exists(content_hash: str) -> bool:
+        return exists(XmlStore.get_blob_path(content_hash))
+
+    @staticmethod
+    def get_trivial_mark_path(content_hash: str) -> str:
+        return f"{XmlStore.get_blob_path(content_hash)}{XmlStore.TRIVIAL_MARK_EXTENSION}"
+
+    @staticmethod
+    def mark_trivial(content_hash: str):
+        open(XmlStore.get_trivial_mark_path(content_hash), "w").close()
+
+    @staticmethod
+    def is_trivial(content_hash: str) -> bool:
+        return exists(XmlStore.get_trivial_mark_path(content_hash))
+
+    @staticmethod
+    def get_content_hash(file_path: str) -> str:
+        file_stat = os.stat(file_path)
+        file_identity = (file_stat.st_dev, file_stat.st_ino, file_stat.st_size, file_stat.st_mtime_ns)
+        if file_identity in XmlStore.content_hashes:
+            XmlStore.content_hashes.move_to_end(file_identity)
+            return XmlStore.content_hashes[file_identity]
+
+        content_hash = hashlib.sha256()
+        with CompressedXml.open(file_path) as stream:
+            while chunk := stream.read(1024 * 1024):
+                content_hash.update(chunk)
+
+        XmlStore.content_hashes[file_identity] = content_hash.hexdigest()
+        if len(XmlStore.content_hashes) > XML_CONTENT_HASHES_CACHE_SIZE:
+            XmlStore.content_hashes.popitem(last=False)
+        return XmlStore.content_hashes[file_identity]
+
+    @staticmethod
+    def link(content_hash: str, file_path: str) -> bool:
+        os.makedirs(dirname(file_path), exist_ok=True)
+        temporary_link_path = join(dirname(file_path), f".{basename(file_path)}.{uuid4().hex}.link")
+        try:
+            os.link(XmlStore.get_blob_path(content_hash), temporary_link_path)
+        except FileNotFoundError:
+            return False
+
+        os.replace(temporary_link_path, file_path)
+        if exists(temporary_link_path):
+            os.remove(temporary_link_path)
+        return True
+
+    @staticmethod
+    def save(temporary_file_path: str, content_hash: str, file_path: str):
+        if not XmlStore.link(content_hash, file_path):
+            blob_path = XmlStore.get_blob_path(content_hash)
+            os.makedirs(dirname(blob_path), exist_ok=True)
+            os.chmod(temporary_file_path, 0o444)
+            os.replace(temporary_file_path, blob_path)
+            if not XmlStore.link(content_hash, file_path):
+                raise FileNotFoundError(f"Stored xml file {blob_path} was removed before it was linked to {file_path}")
+
+        if exists(temporary_file_path):
+            os.remove(temporary_file_path)
+
+    @staticmethod
+    def remove_unreferenced_blobs() -> int:
+        if not exists(XML_STORE_PATH):
+            return 0
+
+        removed_blobs = 0
+        oldest_time_to_keep = time() - XML_STORE_GRACE_SECONDS
+        for entry in os.scandir(XML_STORE_PATH):
+            if entry.is_file() and entry.stat().st_mtime < oldest_time_to_keep:
+                os.remove(entry.path)
+                continue
+
+            if not entry.is_dir():
+                continue
+
+            for blob in os.scandir(entry.path):
+                if blob.name.endswith(XmlStore.TRIVIAL_MARK_EXTENSION):
+                    continue
+                blob_stat = blob.stat()
+                if blob_stat.st_nlink == 1 and blob_stat.st_mtime < oldest_time_to_keep:
+                    os.remove(blob.path)
+                    Path(XmlStore.get_trivial_mark_path(blob.name)).unlink(missing_ok=True)
+                    removed_blobs += 1
+
+        config_logger.info(f"Removed {removed_blobs} unreferenced xml files")
+        return removed_blobs